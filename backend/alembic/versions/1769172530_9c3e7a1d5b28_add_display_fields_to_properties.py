@@ -0,0 +1,55 @@
+"""add display fields to properties
+
+Revision ID: 9c3e7a1d5b28
+Revises: 386f6a9dfb1c
+Create Date: 2026-01-23 12:48:50.318245
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e7a1d5b28"
+down_revision: str | Sequence[str] | None = "386f6a9dfb1c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("properties", "properties_archive")
+
+# Same formatting as PropertyParser.format_price_display / format_area_display
+BACKFILL_SQL = """
+UPDATE {table} SET
+    price_display = CASE
+        WHEN price_eur IS NULL THEN price_raw
+        ELSE '€' || replace(to_char(round(price_eur), 'FM999,999,999,990'), ',', '.')
+    END,
+    area_display = CASE
+        WHEN area_sqm IS NOT NULL AND coalesce(area_raw, '') = ''
+            THEN round(area_sqm)::text || ' m²'
+        ELSE area_raw
+    END
+"""
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table, sa.Column("price_display", sa.String(length=255), nullable=True)
+        )
+        op.add_column(
+            table, sa.Column("area_display", sa.String(length=255), nullable=True)
+        )
+        op.execute(BACKFILL_SQL.format(table=table))
+        op.alter_column(table, "price_display", nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "area_display")
+        op.drop_column(table, "price_display")
@@ -0,0 +1,59 @@
+"""add change_seq to properties
+
+Revision ID: 5d81f0b3c6a7
+Revises: 9c3e7a1d5b28
+Create Date: 2026-01-24 12:52:22.407163
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d81f0b3c6a7"
+down_revision: str | Sequence[str] | None = "9c3e7a1d5b28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEQUENCE = "properties_change_seq"
+
+# Archived rows first (their deletions are older), then live rows, each in
+# the order they were last updated
+TABLES = ("properties_archive", "properties")
+
+BACKFILL_SQL = """
+UPDATE {table} SET change_seq = numbered.change_seq
+FROM (
+    SELECT id, nextval('{sequence}') AS change_seq
+    FROM (SELECT id FROM {table} ORDER BY updated_at, id) AS ordered
+) AS numbered
+WHERE {table}.id = numbered.id
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence(SEQUENCE)))
+    for table in TABLES:
+        op.add_column(table, sa.Column("change_seq", sa.BigInteger(), nullable=True))
+        op.execute(BACKFILL_SQL.format(table=table, sequence=SEQUENCE))
+        op.alter_column(table, "change_seq", nullable=False)
+        op.create_index(
+            op.f(f"ix_{table}_change_seq"), table, ["change_seq"], unique=False
+        )
+    op.alter_column(
+        "properties",
+        "change_seq",
+        server_default=sa.text(f"nextval('{SEQUENCE}')"),
+    )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(op.f(f"ix_{table}_change_seq"), table_name=table)
+        op.drop_column(table, "change_seq")
+    op.execute(sa.schema.DropSequence(sa.Sequence(SEQUENCE)))
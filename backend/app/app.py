@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config.settings import Settings
 from app.database.import_sqlalchemy_models import load_all_models
+from app.database.notifications import INotificationListener
+from app.properties.repositories import PROPERTY_CHANGES_CHANNEL
+from app.properties.services import (
+    IPropertyService,
+    ISimilarityService,
+    ISuggestionService,
+)
 from app.routes import api_router
+from app.utils.compression import CompressionMiddleware
 from app.utils.di import get_from_di_container
 from app.utils.exceptions import (
     ConflictException,
@@ -15,11 +26,15 @@ from app.utils.exceptions import (
     InvalidRequestException,
     NotFoundException,
     ServerException,
+    ServiceUnavailableException,
+    TooManyRequestsException,
     UnauthenticatedException,
+    UnprocessableException,
 )
+from app.utils.metrics import MetricsMiddleware, metrics_endpoint
 
 
-def add_exception_handlers(app: FastAPI, settings: Settings) -> None:
+def add_exception_handlers(app: FastAPI, settings: Settings) -> None:  # noqa: C901
     @app.exception_handler(NotFoundException)
     def not_found_exception_handler(
         _request: Request, exc: NotFoundException
@@ -69,6 +84,43 @@ def add_exception_handlers(app: FastAPI, settings: Settings) -> None:
             content={"detail": exc.message, "code": exc.code},
         )
 
+    @app.exception_handler(UnprocessableException)
+    def unprocessable_exception_handler(
+        _request: Request, exc: UnprocessableException
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": exc.message, "code": exc.code},
+        )
+
+    @app.exception_handler(TooManyRequestsException)
+    def too_many_requests_exception_handler(
+        _request: Request, exc: TooManyRequestsException
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": exc.message, "code": exc.code},
+            headers=(
+                {"Retry-After": str(exc.retry_after)}
+                if exc.retry_after is not None
+                else None
+            ),
+        )
+
+    @app.exception_handler(ServiceUnavailableException)
+    def service_unavailable_exception_handler(
+        _request: Request, exc: ServiceUnavailableException
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message, "code": exc.code},
+            headers=(
+                {"Retry-After": str(exc.retry_after)}
+                if exc.retry_after is not None
+                else None
+            ),
+        )
+
     @app.exception_handler(ServerException)
     def server_exception_handler(
         _request: Request, exc: InvalidRequestException
@@ -109,6 +161,12 @@ def add_exception_handlers(app: FastAPI, settings: Settings) -> None:
 
 
 def setup_middleware(app: FastAPI, settings: Settings) -> None:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_credentials=True,
@@ -116,11 +174,42 @@ def setup_middleware(app: FastAPI, settings: Settings) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.METRICS_ENABLED:
+        # Outermost, so latency includes compression and CORS
+        app.add_middleware(MetricsMiddleware)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # every API process keeps its caches fresh by listening for data changes
+    listener = get_from_di_container(INotificationListener)
+    property_service = get_from_di_container(IPropertyService)
+    listener.subscribe(
+        PROPERTY_CHANGES_CHANNEL, property_service.handle_property_change
+    )
+    # ...and rebuilds its search suggestions (first build once connected)
+    suggestion_service = get_from_di_container(ISuggestionService)
+    listener.subscribe(
+        PROPERTY_CHANGES_CHANNEL, suggestion_service.handle_property_change
+    )
+    # ...and reloads similar listings of changed cities
+    similarity_service = get_from_di_container(ISimilarityService)
+    listener.subscribe(
+        PROPERTY_CHANGES_CHANNEL, similarity_service.handle_property_change
+    )
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        suggestion_service.close()
+        similarity_service.close()
 
 
 def setup_app() -> FastAPI:
     app = FastAPI(
         redirect_slashes=False,
+        lifespan=lifespan,
     )
 
     app.include_router(api_router)
@@ -129,6 +218,9 @@ def setup_app() -> FastAPI:
 
     settings = get_from_di_container(Settings)
 
+    if settings.METRICS_ENABLED:
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
     add_exception_handlers(app, settings)
 
     setup_middleware(app, settings)
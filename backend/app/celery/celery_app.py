@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib
+import os
+import time
 from logging import getLogger
 from pathlib import Path
 from typing import Any
@@ -16,6 +18,12 @@ from app.database.import_sqlalchemy_models import load_all_models
 from app.properties.services import estitor_scraper, realitica_scraper  # noqa: F401
 from app.utils.di import add_to_di_container, get_from_di_container
 from app.utils.logging import set_up_logging
+from app.utils.metrics import (
+    CELERY_TASK_DURATION,
+    is_multiprocess,
+    mark_process_dead,
+    start_metrics_server,
+)
 
 logger = getLogger(__name__)
 
@@ -124,6 +132,37 @@ def on_worker_process_init(**_: Any) -> None:
     _wire_di()
 
 
+@signals.worker_ready.connect
+def start_metrics_exporter(**_: Any) -> None:
+    """Serve worker metrics on CELERY_METRICS_PORT (from the main worker process)."""
+    if settings.CELERY_METRICS_PORT is None:
+        return
+    if not is_multiprocess():
+        logger.warning(
+            "PROMETHEUS_MULTIPROC_DIR is not set, metrics of pool processes "
+            "won't be exported"
+        )
+    start_metrics_server(settings.CELERY_METRICS_PORT)
+
+
+# Start times of running tasks in this process, by task ID
+_task_started_at: dict[str, float] = {}
+
+
+@signals.task_prerun.connect
+def on_task_prerun(task_id: str, **_: Any) -> None:
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@signals.task_postrun.connect
+def on_task_postrun(task_id: str, task: Task, state: str | None, **_: Any) -> None:
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        CELERY_TASK_DURATION.labels(task=task.name, state=state or "UNKNOWN").observe(
+            time.perf_counter() - started_at
+        )
+
+
 @signals.worker_process_shutdown.connect
 def on_worker_shutdown(**_: Any) -> None:
     """Cleanup browser pool when worker shuts down."""
@@ -137,6 +176,8 @@ def on_worker_shutdown(**_: Any) -> None:
     except Exception:
         logger.exception("Error closing browser pool")
 
+    mark_process_dead(os.getpid())
+
 
 @signals.setup_logging.connect
 def configure_logging(**_kwargs: Any) -> None:
@@ -27,3 +27,87 @@ class Settings(DBSettings):
     BROWSER_POOL_SIZE: int = 3
     BROWSER_POOL_TIMEOUT: int = 30  # seconds
     BROWSER_HEADLESS: bool = True
+
+    # Query cost guard (PostgreSQL planner cost units, disabled when None)
+    # - QUERY_COST_LIMIT: reject list queries estimated above it
+    # - QUERY_COUNT_COST_LIMIT: above it, use the planner's row estimate as total count
+    QUERY_COST_LIMIT: float | None = None
+    QUERY_COUNT_COST_LIMIT: float | None = None
+
+    # Admission control of DB-bound routes, per API process: at most
+    # *_CONCURRENCY requests of a route class run at once, up to *_QUEUE more
+    # wait (at most ADMISSION_MAX_WAIT seconds), others get 503 + Retry-After.
+    # Light routes (cities, platforms, single listings) have their own capacity
+    # so searches and exports can't starve them
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_LIGHT_CONCURRENCY: int = 16
+    ADMISSION_LIGHT_QUEUE: int = 64
+    ADMISSION_HEAVY_CONCURRENCY: int = 8
+    ADMISSION_HEAVY_QUEUE: int = 16
+    ADMISSION_MAX_WAIT: float = 5.0  # seconds
+
+    # Cold storage for soft-deleted listings
+    ARCHIVE_DELETED_AFTER_DAYS: int = 30
+    ARCHIVE_BATCH_SIZE: int = 1000
+
+    # In-process query result cache
+    PROPERTY_CACHE_MAX_ENTRIES: int = 1024
+    PROPERTY_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    PROPERTY_CACHE_TTL: int = 300  # seconds
+
+    # Shared (Redis) response cache, disabled when CACHE_REDIS_URL is None
+    CACHE_REDIS_URL: str | None = None
+    CACHE_SOCKET_TIMEOUT: float = 0.5  # seconds
+    CACHE_LOCK_TIMEOUT: int = 10  # seconds, max wait for another worker's result
+    CACHE_LIST_TTL: int = 120  # seconds
+    CACHE_CITIES_TTL: int = 3600  # seconds
+    CACHE_PROPERTY_TTL: int = 600  # seconds
+    CACHE_DISTRIBUTION_TTL: int = 600  # seconds
+
+    # Response compression (zstd when available, gzip otherwise)
+    COMPRESSION_MINIMUM_SIZE: int = (
+        1024  # bytes, smaller single-chunk bodies are sent as is
+    )
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Background export jobs (POST /properties/exports), files are written to
+    # EXPORT_JOBS_DIR, which API and Celery workers must share
+    EXPORT_JOBS_REDIS_URL: str = "redis://localhost:6379/0"
+    EXPORT_JOBS_DIR: str = "exports"
+    EXPORT_JOB_DEFAULT_MAX_ROWS: int = 200_000
+    EXPORT_JOB_MAX_ROWS: int = 2_000_000  # upper bound for a job's maxRows
+    EXPORT_JOB_TTL: int = 24 * 60 * 60  # seconds, jobs and files are kept this long
+
+    # Search suggestions (GET /properties/suggest), an in-memory index per API
+    # process rebuilt SUGGEST_REBUILD_DELAY seconds after data changes
+    SUGGEST_REBUILD_DELAY: float = 30.0
+    SUGGEST_MIN_TITLE_COUNT: int = 3  # listings a title phrase must appear in
+    SUGGEST_MAX_TITLE_PHRASES: int = 20_000
+
+    # Similar listings (GET /properties/{id}/similar), in-memory feature vectors
+    # per API process, cities are reloaded SIMILAR_REBUILD_DELAY seconds after
+    # their listings change
+    SIMILAR_REBUILD_DELAY: float = 30.0
+
+    # Price/area histograms (GET /properties/distribution), bins per histogram
+    # unless the request asks for another number
+    DISTRIBUTION_DEFAULT_BINS: int = 20
+
+    # Saved-search alerts: listings matching a saved search when scraped are
+    # queued and POSTed to its webhook by a task running every minute, up to
+    # SAVED_SEARCH_DELIVERY_BATCH listings per request
+    SAVED_SEARCH_DELIVERY_BATCH: int = 100
+    SAVED_SEARCH_WEBHOOK_TIMEOUT: float = 10.0  # seconds
+    SAVED_SEARCH_MAX_ATTEMPTS: int = 5  # failed deliveries before a match is dropped
+    SAVED_SEARCH_RETRY_DELAY: int = 60  # seconds before a failed delivery is retried
+    # Seconds a delivery run holds the matches it's sending, after that (e.g. the
+    # worker died) another run picks them up
+    SAVED_SEARCH_CLAIM_TIMEOUT: int = 30 * 60
+
+    # Prometheus metrics, served on /metrics by the API and on CELERY_METRICS_PORT
+    # by Celery workers (disabled when None). Processes sharing an endpoint
+    # (gunicorn workers, the prefork pool) also need the PROMETHEUS_MULTIPROC_DIR
+    # environment variable, pointing to an empty directory
+    METRICS_ENABLED: bool = True
+    CELERY_METRICS_PORT: int | None = None
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from app.utils.exceptions import TooManyRequestsException, UnprocessableException
+
+
+class QueryTimeoutException(TooManyRequestsException):
+    def __init__(self, statement_timeout: int) -> None:
+        super().__init__(
+            message=f"Query exceeded the {statement_timeout} ms time limit. "
+            "Please narrow your filters or try again later.",
+            code="query_timeout",
+            retry_after=max(1, statement_timeout // 1000),
+        )
+
+
+class QueryTooExpensiveException(UnprocessableException):
+    def __init__(self, estimated_cost: float, cost_limit: float) -> None:
+        super().__init__(
+            message=f"Query is too expensive (estimated cost {estimated_cost:,.0f}, "
+            f"limit {cost_limit:,.0f}). Please narrow your filters.",
+            code="query_too_expensive",
+        )
+        self.estimated_cost = estimated_cost
+        self.cost_limit = cost_limit
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.database.session_factory import ISessionFactory
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7_999
+
+# How often the listener checks whether it should stop (seconds)
+POLL_INTERVAL = 1.0
+
+# Reconnect backoff bounds (seconds)
+MIN_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 60.0
+
+# Called with the payload, or None when notifications may have been missed
+NotificationCallback = Callable[[str | None], None]
+
+
+def notify(session: Session, channel: str, payload: str) -> None:
+    """
+    Queue a notification in the session's transaction.
+
+    Postgres delivers it to listeners only when the transaction commits and
+    drops it on rollback, so listeners never see uncommitted changes.
+
+    Args:
+        session: Session whose transaction carries the notification
+        channel: Channel name
+        payload: Notification payload (less than 8000 bytes)
+    """
+    session.execute(select(func.pg_notify(channel, payload)))
+
+
+class INotificationListener(Protocol):
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """Call callback for every notification on channel."""
+        ...
+
+    def start(self) -> None:
+        """Start listening in a background thread."""
+        ...
+
+    def stop(self) -> None:
+        """Stop listening and wait for the background thread."""
+        ...
+
+
+@inject(alias=INotificationListener, singleton=True)
+class NotificationListener(INotificationListener):
+    """
+    Per-process Postgres LISTEN loop running in a daemon thread.
+
+    Holds one dedicated autocommit connection and reconnects with exponential
+    backoff when it is lost. Notifications sent while disconnected are lost, so
+    after every (re)connect callbacks are called with None and must assume
+    anything could have changed.
+    """
+
+    def __init__(self, session_factory: ISessionFactory):
+        self.session_factory = session_factory
+        self._callbacks: defaultdict[str, list[NotificationCallback]] = defaultdict(
+            list
+        )
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reconnect_delay = MIN_RECONNECT_DELAY
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Call callback for every notification on channel.
+
+        Must be called before `start`.
+
+        Args:
+            channel: Channel name
+            callback: Called with the payload, or None after a (re)connect
+        """
+        self._callbacks[channel].append(callback)
+
+    def start(self) -> None:
+        """Start listening in a background thread."""
+        if self._thread is not None or not self._callbacks:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="notification-listener", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Listening for notifications on {', '.join(self._callbacks)}")
+
+    def stop(self) -> None:
+        """Stop listening and wait for the background thread."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout=POLL_INTERVAL * 5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception(
+                    f"Notification listener disconnected, "
+                    f"reconnecting in {self._reconnect_delay:.0f}s"
+                )
+                self._stop_event.wait(self._reconnect_delay)
+                self._reconnect_delay = min(
+                    self._reconnect_delay * 2, MAX_RECONNECT_DELAY
+                )
+
+    def _listen(self) -> None:
+        with self.session_factory.engine.connect() as connection:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            for channel in self._callbacks:
+                # LISTEN doesn't accept bind params, channels are constants
+                connection.exec_driver_sql(f'LISTEN "{channel}"')
+
+            self._reconnect_delay = MIN_RECONNECT_DELAY
+            for channel in self._callbacks:
+                self._dispatch(channel, None)
+
+            driver_connection: Any = connection.connection.driver_connection
+            while not self._stop_event.is_set():
+                for notification in driver_connection.notifies(timeout=POLL_INTERVAL):
+                    self._dispatch(notification.channel, notification.payload)
+
+    def _dispatch(self, channel: str, payload: str | None) -> None:
+        for callback in self._callbacks.get(channel, []):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception(f"Notification callback failed on {channel}")
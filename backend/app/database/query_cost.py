@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+
+@dataclass
+class QueryEstimate:
+    """Planner estimate for a query (top plan node)."""
+
+    total_cost: float
+    plan_rows: int
+
+
+def estimate_query(session: Session, stmt: Select[Any]) -> QueryEstimate:
+    """
+    Ask the PostgreSQL planner for the estimated cost of a query without running it.
+
+    Args:
+        session: Session used to run `EXPLAIN` (same transaction as the query)
+        stmt: Select statement to estimate
+
+    Returns:
+        QueryEstimate with total cost and estimated row count
+    """
+    connection = session.connection()
+    # literal binds so the plan matches the actual values (generic plans ignore selectivity)
+    compiled = stmt.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar_one()[0]["Plan"]
+    return QueryEstimate(
+        total_cost=float(plan["Total Cost"]), plan_rows=int(plan["Plan Rows"])
+    )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Protocol
 
-from sqlalchemy import URL, Engine, create_engine
-from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy import URL, Connection, Engine, create_engine, event, text
+from sqlalchemy.orm import Session, SessionTransaction, scoped_session, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.config.settings import DBSettings
+from app.database.transaction_hooks import register_transaction_hooks
 from app.utils.di import inject
 
 
@@ -23,6 +26,46 @@ def construct_db_url(
     )
 
 
+@dataclass(frozen=True)
+class TransactionOptions:
+    """Settings of transactions begun in the current context (see db_session_handler)."""
+
+    statement_timeout: int | None = None  # milliseconds
+    read_only: bool = False
+
+
+transaction_options: ContextVar[TransactionOptions] = ContextVar(
+    "transaction_options",
+    default=TransactionOptions(),  # noqa: B039 (frozen)
+)
+
+
+def apply_transaction_settings(
+    _session: Session, _transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Apply per-transaction settings requested through `transaction_options`.
+
+    Runs on every `after_begin`, so settings are applied lazily on the first
+    query instead of eagerly opening a connection for every request.
+    """
+    set_transaction_options(connection, transaction_options.get())
+
+
+def set_transaction_options(
+    connection: Connection, options: TransactionOptions
+) -> None:
+    """Apply transaction options at the start of a connection's transaction."""
+    if options.read_only:
+        connection.execute(text("SET TRANSACTION READ ONLY"))
+
+    statement_timeout = options.statement_timeout
+    if statement_timeout is not None:
+        # SET doesn't accept bind params, value is always an int (milliseconds)
+        connection.execute(
+            text(f"SET LOCAL statement_timeout = {int(statement_timeout)}")
+        )
+
+
 class ISessionFactory(Protocol):
     url: URL
     engine: Engine
@@ -30,6 +73,12 @@ class ISessionFactory(Protocol):
     def __call__(self) -> Session:
         """returns Session (connection) objects based on current thread"""
 
+    def has_session(self) -> bool:
+        """whether the current thread has created a Session (since the last remove)"""
+
+    def remove(self) -> None:
+        """closes and discards the current thread's Session, if any"""
+
 
 @inject(alias=ISessionFactory, singleton=True)
 class SessionFactory(ISessionFactory):
@@ -41,10 +90,23 @@ class SessionFactory(ISessionFactory):
             database=settings.POSTGRES_DB,
             port=settings.POSTGRES_PORT,
         )
-        self.engine = create_engine(self.url, poolclass=NullPool)
+        # Connections aren't reused, so resetting them (a ROLLBACK) before they
+        # are closed is a wasted round trip. Sessions end their transactions
+        # explicitly, read-only ones simply close the connection.
+        self.engine = create_engine(
+            self.url, poolclass=NullPool, pool_reset_on_return=None
+        )
 
         session_maker = sessionmaker(bind=self.engine, autoflush=False)
+        event.listen(session_maker, "after_begin", apply_transaction_settings)
+        register_transaction_hooks(session_maker)
         self._session_factory = scoped_session(session_maker)
 
     def __call__(self) -> Session:
         return self._session_factory()
+
+    def has_session(self) -> bool:
+        return self._session_factory.registry.has()
+
+    def remove(self) -> None:
+        self._session_factory.remove()
@@ -5,35 +5,109 @@ import inspect
 import logging
 from collections.abc import Callable, Mapping, Sequence
 from enum import Enum
-from typing import Any
+from typing import Any, overload
 
-from fastapi import APIRouter, params
+from fastapi import APIRouter, Depends, params
+from fastapi.datastructures import Default
 from fastapi.dependencies.utils import get_typed_annotation, get_typed_return_annotation
 from fastapi.routing import APIRoute
 from fastapi.types import DecoratedCallable, IncEx
 from fastapi.utils import generate_unique_id
+from psycopg.errors import QueryCanceled
+from sqlalchemy.exc import DBAPIError
 from starlette.responses import JSONResponse, Response
 from starlette.routing import BaseRoute
 
-from app.database.session_factory import ISessionFactory
+from app.database.exceptions import QueryTimeoutException
+from app.database.session_factory import (
+    ISessionFactory,
+    TransactionOptions,
+    transaction_options,
+)
+from app.utils.admission import RouteClass, admission_dependency
 from app.utils.di import get_from_di_container
 
 logger = logging.getLogger(__name__)
 
 
-def db_session_handler[**P, T](func: Callable[P, T]) -> Callable[P, T]:
+@overload
+def db_session_handler[**P, T](func: Callable[P, T], /) -> Callable[P, T]: ...
+@overload
+def db_session_handler[**P, T](
+    *, statement_timeout: int | None = None, read_only: bool = False
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def db_session_handler[**P, T](
+    func: Callable[P, T] | None = None,
+    /,
+    *,
+    statement_timeout: int | None = None,
+    read_only: bool = False,
+) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Run the decorated function inside a session, committing on success.
+
+    Usage:
+        @db_session_handler
+        @db_session_handler(statement_timeout=5000)  # milliseconds, applied with SET LOCAL
+        @db_session_handler(read_only=True)  # READ ONLY transaction, never committed
+
+    The session is created lazily by the first repository call, functions that
+    never query don't open a connection or end a transaction. Read-only
+    transactions end by closing the connection instead of a COMMIT round trip.
+
+    A statement cancelled by the timeout is raised as QueryTimeoutException.
+    """
+    if func is None:
+        return functools.partial(
+            _db_session_handler,
+            statement_timeout=statement_timeout,
+            read_only=read_only,
+        )
+    return _db_session_handler(
+        func, statement_timeout=statement_timeout, read_only=read_only
+    )
+
+
+def release_session() -> None:
+    """
+    End a read-only function's session before it returns, releasing its connection.
+
+    Call once the data is loaded, before expensive work that doesn't need the
+    database (e.g. serializing a large response). A later query lazily starts
+    a new session. Does nothing outside read-only functions, whose writes must
+    be committed together at the end.
+    """
+    if transaction_options.get().read_only:
+        get_from_di_container(ISessionFactory).remove()
+
+
+def _db_session_handler[**P, T](
+    func: Callable[P, T], statement_timeout: int | None = None, read_only: bool = False
+) -> Callable[P, T]:
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        session = get_from_di_container(ISessionFactory)()
+        session_factory = get_from_di_container(ISessionFactory)
+        token = transaction_options.set(
+            TransactionOptions(statement_timeout=statement_timeout, read_only=read_only)
+        )
         try:
             result = func(*args, **kwargs)
-            session.commit()
+            if session_factory.has_session() and not read_only:
+                session_factory().commit()
             return result
+        except DBAPIError as e:
+            _rollback(session_factory)
+            if statement_timeout is not None and isinstance(e.orig, QueryCanceled):
+                raise QueryTimeoutException(statement_timeout) from e
+            raise
         except:
-            session.rollback()
+            _rollback(session_factory)
             raise
         finally:
-            session.close()
+            transaction_options.reset(token)
+            session_factory.remove()
 
     globalns = getattr(func, "__globals__", {})
     return_annotation = get_typed_return_annotation(func)
@@ -55,6 +129,11 @@ def db_session_handler[**P, T](func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
+def _rollback(session_factory: ISessionFactory) -> None:
+    if session_factory.has_session():
+        session_factory().rollback()
+
+
 def _find_error_handler(
     error_callback: (
         Callable[[Any, Any], Any] | Mapping[type, Callable[[Any, Any], Any]]
@@ -150,13 +229,38 @@ def db_session_handler_with_error_callback(
     return decorator
 
 
+# same defaults as APIRouter's method shortcuts, so router-level defaults still apply
+_DEFAULT_RESPONSE_MODEL: Any = Default(None)
+_DEFAULT_RESPONSE_CLASS: Any = Default(JSONResponse)
+_DEFAULT_UNIQUE_ID: Any = Default(generate_unique_id)
+
+
 # router that wraps every endpoint with db_session_handler
 class DBAPIRouter(APIRouter):
+    def __init__(
+        self,
+        *args: Any,
+        statement_timeout: int | None = None,
+        admission: RouteClass | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            statement_timeout: default statement timeout (ms) for every route,
+                can be overridden per route
+            admission: default route class whose capacity admits requests
+                (see app.utils.admission, None for unlimited), can be
+                overridden per route
+        """
+        super().__init__(*args, **kwargs)
+        self.statement_timeout = statement_timeout
+        self.admission = admission
+
     def api_route(
         self,
         path: str,
         *,
-        response_model: Any = None,
+        response_model: Any = _DEFAULT_RESPONSE_MODEL,
         status_code: int | None = None,
         tags: list[str | Enum] | None = None,
         dependencies: Sequence[params.Depends] | None = None,
@@ -174,12 +278,28 @@ class DBAPIRouter(APIRouter):
         response_model_exclude_defaults: bool = False,
         response_model_exclude_none: bool = False,
         include_in_schema: bool = True,
-        response_class: type[Response] = JSONResponse,
+        response_class: type[Response] = _DEFAULT_RESPONSE_CLASS,
         name: str | None = None,
         callbacks: list[BaseRoute] | None = None,
         openapi_extra: dict[str, Any] | None = None,
-        generate_unique_id_function: Callable[[APIRoute], str] = generate_unique_id,
+        generate_unique_id_function: Callable[[APIRoute], str] = _DEFAULT_UNIQUE_ID,
+        statement_timeout: int | None = None,
+        read_only: bool = False,
+        admission: RouteClass | None = None,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        """
+        Args:
+            statement_timeout: statement timeout (ms), defaults to the router's
+            read_only: run in a READ ONLY transaction that is never committed
+            admission: route class admitting requests, defaults to the router's
+        """
+        route_class = admission if admission is not None else self.admission
+        if route_class is not None:
+            # Awaited before the endpoint takes a threadpool thread
+            dependencies = [
+                Depends(admission_dependency(route_class)),
+                *(dependencies or []),
+            ]
         parent_decorator = super().api_route(
             path,
             response_model=response_model,
@@ -206,8 +326,42 @@ class DBAPIRouter(APIRouter):
             openapi_extra=openapi_extra,
             generate_unique_id_function=generate_unique_id_function,
         )
+        timeout = (
+            statement_timeout
+            if statement_timeout is not None
+            else self.statement_timeout
+        )
 
         def decorator(func: Callable[..., Any]) -> Any:
-            return parent_decorator(db_session_handler(func))
+            return parent_decorator(
+                db_session_handler(statement_timeout=timeout, read_only=read_only)(func)
+            )
 
         return decorator
+
+    # APIRouter's method shortcuts don't forward extra kwargs to api_route, so they are
+    # redefined here to accept the db options (statement_timeout, read_only, admission)
+    def get(
+        self, path: str, **kwargs: Any
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=["GET"], **kwargs)
+
+    def post(
+        self, path: str, **kwargs: Any
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=["POST"], **kwargs)
+
+    def put(
+        self, path: str, **kwargs: Any
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=["PUT"], **kwargs)
+
+    def patch(
+        self, path: str, **kwargs: Any
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=["PATCH"], **kwargs)
+
+    def delete(
+        self, path: str, **kwargs: Any
+    ) -> Callable[[DecoratedCallable], DecoratedCallable]:
+        return self.api_route(path, methods=["DELETE"], **kwargs)
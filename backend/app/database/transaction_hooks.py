@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+_ON_COMMIT_KEY = "on_commit_callbacks"
+
+
+def on_commit(session: Session, callback: Callable[[], Any]) -> None:
+    """
+    Run a callback once the session's current transaction commits.
+
+    Callbacks are discarded if the transaction rolls back. Use this for side
+    effects that must only be visible once data is committed (e.g. cache
+    invalidation), so readers never cache data from an uncommitted transaction.
+    """
+    session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+def _run_on_commit_callbacks(session: Session) -> None:
+    callbacks: list[Callable[[], Any]] = session.info.pop(_ON_COMMIT_KEY, [])
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            # data is already committed, a failing side effect shouldn't fail the request
+            logger.exception(f"On-commit callback {callback!r} failed")
+
+
+def _discard_on_commit_callbacks(session: Session) -> None:
+    session.info.pop(_ON_COMMIT_KEY, None)
+
+
+def register_transaction_hooks(session_maker: sessionmaker[Session]) -> None:
+    """Register session events that drive `on_commit` callbacks."""
+    event.listen(session_maker, "after_commit", _run_on_commit_callbacks)
+    event.listen(session_maker, "after_rollback", _discard_on_commit_callbacks)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from app.utils.exceptions import (
+    ConflictException,
+    InvalidRequestException,
+    ServiceUnavailableException,
+    UnprocessableException,
+)
+
+
+class UnknownFieldException(InvalidRequestException):
+    def __init__(self, field: str, available: list[str]) -> None:
+        super().__init__(
+            message=f"Unknown field '{field}', available: {', '.join(available)}",
+            code="invalid_fields",
+        )
+        self.field = field
+
+
+class ExportTooLargeException(UnprocessableException):
+    def __init__(self, total: int, max_rows: int, max_rows_limit: int) -> None:
+        super().__init__(
+            message=f"Export of {total:,} properties exceeds the job limit of "
+            f"{max_rows:,}. Please refine your filters or raise maxRows "
+            f"(up to {max_rows_limit:,}).",
+            code="export_too_large",
+        )
+        self.total = total
+        self.max_rows = max_rows
+
+
+class InvalidExportLimitException(InvalidRequestException):
+    def __init__(self, max_rows: int, max_rows_limit: int) -> None:
+        super().__init__(
+            message=f"maxRows {max_rows:,} is above the limit of {max_rows_limit:,}",
+            code="invalid_export_limit",
+        )
+
+
+class ExportNotReadyException(ConflictException):
+    def __init__(self, job_id: str, status: str) -> None:
+        super().__init__(
+            message=f"Export {job_id} is {status}, the file isn't available",
+            code="export_not_ready",
+        )
+
+
+class SimilarityIndexNotReadyException(ServiceUnavailableException):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(
+            message="Similar listings are being indexed, please try again shortly",
+            code="similarity_index_not_ready",
+            retry_after=retry_after,
+        )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.utils.metrics import OTHER_LABEL
+
+PROPERTY_ROWS_UPSERTED = Counter(
+    "property_rows_upserted",
+    "Rows inserted or updated by committed bulk upserts",
+)
+
+SAVED_SEARCH_MATCHES_QUEUED = Counter(
+    "saved_search_matches_queued",
+    "Listings queued for delivery to saved searches they matched",
+)
+SAVED_SEARCH_DELIVERIES = Counter(
+    "saved_search_deliveries",
+    "Saved search webhook requests, by outcome (success, failed, rejected host)",
+    ["status"],
+)
+
+# Gauges are summed over the live processes of a worker in multiprocess mode
+BROWSER_POOL_CHECKOUT_WAIT = Histogram(
+    "browser_pool_checkout_wait_seconds",
+    "Time spent waiting for a browser from the pool (including launching one)",
+    buckets=(0.01, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+BROWSER_POOL_WAITING = Gauge(
+    "browser_pool_waiting_checkouts",
+    "Checkouts currently waiting for a browser",
+    multiprocess_mode="livesum",
+)
+BROWSER_POOL_IDLE = Gauge(
+    "browser_pool_idle_browsers",
+    "Browsers in the pool, ready to be checked out",
+    multiprocess_mode="livesum",
+)
+
+SCRAPE_CITY_DURATION = Histogram(
+    "scraper_city_duration_seconds",
+    "Duration of scraping all pages of a city",
+    ["source", "city"],
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+SCRAPE_LISTINGS_PER_PAGE = Histogram(
+    "scraper_listings_per_page",
+    "Listing elements found on a result page",
+    ["source"],
+    buckets=(0, 5, 10, 20, 30, 40, 50, 75, 100),
+)
+
+
+def city_label(city: str, known_cities: dict[str, str]) -> str:
+    """
+    Get the metric label of a city, bounded to the cities a scraper knows.
+
+    Args:
+        city: Display name of the city
+        known_cities: Scraper's cities (see `get_cities`)
+    """
+    return city if city in known_cities else OTHER_LABEL
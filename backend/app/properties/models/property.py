@@ -3,12 +3,17 @@ from __future__ import annotations
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import Index, Numeric, String, Text
+from sqlalchemy import BigInteger, Index, Numeric, Sequence, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base
 from app.database.enum import Enum
 
+# Change sequence of properties and their archived rows, ordering the change
+# feed. Writers take values holding an advisory lock until they commit (see
+# lock_change_seq), so values are assigned in commit order
+PROPERTY_CHANGE_SEQ = Sequence("properties_change_seq", metadata=Base.metadata)
+
 
 class PropertySource(str, enum.Enum):
     """Source of the property listing"""
@@ -73,17 +78,31 @@ class Property(Base):
     rooms_raw: Mapped[str | None] = mapped_column(String(255), nullable=True)
     rooms: Mapped[int | None] = mapped_column(nullable=True)
 
+    # Display values, formatted once at ingest time
+    price_display: Mapped[str] = mapped_column(String(255), nullable=False)
+    area_display: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         nullable=False, default=lambda: datetime.now(timezone.utc), index=True
     )
+    # B-tree, not BRIN: re-scrapes rewrite updated_at of rows all over the table
     updated_at: Mapped[datetime] = mapped_column(
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
+        index=True,
     )
     deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
+    # Position in the change feed, taken again whenever the row's data changes
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=PROPERTY_CHANGE_SEQ.next_value(),
+        index=True,
+    )
+
     # Composite indexes for common query patterns
     __table_args__ = (
         # City-based filtering with price
@@ -92,6 +111,14 @@ class Property(Base):
         Index("ix_properties_city_type", "city", "property_type"),
         # Area and rooms combination (common for filtering)
         Index("ix_properties_area_rooms", "area_sqm", "rooms"),
+        # Time-window filters - created_at follows insertion order, so BRIN stays
+        # tiny compared to a B-tree (the created_at B-tree is kept for sorting)
+        Index(
+            "ix_properties_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         # Full-text search preparation (PostgreSQL supports GIN indexes on text)
         # Note: In production, consider adding GIN index on title and location
     )
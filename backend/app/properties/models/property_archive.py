@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+from app.database.enum import Enum
+from app.properties.models.property import PropertySource, PropertyType
+
+
+class PropertyArchive(Base):
+    """
+    Cold storage for long-deleted property listings.
+
+    Mirrors the `properties` columns (keeping the original ID) so rows can be
+    moved back and forth with set-based INSERT ... SELECT statements. Only the
+    lookup columns used for restores are indexed.
+    """
+
+    __tablename__ = "properties_archive"
+
+    # Original property ID
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+
+    source: Mapped[PropertySource] = mapped_column(Enum(PropertySource), nullable=False)
+    link: Mapped[str] = mapped_column(String(2048), nullable=False, index=True)
+    image_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+
+    city: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    property_type: Mapped[PropertyType | None] = mapped_column(
+        Enum(PropertyType), nullable=True
+    )
+
+    price_raw: Mapped[str] = mapped_column(String(255), nullable=False)
+    price_eur: Mapped[float | None] = mapped_column(
+        Numeric(precision=12, scale=2), nullable=True
+    )
+
+    area_raw: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    area_sqm: Mapped[float | None] = mapped_column(
+        Numeric(precision=10, scale=2), nullable=True
+    )
+
+    rooms_raw: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    rooms: Mapped[int | None] = mapped_column(nullable=True)
+
+    price_display: Mapped[str] = mapped_column(String(255), nullable=False)
+    area_display: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # Change feed position of the row's deletion, indexed for the feed
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self) -> str:
+        return f"<PropertyArchive(id={self.id}, city={self.city}, title={self.title[:30]}...)>"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+
+
+class SavedSearch(Base):
+    """Property filters whose new matching listings are sent to a webhook."""
+
+    __tablename__ = "saved_searches"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # PropertyFilterParams fields (snake_case), None/missing for any value
+    filters: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    # Alerts are POSTed here
+    webhook_url: Mapped[str] = mapped_column(String(2048), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self) -> str:
+        return f"<SavedSearch(id={self.id}, name={self.name})>"
+
+
+class SavedSearchMatch(Base):
+    """
+    Listing that matched a saved search, queued for delivery (outbox).
+
+    Matches are written in the transaction that saved the listings, so they
+    exist exactly when the change does. A listing matching again after a later
+    change is queued again instead of adding a row.
+    """
+
+    __tablename__ = "saved_search_matches"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    saved_search_id: Mapped[int] = mapped_column(
+        ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False
+    )
+    # No foreign key, listings can be moved to the archive
+    property_id: Mapped[int] = mapped_column(nullable=False)
+
+    matched_at: Mapped[datetime] = mapped_column(
+        nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    delivered_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # Failed deliveries, the match is dropped after SAVED_SEARCH_MAX_ATTEMPTS
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Not picked up before this: set while a delivery run is sending the match
+    # and after a failed attempt, None for new matches
+    next_attempt_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("saved_search_id", "property_id"),
+        # The delivery task only reads pending matches
+        Index(
+            "ix_saved_search_matches_pending",
+            "saved_search_id",
+            postgresql_where=text("delivered_at IS NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SavedSearchMatch(saved_search_id={self.saved_search_id}, "
+            f"property_id={self.property_id})>"
+        )
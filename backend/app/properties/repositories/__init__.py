@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+from app.properties.repositories.export_job_repository import (
+    ExportJobRepository,
+    IExportJobRepository,
+)
+from app.properties.repositories.property_archive_repository import (
+    IPropertyArchiveRepository,
+    PropertyArchiveRepository,
+)
 from app.properties.repositories.property_repository import (
     EXPORT_LIMIT,
+    PROPERTY_CHANGES_CHANNEL,
+    BulkUpsertResult,
     IPropertyRepository,
     PropertyFilters,
     PropertyRepository,
+    notify_property_change,
+)
+from app.properties.repositories.saved_search_repository import (
+    ISavedSearchRepository,
+    SavedSearchRepository,
 )
 
 __all__ = [
     "EXPORT_LIMIT",
+    "PROPERTY_CHANGES_CHANNEL",
+    "BulkUpsertResult",
+    "ExportJobRepository",
+    "IExportJobRepository",
+    "IPropertyArchiveRepository",
     "IPropertyRepository",
+    "ISavedSearchRepository",
+    "PropertyArchiveRepository",
     "PropertyFilters",
     "PropertyRepository",
+    "SavedSearchRepository",
+    "notify_property_change",
 ]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+from typing import Protocol
+
+import redis
+from redis.client import Pipeline
+
+from app.config.settings import Settings
+from app.properties.schemas import ExportJob, ExportJobStatus
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "export_jobs"
+
+
+class IExportJobRepository(Protocol):
+    def save(self, job: ExportJob) -> None:
+        """Store job state, replacing the previous one."""
+        ...
+
+    def save_if_status(self, job: ExportJob, status: ExportJobStatus) -> bool:
+        """Store job state only if the stored job has the given status."""
+        ...
+
+    def get(self, job_id: str) -> ExportJob | None:
+        """Get job state by ID."""
+        ...
+
+
+@inject(alias=IExportJobRepository, singleton=True)
+class ExportJobRepository(IExportJobRepository):
+    """
+    Export job state in Redis, shared by the API (status) and Celery workers (progress).
+
+    Each job is a single JSON value written only by its current owner: the API
+    while queued, then the worker that takes it over with `save_if_status`
+    (a compare-and-set, so a job delivered to two workers runs once). Jobs
+    expire after EXPORT_JOB_TTL.
+    """
+
+    def __init__(self, settings: Settings):
+        self.ttl = settings.EXPORT_JOB_TTL
+        self._client = redis.Redis.from_url(
+            settings.EXPORT_JOBS_REDIS_URL, decode_responses=True
+        )
+
+    def save(self, job: ExportJob) -> None:
+        """
+        Store job state, replacing the previous one.
+
+        Args:
+            job: Job to store
+        """
+        self._client.set(self._key(job.id), job.model_dump_json(), ex=self.ttl)
+
+    def save_if_status(self, job: ExportJob, status: ExportJobStatus) -> bool:
+        """
+        Store job state only if the stored job has the given status.
+
+        The key is watched while its status is checked, so the check is
+        retried if another client changes the job in between.
+
+        Args:
+            job: Job to store
+            status: Status the stored job must have
+
+        Returns:
+            True if the job was stored, False if it's gone or its status differs
+        """
+
+        key = self._key(job.id)
+        stored = False
+
+        def set_if_status(pipeline: Pipeline) -> None:
+            nonlocal stored
+            data = pipeline.get(key)
+            stored = (
+                data is not None
+                and ExportJob.model_validate_json(data).status == status
+            )
+            if stored:
+                pipeline.multi()
+                pipeline.set(key, job.model_dump_json(), ex=self.ttl)
+
+        self._client.transaction(set_if_status, key)
+        return stored
+
+    def get(self, job_id: str) -> ExportJob | None:
+        """
+        Get job state by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            ExportJob if found (and not expired), None otherwise
+        """
+        data = self._client.get(self._key(job_id))
+        return ExportJob.model_validate_json(data) if data is not None else None
+
+    def _key(self, job_id: str) -> str:
+        return f"{KEY_PREFIX}:{job_id}"
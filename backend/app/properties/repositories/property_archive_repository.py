@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Protocol
+
+from sqlalchemy import ColumnElement, delete, exists, func, null, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database.session_factory import ISessionFactory
+from app.database.transaction_hooks import on_commit
+from app.properties.models.property import PROPERTY_CHANGE_SEQ, Property
+from app.properties.models.property_archive import PropertyArchive
+from app.properties.repositories.property_repository import (
+    lock_change_seq,
+    notify_property_change,
+)
+from app.utils.cache import DataVersion
+from app.utils.di import inject
+from app.utils.shared_cache import ISharedCache
+
+logger = logging.getLogger(__name__)
+
+# Columns shared by `properties` and `properties_archive`
+SHARED_COLUMNS = [
+    column.name
+    for column in PropertyArchive.__table__.columns
+    if column.name in Property.__table__.columns
+]
+
+
+class IPropertyArchiveRepository(Protocol):
+    """Protocol interface for property archive repository."""
+
+    def archive_deleted(self, deleted_before: datetime, batch_size: int) -> int:
+        """Move one batch of rows deleted before a cutoff to the archive. Returns moved count."""
+        ...
+
+    def restore(self, ids: list[int], links: list[str], undelete: bool = False) -> int:
+        """Move archived rows back to properties by ID or link. Returns restored count."""
+        ...
+
+
+@inject(alias=IPropertyArchiveRepository, singleton=False)
+class PropertyArchiveRepository(IPropertyArchiveRepository):
+    """
+    Repository moving soft-deleted listings between `properties` and cold storage.
+
+    Rows are moved with single set-based statements (DELETE ... RETURNING feeding
+    an INSERT ... SELECT), so a batch is never half-moved.
+    """
+
+    def __init__(
+        self,
+        session_factory: ISessionFactory,
+        data_version: DataVersion,
+        shared_cache: ISharedCache,
+    ):
+        self.session_factory = session_factory
+        self.data_version = data_version
+        self.shared_cache = shared_cache
+
+    @property
+    def session(self) -> Session:
+        """Get current session from DI container."""
+        return self.session_factory()
+
+    def archive_deleted(self, deleted_before: datetime, batch_size: int) -> int:
+        """
+        Move one batch of rows deleted before a cutoff to the archive.
+
+        Locked rows are skipped so the task never waits on concurrent upserts.
+        Archived rows take new change_seq values, so the change feed reports
+        their deletion again, also for rows soft-deleted without taking one.
+
+        Args:
+            deleted_before: Archive rows with deleted_at older than this
+            batch_size: Maximum number of rows to move
+
+        Returns:
+            Count of archived rows
+        """
+        batch = (
+            select(Property.id)
+            .where(Property.deleted_at < deleted_before)
+            .order_by(Property.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Property)
+            .where(Property.id.in_(batch.scalar_subquery()))
+            .returning(*(Property.__table__.c[name] for name in SHARED_COLUMNS))
+            .cte("moved")
+        )
+        # Counted from RETURNING, rowcount isn't reported for INSERT ... SELECT
+        stmt = (
+            insert(PropertyArchive)
+            .from_select(
+                [*SHARED_COLUMNS, "archived_at"],
+                select(
+                    *(
+                        (
+                            moved.c[name]
+                            if name != "change_seq"
+                            else PROPERTY_CHANGE_SEQ.next_value()
+                        )
+                        for name in SHARED_COLUMNS
+                    ),
+                    func.now(),
+                ),
+            )
+            .returning(PropertyArchive.id)
+        )
+
+        lock_change_seq(self.session)
+        archived_rows = len(self.session.execute(stmt).all())
+        logger.info(f"Archived {archived_rows} properties")
+        return archived_rows
+
+    def restore(self, ids: list[int], links: list[str], undelete: bool = False) -> int:
+        """
+        Move archived rows back to properties by ID or link.
+
+        Rows whose link was scraped again in the meantime (a live row with the
+        same link exists) are left in the archive, as are older archived rows
+        of a link archived more than once. Undeleted rows take new
+        change_seq values, the change feed reports them as upserts.
+
+        Args:
+            ids: Property IDs to restore
+            links: Property links to restore
+            undelete: Also clear deleted_at so restored rows are visible again
+
+        Returns:
+            Count of restored rows
+        """
+        if not ids and not links:
+            return 0
+
+        conditions: list[ColumnElement[bool]] = []
+        if ids:
+            conditions.append(PropertyArchive.id.in_(ids))
+        if links:
+            conditions.append(PropertyArchive.link.in_(links))
+
+        # Links aren't unique in the archive (a listing scraped again and
+        # archived again), only the newest row of a link can be restored
+        newest = (
+            select(PropertyArchive.id)
+            .where(
+                or_(*conditions),
+                ~exists().where(Property.link == PropertyArchive.link),
+            )
+            .distinct(PropertyArchive.link)
+            .order_by(
+                PropertyArchive.link,
+                PropertyArchive.archived_at.desc(),
+                PropertyArchive.id.desc(),
+            )
+        )
+        restored_cte = (
+            delete(PropertyArchive)
+            .where(PropertyArchive.id.in_(newest))
+            .returning(*(PropertyArchive.__table__.c[name] for name in SHARED_COLUMNS))
+            .cte("restored")
+        )
+        undeleted_values: dict[str, ColumnElement[Any]] = {
+            "deleted_at": null(),
+            "change_seq": PROPERTY_CHANGE_SEQ.next_value(),
+        }
+        columns = [
+            (
+                undeleted_values[name]
+                if undelete and name in undeleted_values
+                else restored_cte.c[name]
+            )
+            for name in SHARED_COLUMNS
+        ]
+        stmt = (
+            insert(Property)
+            .from_select(SHARED_COLUMNS, select(*columns))
+            .returning(Property.source, Property.city)
+        )
+
+        if undelete:
+            lock_change_seq(self.session)
+        rows = self.session.execute(stmt).all()
+        logger.info(f"Restored {len(rows)} archived properties")
+
+        # Rows restored without undelete stay hidden, readers see no change
+        if rows and undelete:
+            on_commit(self.session, self.data_version.bump)
+            on_commit(self.session, self.shared_cache.bump_version)
+            notify_property_change(
+                self.session,
+                {row.source for row in rows},
+                {row.city for row in rows},
+            )
+        return len(rows)
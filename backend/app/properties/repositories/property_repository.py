@@ -1,22 +1,70 @@
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Generator, Mapping
 from dataclasses import dataclass
-from typing import Any, Protocol
-
-from sqlalchemy import and_, func, or_, select
+from datetime import datetime, timezone
+from typing import Any, Literal, Protocol
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+)
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
-
-from app.database.session_factory import ISessionFactory
-from app.properties.models.property import Property, PropertySource, PropertyType
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.sql import Select
+
+from app.config.settings import Settings
+from app.database.exceptions import QueryTooExpensiveException
+from app.database.notifications import MAX_PAYLOAD_BYTES, notify
+from app.database.query_cost import QueryEstimate, estimate_query
+from app.database.session_factory import (
+    ISessionFactory,
+    TransactionOptions,
+    set_transaction_options,
+    transaction_options,
+)
+from app.database.transaction_hooks import on_commit
+from app.properties.metrics import PROPERTY_ROWS_UPSERTED
+from app.properties.models.property import (
+    PROPERTY_CHANGE_SEQ,
+    Property,
+    PropertySource,
+    PropertyType,
+)
+from app.properties.models.property_archive import PropertyArchive
+from app.properties.schemas import PropertyChangeNotification, PropertyFilterParams
+from app.utils.cache import DataVersion
 from app.utils.di import inject
+from app.utils.metrics import DB_QUERY_DURATION
+from app.utils.shared_cache import ISharedCache
 
 logger = logging.getLogger(__name__)
 
 # Export limit to prevent server overload
 EXPORT_LIMIT = 50_000
 
+# Rows fetched from the server-side cursor at a time when streaming
+STREAM_BATCH_SIZE = 1_000
+
+# Postgres channel carrying PropertyChangeNotification payloads
+PROPERTY_CHANGES_CHANNEL = "property_changes"
+
+# Transaction-level advisory lock held by writers of change_seq values
+CHANGE_SEQ_LOCK_ID = 7_301_490_211
+
 
 @dataclass
 class PropertyFilters:
@@ -31,14 +79,172 @@ class PropertyFilters:
     max_area: float | None = None
     rooms: list[int] | None = None
     search: str | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+    # Property columns to load and return (JSON/NDJSON only), None for all
+    fields: list[str] | None = None
     page: int = 1
     size: int = 50
 
+    @classmethod
+    def from_params(
+        cls, params: PropertyFilterParams, **kwargs: Any
+    ) -> PropertyFilters:
+        """
+        Create filters from filter fields of a request body.
+
+        Args:
+            params: Filter fields
+            **kwargs: Other attributes (fields, page, size)
+        """
+        return cls(
+            cities=params.cities,
+            property_types=params.property_types,
+            sources=params.sources,
+            min_price=params.min_price,
+            max_price=params.max_price,
+            min_area=params.min_area,
+            max_area=params.max_area,
+            rooms=params.rooms,
+            search=params.search,
+            created_after=params.created_after,
+            created_before=params.created_before,
+            updated_after=params.updated_after,
+            **kwargs,
+        )
+
+    def normalized(self) -> dict[str, Any]:
+        """
+        Get filters in canonical form, equal for filters selecting the same rows.
+
+        Lists are deduplicated and sorted, search is case-folded (matching is
+        case-insensitive) and datetimes are converted to naive UTC.
+        """
+        return {
+            "cities": sorted(set(self.cities)) if self.cities else None,
+            "property_types": (
+                sorted({t.value for t in self.property_types})
+                if self.property_types
+                else None
+            ),
+            "sources": (
+                sorted({s.value for s in self.sources}) if self.sources else None
+            ),
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "min_area": self.min_area,
+            "max_area": self.max_area,
+            "rooms": sorted(set(self.rooms)) if self.rooms else None,
+            "search": self.search.strip().casefold() if self.search else None,
+            "created_after": _isoformat_or_none(self.created_after),
+            "created_before": _isoformat_or_none(self.created_before),
+            "updated_after": _isoformat_or_none(self.updated_after),
+            "fields": sorted(set(self.fields)) if self.fields else None,
+            "page": self.page,
+            "size": self.size,
+        }
+
+    def cache_key(self) -> str:
+        """Get a stable string key of the normalized filters."""
+        return json.dumps(self.normalized(), sort_keys=True, separators=(",", ":"))
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Timestamps are stored as UTC without time zone, normalize aware datetimes."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class BulkUpsertResult:
+    """Outcome of a bulk upsert."""
+
+    affected_rows: int
+    # Inserted rows and rows whose data changed (not only updated_at)
+    changed_ids: list[int]
+
+
+def _isoformat_or_none(value: datetime | None) -> str | None:
+    return to_naive_utc(value).isoformat() if value is not None else None
+
+
+def notify_property_change(
+    session: Session,
+    sources: set[PropertySource] | None,
+    cities: set[str] | None,
+) -> None:
+    """
+    Notify API processes that properties of sources/cities changed.
+
+    Delivered when the session's transaction commits. Falls back to an
+    "everything changed" payload when the city list doesn't fit in a NOTIFY.
+
+    Args:
+        session: Session whose transaction made the change
+        sources: Affected sources (None if unknown)
+        cities: Affected cities (None if unknown)
+    """
+    change = PropertyChangeNotification(
+        sources=sorted(sources) if sources is not None else None,
+        cities=sorted(cities) if cities is not None else None,
+    )
+    payload = change.model_dump_json()
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        payload = PropertyChangeNotification(sources=change.sources).model_dump_json()
+    notify(session, PROPERTY_CHANGES_CHANNEL, payload)
+
+
+def lock_change_seq(session: Session) -> None:
+    """
+    Take the change sequence lock, held until the session's transaction ends.
+
+    Writers take PROPERTY_CHANGE_SEQ values only while holding it, so a lower
+    value is always committed before a higher one is taken. A change feed
+    reader that saw a value never later finds a lower one committed.
+
+    Args:
+        session: Session whose transaction takes change_seq values
+    """
+    session.execute(select(func.pg_advisory_xact_lock(CHANGE_SEQ_LOCK_ID)))
+
+
+def _change_seq_on_update(values: Mapping[str, Any]) -> ColumnElement[int]:
+    """
+    Get change_seq of an ON CONFLICT DO UPDATE: the next value if the update
+    changes the row, else the current one (updated_at alone isn't a change).
+    """
+    changed = or_(
+        *(
+            getattr(Property, name).is_distinct_from(value)
+            for name, value in values.items()
+            if name != "updated_at"
+        )
+    )
+    return case((changed, PROPERTY_CHANGE_SEQ.next_value()), else_=Property.change_seq)
+
+
+def _select_properties(fields: list[str] | None) -> Select[tuple[Property]]:
+    """
+    Select properties, loading only the given columns.
+
+    Other columns raise on access instead of silently lazy-loading row by row.
+    """
+    stmt = select(Property)
+    if fields:
+        stmt = stmt.options(
+            load_only(*(getattr(Property, name) for name in fields), raiseload=True)
+        )
+    return stmt
+
 
 class IPropertyRepository(Protocol):
     """Protocol interface for property repository."""
 
-    def get_by_id(self, property_id: int) -> Property | None:
+    def get_by_id(
+        self, property_id: int, fields: list[str] | None = None
+    ) -> Property | None:
         """Get property by ID."""
         ...
 
@@ -46,22 +252,76 @@ class IPropertyRepository(Protocol):
         """List properties with filtering and pagination. Returns (items, total_count)."""
         ...
 
+    def list_properties_batch(
+        self, filters_list: list[PropertyFilters]
+    ) -> list[tuple[list[Property], int]]:
+        """List pages of several filter sets at once. Returns (items, total_count) per filter set."""
+        ...
+
     def list_all_properties(
         self, filters: PropertyFilters
     ) -> tuple[list[Property], int]:
         """List all properties matching filters (unpaginated, for exports). Returns (items, total_count)."""
         ...
 
+    def count_properties(self, filters: PropertyFilters) -> int:
+        """Count properties matching filters."""
+        ...
+
+    def stream_properties(
+        self,
+        filters: PropertyFilters,
+        batch_size: int = STREAM_BATCH_SIZE,
+        limit: int | None = None,
+        check_cost: bool = True,
+    ) -> Generator[list[Property]]:
+        """Stream all properties matching filters in batches from a server-side cursor."""
+        ...
+
+    def stream_distribution_rows(
+        self, filters: PropertyFilters, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Generator[list[tuple[str, PropertyType | None, float | None, float | None]]]:
+        """Stream (city, type, price, area) of properties matching filters in batches."""
+        ...
+
     def get_unique_cities(self) -> list[str]:
         """Get all unique cities from non-deleted properties."""
         ...
 
+    def count_by_value(
+        self, column: Literal["city", "location"]
+    ) -> list[tuple[str, int]]:
+        """Count non-deleted properties per distinct value of a column."""
+        ...
+
+    def get_titles(self) -> list[str]:
+        """Get titles of all non-deleted properties."""
+        ...
+
+    def get_by_ids(self, property_ids: list[int]) -> list[Property]:
+        """Get non-deleted properties by IDs (in no particular order)."""
+        ...
+
+    def get_feature_rows(
+        self, cities: list[str] | None = None
+    ) -> list[
+        tuple[int, str, PropertyType | None, float | None, float | None, int | None]
+    ]:
+        """Get (id, city, type, price, area, rooms) of non-deleted properties."""
+        ...
+
+    def get_changes(
+        self, since: int, limit: int
+    ) -> list[tuple[int, int, Property | None]]:
+        """Get changes after a change_seq. Returns (change_seq, id, property or None if deleted)."""
+        ...
+
     def upsert(self, property_data: dict[str, Any]) -> Property:
         """Insert or update property by unique link."""
         ...
 
-    def bulk_upsert(self, properties_data: list[dict[str, Any]]) -> int:
-        """Bulk insert or update properties. Returns count of affected rows."""
+    def bulk_upsert(self, properties_data: list[dict[str, Any]]) -> BulkUpsertResult:
+        """Bulk insert or update properties. Returns affected count and changed IDs."""
         ...
 
 
@@ -74,30 +334,45 @@ class PropertyRepository(IPropertyRepository):
     functionality for property listings.
     """
 
-    def __init__(self, session_factory: ISessionFactory):
+    def __init__(
+        self,
+        session_factory: ISessionFactory,
+        settings: Settings,
+        data_version: DataVersion,
+        shared_cache: ISharedCache,
+    ):
         self.session_factory = session_factory
+        self.settings = settings
+        self.data_version = data_version
+        self.shared_cache = shared_cache
 
     @property
     def session(self) -> Session:
         """Get current session from DI container."""
         return self.session_factory()
 
-    def get_by_id(self, property_id: int) -> Property | None:
+    @DB_QUERY_DURATION.labels(query="get_by_id").time()
+    def get_by_id(
+        self, property_id: int, fields: list[str] | None = None
+    ) -> Property | None:
         """
         Get property by ID.
 
         Args:
             property_id: Property ID
+            fields: Columns to load (None for all)
 
         Returns:
             Property if found, None otherwise
         """
-        stmt = select(Property).where(
+        stmt = _select_properties(fields).where(
             and_(Property.id == property_id, Property.deleted_at.is_(None))
         )
         return self.session.execute(stmt).scalar_one_or_none()
 
-    def _build_filter_conditions(self, filters: PropertyFilters) -> list[Any]:
+    def _build_filter_conditions(  # noqa: C901
+        self, filters: PropertyFilters
+    ) -> list[Any]:
         """
         Build filter conditions from PropertyFilters.
 
@@ -143,8 +418,84 @@ class PropertyRepository(IPropertyRepository):
                 )
             )
 
+        # Time windows (BRIN index on created_at, B-tree on updated_at)
+        if filters.created_after is not None:
+            conditions.append(
+                Property.created_at >= to_naive_utc(filters.created_after)
+            )
+
+        if filters.created_before is not None:
+            conditions.append(
+                Property.created_at < to_naive_utc(filters.created_before)
+            )
+
+        if filters.updated_after is not None:
+            conditions.append(
+                Property.updated_at >= to_naive_utc(filters.updated_after)
+            )
+
         return conditions
 
+    def _check_cost(self, stmt: Select[Any]) -> QueryEstimate | None:
+        """
+        Estimate a filtered statement when cost limits are set.
+
+        Args:
+            stmt: Filtered select statement
+
+        Returns:
+            Planner estimate, None when neither cost limit is set
+
+        Raises:
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        cost_limit = self.settings.QUERY_COST_LIMIT
+        if cost_limit is None and self.settings.QUERY_COUNT_COST_LIMIT is None:
+            return None
+
+        estimate = estimate_query(self.session, stmt)
+        if cost_limit is not None and estimate.total_cost > cost_limit:
+            logger.warning(
+                f"Rejected query with estimated cost {estimate.total_cost:.0f}"
+            )
+            raise QueryTooExpensiveException(estimate.total_cost, cost_limit)
+        return estimate
+
+    def _count(self, stmt: Select[Any]) -> int:
+        """
+        Count rows matching a filtered statement, guarded by the planner's cost estimate.
+
+        When `QUERY_COST_LIMIT` is set, queries estimated above it are rejected.
+        When `QUERY_COUNT_COST_LIMIT` is set, queries estimated above it skip the
+        exact count and return the planner's row estimate instead.
+
+        Args:
+            stmt: Filtered select statement (without ordering and pagination)
+
+        Returns:
+            Exact or estimated row count
+
+        Raises:
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        count_cost_limit = self.settings.QUERY_COUNT_COST_LIMIT
+
+        estimate = self._check_cost(stmt)
+        if (
+            estimate is not None
+            and count_cost_limit is not None
+            and estimate.total_cost > count_cost_limit
+        ):
+            logger.info(
+                f"Using estimated count {estimate.plan_rows} "
+                f"(estimated cost {estimate.total_cost:.0f})"
+            )
+            return estimate.plan_rows
+
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        return self.session.execute(count_stmt).scalar() or 0
+
+    @DB_QUERY_DURATION.labels(query="list_properties").time()
     def list_properties(self, filters: PropertyFilters) -> tuple[list[Property], int]:
         """
         List properties with filtering and pagination.
@@ -155,8 +506,8 @@ class PropertyRepository(IPropertyRepository):
         Returns:
             Tuple of (list of properties, total count)
         """
-        # Build base query
-        stmt = select(Property).where(Property.deleted_at.is_(None))
+        # Build base query, loading only requested columns
+        stmt = _select_properties(filters.fields).where(Property.deleted_at.is_(None))
 
         # Apply filters
         conditions = self._build_filter_conditions(filters)
@@ -164,8 +515,7 @@ class PropertyRepository(IPropertyRepository):
             stmt = stmt.where(and_(*conditions))
 
         # Get total count before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_count = self.session.execute(count_stmt).scalar() or 0
+        total_count = self._count(stmt)
 
         # Apply sorting (newest first)
         stmt = stmt.order_by(Property.created_at.desc())
@@ -179,6 +529,69 @@ class PropertyRepository(IPropertyRepository):
 
         return properties, total_count
 
+    @DB_QUERY_DURATION.labels(query="list_properties_batch").time()
+    def list_properties_batch(
+        self, filters_list: list[PropertyFilters]
+    ) -> list[tuple[list[Property], int]]:
+        """
+        List pages of several filter sets in a single query (one round trip).
+
+        Each filter set's page is a branch of a UNION ALL carrying its total
+        count as a window function, so neither pages nor counts need extra
+        round trips. Only a page past the end of its results (no rows to carry
+        the count) is counted separately. Full rows are loaded, `fields` only
+        narrows serialization.
+
+        With the planner cost guards (QUERY_COST_LIMIT, QUERY_COUNT_COST_LIMIT)
+        enabled, every query has to be planned on its own, so filter sets are
+        listed one by one (`list_properties`) on the same connection instead.
+
+        Args:
+            filters_list: Filter sets with pagination
+
+        Returns:
+            Tuple of (list of properties, total count) per filter set, in order
+        """
+        if (
+            self.settings.QUERY_COST_LIMIT is not None
+            or self.settings.QUERY_COUNT_COST_LIMIT is not None
+        ):
+            return [self.list_properties(filters) for filters in filters_list]
+
+        pages = []
+        for index, filters in enumerate(filters_list):
+            stmt = select(
+                Property,
+                literal(index).label("query_index"),
+                func.count().over().label("total_count"),
+            ).where(Property.deleted_at.is_(None))
+            conditions = self._build_filter_conditions(filters)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
+            offset = (filters.page - 1) * filters.size
+            pages.append(
+                stmt.order_by(Property.created_at.desc())
+                .offset(offset)
+                .limit(filters.size)
+            )
+
+        stmt = select(
+            Property, column("query_index", Integer), column("total_count", Integer)
+        ).from_statement(union_all(*pages))
+
+        results: list[tuple[list[Property], int]] = [([], 0) for _ in filters_list]
+        for prop, index, total_count in self.session.execute(stmt):
+            properties, _ = results[index]
+            properties.append(prop)
+            results[index] = (properties, total_count)
+
+        for index, filters in enumerate(filters_list):
+            if filters.page > 1 and not results[index][0]:
+                results[index] = ([], self.count_properties(filters))
+
+        return results
+
+    @DB_QUERY_DURATION.labels(query="list_all_properties").time()
     def list_all_properties(
         self, filters: PropertyFilters
     ) -> tuple[list[Property], int]:
@@ -200,8 +613,7 @@ class PropertyRepository(IPropertyRepository):
             stmt = stmt.where(and_(*conditions))
 
         # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_count = self.session.execute(count_stmt).scalar() or 0
+        total_count = self._count(stmt)
 
         # Apply sorting (newest first)
         stmt = stmt.order_by(Property.created_at.desc())
@@ -217,6 +629,125 @@ class PropertyRepository(IPropertyRepository):
         )
         return properties, total_count
 
+    @DB_QUERY_DURATION.labels(query="count_properties").time()
+    def count_properties(self, filters: PropertyFilters) -> int:
+        """
+        Count properties matching filters.
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size ignored)
+
+        Returns:
+            Exact or estimated row count (see `_count`)
+        """
+        stmt = select(Property).where(Property.deleted_at.is_(None))
+        conditions = self._build_filter_conditions(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        return self._count(stmt)
+
+    def stream_properties(
+        self,
+        filters: PropertyFilters,
+        batch_size: int = STREAM_BATCH_SIZE,
+        limit: int | None = None,
+        check_cost: bool = True,
+    ) -> Generator[list[Property]]:
+        """
+        Stream all properties matching filters (unpaginated, no EXPORT_LIMIT).
+
+        Rows come from a server-side cursor, `batch_size` at a time, so memory
+        stays constant however many rows match. The stream runs in its own
+        session because it outlives the request session, closing the generator
+        closes the cursor and ends the query.
+
+        The query is checked against `QUERY_COST_LIMIT` right away, in the
+        caller's session, so a rejected query fails before anything is
+        streamed. The stream's transaction gets the caller's transaction
+        options (statement timeout, read only). Each batch is a separate FETCH
+        statement, so the timeout bounds every fetch rather than the stream.
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size ignored)
+            batch_size: Rows fetched per round trip
+            limit: Maximum number of rows (None for all)
+            check_cost: Check the query's estimated cost, off for background
+                jobs, which are bounded by their row limit instead
+
+        Returns:
+            Generator of batches of properties, newest first
+
+        Raises:
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        stmt = _select_properties(filters.fields).where(Property.deleted_at.is_(None))
+        conditions = self._build_filter_conditions(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        stmt = stmt.order_by(Property.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if check_cost:
+            self._check_cost(stmt)
+        return self._stream(stmt, transaction_options.get(), batch_size)
+
+    def _stream(
+        self,
+        stmt: Select[tuple[Property]],
+        options: TransactionOptions,
+        batch_size: int,
+    ) -> Generator[list[Property]]:
+        """Stream a statement's properties in a session of its own."""
+        streamed = 0
+        with Session(self.session_factory.engine, autoflush=False) as session:
+            set_transaction_options(session.connection(), options)
+            result = session.execute(stmt, execution_options={"yield_per": batch_size})
+            # The session only holds weak references to the loaded objects,
+            # each batch is freed once the caller drops it (expunging between
+            # batches would break yield_per)
+            for batch in result.scalars().partitions():
+                yield batch
+                streamed += len(batch)
+
+        logger.info(f"Streamed {streamed} properties")
+
+    def stream_distribution_rows(
+        self, filters: PropertyFilters, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Generator[list[tuple[str, PropertyType | None, float | None, float | None]]]:
+        """
+        Stream the columns distributions are computed from (unpaginated).
+
+        Only four narrow columns are fetched, in the request's session, from a
+        server-side cursor `batch_size` rows at a time. Queries estimated above
+        `QUERY_COST_LIMIT` are rejected like list queries.
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size ignored)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Batches of (city, property type, price EUR, area m²)
+
+        Raises:
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        stmt = select(
+            Property.city,
+            Property.property_type,
+            cast(Property.price_eur, Float),
+            cast(Property.area_sqm, Float),
+        ).where(Property.deleted_at.is_(None))
+        conditions = self._build_filter_conditions(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        self._check_cost(stmt)
+
+        result = self.session.execute(stmt, execution_options={"yield_per": batch_size})
+        yield from result.tuples().partitions()
+
+    @DB_QUERY_DURATION.labels(query="get_unique_cities").time()
     def get_unique_cities(self) -> list[str]:
         """
         Get all unique cities from non-deleted properties.
@@ -232,6 +763,134 @@ class PropertyRepository(IPropertyRepository):
         )
         return list(self.session.execute(stmt).scalars().all())
 
+    @DB_QUERY_DURATION.labels(query="count_by_value").time()
+    def count_by_value(
+        self, column: Literal["city", "location"]
+    ) -> list[tuple[str, int]]:
+        """
+        Count non-deleted properties per distinct value of a column.
+
+        Args:
+            column: city or location
+
+        Returns:
+            List of (value, count), empty values excluded
+        """
+        value = getattr(Property, column)
+        stmt = (
+            select(value, func.count())
+            .where(Property.deleted_at.is_(None), value != "")
+            .group_by(value)
+        )
+        return [(row[0], row[1]) for row in self.session.execute(stmt)]
+
+    @DB_QUERY_DURATION.labels(query="get_titles").time()
+    def get_titles(self) -> list[str]:
+        """
+        Get titles of all non-deleted properties.
+
+        Returns:
+            List of titles
+        """
+        stmt = select(Property.title).where(Property.deleted_at.is_(None))
+        return list(self.session.execute(stmt).scalars().all())
+
+    @DB_QUERY_DURATION.labels(query="get_by_ids").time()
+    def get_by_ids(self, property_ids: list[int]) -> list[Property]:
+        """
+        Get non-deleted properties by IDs.
+
+        Args:
+            property_ids: Property IDs
+
+        Returns:
+            Found properties, in no particular order
+        """
+        if not property_ids:
+            return []
+        stmt = select(Property).where(
+            Property.id.in_(property_ids), Property.deleted_at.is_(None)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    @DB_QUERY_DURATION.labels(query="get_feature_rows").time()
+    def get_feature_rows(
+        self, cities: list[str] | None = None
+    ) -> list[
+        tuple[int, str, PropertyType | None, float | None, float | None, int | None]
+    ]:
+        """
+        Get the columns listings are compared by (e.g. for similar listings).
+
+        Args:
+            cities: Only properties in these cities (None for all)
+
+        Returns:
+            List of (id, city, property type, price EUR, area m², rooms)
+        """
+        stmt = select(
+            Property.id,
+            Property.city,
+            Property.property_type,
+            Property.price_eur,
+            Property.area_sqm,
+            Property.rooms,
+        ).where(Property.deleted_at.is_(None))
+        if cities is not None:
+            stmt = stmt.where(Property.city.in_(cities))
+        return list(self.session.execute(stmt).tuples())
+
+    @DB_QUERY_DURATION.labels(query="get_changes").time()
+    def get_changes(
+        self, since: int, limit: int
+    ) -> list[tuple[int, int, Property | None]]:
+        """
+        Get upserts and deletions after a change_seq, in commit order.
+
+        Both tables are read with a single statement (one snapshot), each with
+        an index range scan on change_seq, so the cost depends on `limit`, not
+        on the table size. Deleted rows are reported by ID, from `properties`
+        while soft-deleted and from the archive once moved there.
+
+        Args:
+            since: Only changes with a greater change_seq
+            limit: Maximum number of changes
+
+        Returns:
+            List of (change_seq, property ID, property or None if deleted)
+        """
+        live = (
+            select(
+                Property.id,
+                Property.change_seq,
+                Property.deleted_at.is_not(None).label("deleted"),
+            )
+            .where(Property.change_seq > since)
+            .order_by(Property.change_seq)
+            .limit(limit)
+        )
+        archived = (
+            select(
+                PropertyArchive.id,
+                PropertyArchive.change_seq,
+                true().label("deleted"),
+            )
+            .where(PropertyArchive.change_seq > since)
+            .order_by(PropertyArchive.change_seq)
+            .limit(limit)
+        )
+        changes = union_all(live, archived).subquery("changes")
+
+        stmt = (
+            select(changes.c.change_seq, changes.c.id, Property)
+            .select_from(changes)
+            .outerjoin(Property, and_(Property.id == changes.c.id, ~changes.c.deleted))
+            .order_by(changes.c.change_seq)
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).tuples())
+
+    @DB_QUERY_DURATION.labels(query="upsert").time()
     def upsert(self, property_data: dict[str, Any]) -> Property:
         """
         Insert or update property by unique link.
@@ -244,66 +903,103 @@ class PropertyRepository(IPropertyRepository):
         Returns:
             Inserted or updated Property
         """
+        updated = {
+            k: v for k, v in property_data.items() if k not in ["created_at", "link"]
+        }
         stmt = (
             insert(Property)
             .values(**property_data)
             .on_conflict_do_update(
                 index_elements=["link"],
-                set_={
-                    k: v
-                    for k, v in property_data.items()
-                    if k not in ["created_at", "link"]
-                },
+                set_={**updated, "change_seq": _change_seq_on_update(updated)},
             )
             .returning(Property)
         )
 
+        lock_change_seq(self.session)
         result = self.session.execute(stmt)
+        on_commit(self.session, self.data_version.bump)
+        on_commit(self.session, self.shared_cache.bump_version)
+        notify_property_change(
+            self.session, {property_data["source"]}, {property_data["city"]}
+        )
         return result.scalar_one()
 
-    def bulk_upsert(self, properties_data: list[dict[str, Any]]) -> int:
+    @DB_QUERY_DURATION.labels(query="bulk_upsert").time()
+    def bulk_upsert(self, properties_data: list[dict[str, Any]]) -> BulkUpsertResult:
         """
         Bulk insert or update properties.
 
         Uses PostgreSQL's ON CONFLICT DO UPDATE for efficient bulk upserts.
-        All operations are performed in a single transaction.
+        All operations are performed in a single transaction. Inserted rows and
+        rows whose data changed take the next change_seq values, unchanged rows
+        keep theirs, so re-scraped listings don't flood the change feed.
 
         Args:
             properties_data: List of dictionaries with property fields
 
         Returns:
-            Count of affected rows
+            BulkUpsertResult with the count of affected rows and the IDs of
+            inserted or changed rows
         """
         if not properties_data:
-            return 0
+            return BulkUpsertResult(affected_rows=0, changed_ids=[])
 
         try:
+            updated = {
+                "source": insert(Property).excluded.source,
+                "city": insert(Property).excluded.city,
+                "location": insert(Property).excluded.location,
+                "title": insert(Property).excluded.title,
+                "property_type": insert(Property).excluded.property_type,
+                "price_raw": insert(Property).excluded.price_raw,
+                "price_eur": insert(Property).excluded.price_eur,
+                "area_raw": insert(Property).excluded.area_raw,
+                "area_sqm": insert(Property).excluded.area_sqm,
+                "rooms_raw": insert(Property).excluded.rooms_raw,
+                "rooms": insert(Property).excluded.rooms,
+                "price_display": insert(Property).excluded.price_display,
+                "area_display": insert(Property).excluded.area_display,
+                "updated_at": insert(Property).excluded.updated_at,
+            }
             stmt = (
                 insert(Property)
                 .values(properties_data)
                 .on_conflict_do_update(
                     index_elements=["link"],
-                    set_={
-                        "source": insert(Property).excluded.source,
-                        "city": insert(Property).excluded.city,
-                        "location": insert(Property).excluded.location,
-                        "title": insert(Property).excluded.title,
-                        "property_type": insert(Property).excluded.property_type,
-                        "price_raw": insert(Property).excluded.price_raw,
-                        "price_eur": insert(Property).excluded.price_eur,
-                        "area_raw": insert(Property).excluded.area_raw,
-                        "area_sqm": insert(Property).excluded.area_sqm,
-                        "rooms_raw": insert(Property).excluded.rooms_raw,
-                        "rooms": insert(Property).excluded.rooms,
-                        "updated_at": insert(Property).excluded.updated_at,
-                    },
+                    set_={**updated, "change_seq": _change_seq_on_update(updated)},
                 )
+                .returning(Property.id, Property.change_seq)
             )
 
-            result = self.session.execute(stmt)
-            affected_rows = result.rowcount or 0
+            lock_change_seq(self.session)
+            # Values taken by the upsert are greater, unchanged rows keep lower ones
+            watermark = self.session.execute(
+                select(PROPERTY_CHANGE_SEQ.next_value())
+            ).scalar_one()
+            rows = self.session.execute(stmt).all()
+            affected_rows = len(rows)
+            changed_ids = [
+                property_id
+                for property_id, change_seq in rows
+                if change_seq > watermark
+            ]
             logger.info(f"Bulk upserted {affected_rows} properties")
-            return affected_rows
+
+            # Cached reads keyed by the previous version become unreachable
+            on_commit(self.session, self.data_version.bump)
+            on_commit(self.session, self.shared_cache.bump_version)
+            # Other processes invalidate their caches once this commits
+            notify_property_change(
+                self.session,
+                {data["source"] for data in properties_data},
+                {data["city"] for data in properties_data},
+            )
+            # Rolled back upserts aren't counted
+            on_commit(self.session, lambda: PROPERTY_ROWS_UPSERTED.inc(affected_rows))
+            return BulkUpsertResult(
+                affected_rows=affected_rows, changed_ids=changed_ids
+            )
 
         except Exception:
             logger.exception("Bulk upsert failed")
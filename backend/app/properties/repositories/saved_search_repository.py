@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Protocol
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database.session_factory import ISessionFactory
+from app.database.transaction_hooks import on_commit
+from app.properties.metrics import SAVED_SEARCH_MATCHES_QUEUED
+from app.properties.models.saved_search import SavedSearch, SavedSearchMatch
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+
+class ISavedSearchRepository(Protocol):
+    """Protocol interface for saved search repository."""
+
+    def create(
+        self, name: str, filters: dict[str, Any], webhook_url: str
+    ) -> SavedSearch:
+        """Create a saved search."""
+        ...
+
+    def get_all(self) -> list[SavedSearch]:
+        """Get all saved searches, oldest first."""
+        ...
+
+    def get_by_ids(self, saved_search_ids: list[int]) -> list[SavedSearch]:
+        """Get saved searches by IDs (in no particular order)."""
+        ...
+
+    def delete(self, saved_search_id: int) -> bool:
+        """Delete a saved search and its matches. Returns whether it existed."""
+        ...
+
+    def get_version(self) -> tuple[int, int]:
+        """Get a value that changes whenever saved searches are created or deleted."""
+        ...
+
+    def queue_matches(self, matches: list[tuple[int, int]]) -> int:
+        """Queue (saved search ID, property ID) matches for delivery. Returns queued count."""
+        ...
+
+    def claim_pending_matches(
+        self, max_attempts: int, limit: int, claimed_until: datetime
+    ) -> list[SavedSearchMatch]:
+        """Claim matches waiting for delivery until a time, oldest first."""
+        ...
+
+    def mark_delivered(self, match_ids: list[int], claimed_until: datetime) -> None:
+        """Mark matches sent under a claim as delivered."""
+        ...
+
+    def mark_failed(
+        self, match_ids: list[int], claimed_until: datetime, retry_at: datetime
+    ) -> None:
+        """Count a failed delivery attempt of matches sent under a claim."""
+        ...
+
+
+@inject(alias=ISavedSearchRepository, singleton=False)
+class SavedSearchRepository(ISavedSearchRepository):
+    """Repository for saved searches and their delivery queue (matches)."""
+
+    def __init__(self, session_factory: ISessionFactory):
+        self.session_factory = session_factory
+
+    @property
+    def session(self) -> Session:
+        """Get current session from DI container."""
+        return self.session_factory()
+
+    def create(
+        self, name: str, filters: dict[str, Any], webhook_url: str
+    ) -> SavedSearch:
+        """
+        Create a saved search.
+
+        Args:
+            name: Display name
+            filters: PropertyFilterParams fields (snake_case)
+            webhook_url: URL alerts are POSTed to
+
+        Returns:
+            Created SavedSearch
+        """
+        saved_search = SavedSearch(name=name, filters=filters, webhook_url=webhook_url)
+        self.session.add(saved_search)
+        self.session.flush()
+        return saved_search
+
+    def get_all(self) -> list[SavedSearch]:
+        """
+        Get all saved searches.
+
+        Returns:
+            List of saved searches, oldest first
+        """
+        stmt = select(SavedSearch).order_by(SavedSearch.id)
+        return list(self.session.execute(stmt).scalars().all())
+
+    def get_by_ids(self, saved_search_ids: list[int]) -> list[SavedSearch]:
+        """
+        Get saved searches by IDs.
+
+        Args:
+            saved_search_ids: Saved search IDs
+
+        Returns:
+            Found saved searches, in no particular order
+        """
+        if not saved_search_ids:
+            return []
+        stmt = select(SavedSearch).where(SavedSearch.id.in_(saved_search_ids))
+        return list(self.session.execute(stmt).scalars().all())
+
+    def delete(self, saved_search_id: int) -> bool:
+        """
+        Delete a saved search, its queued matches are deleted with it.
+
+        Args:
+            saved_search_id: Saved search ID
+
+        Returns:
+            True if the saved search existed
+        """
+        stmt = (
+            delete(SavedSearch)
+            .where(SavedSearch.id == saved_search_id)
+            .returning(SavedSearch.id)
+        )
+        return self.session.execute(stmt).scalar_one_or_none() is not None
+
+    def get_version(self) -> tuple[int, int]:
+        """
+        Get a value that changes whenever saved searches are created or deleted.
+
+        Saved searches aren't updated, so the count and the highest ID (answered
+        from the primary key index) identify the current set.
+
+        Returns:
+            Tuple of (count, highest ID)
+        """
+        stmt = select(func.count(), func.coalesce(func.max(SavedSearch.id), 0))
+        count, max_id = self.session.execute(stmt).one()
+        return count, max_id
+
+    def queue_matches(self, matches: list[tuple[int, int]]) -> int:
+        """
+        Queue matches for delivery, in the caller's transaction.
+
+        A listing already queued for a saved search (or delivered) is queued
+        again, with its failed attempts reset and its claim ended. If a delivery
+        run is sending it, the run doesn't mark it delivered.
+
+        Args:
+            matches: List of (saved search ID, property ID)
+
+        Returns:
+            Count of queued matches
+        """
+        if not matches:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        stmt = (
+            insert(SavedSearchMatch)
+            .values(
+                [
+                    {
+                        "saved_search_id": saved_search_id,
+                        "property_id": property_id,
+                        "matched_at": now,
+                        "attempts": 0,
+                    }
+                    for saved_search_id, property_id in matches
+                ]
+            )
+            .on_conflict_do_update(
+                index_elements=["saved_search_id", "property_id"],
+                set_={
+                    "matched_at": now,
+                    "delivered_at": None,
+                    "attempts": 0,
+                    "next_attempt_at": None,
+                },
+            )
+            # Counted from RETURNING, rowcount isn't reported for INSERTs
+            .returning(SavedSearchMatch.id)
+        )
+        queued = len(self.session.execute(stmt).all())
+        logger.info(f"Queued {queued} saved search matches")
+        # Rolled back matches aren't counted
+        on_commit(self.session, lambda: SAVED_SEARCH_MATCHES_QUEUED.inc(queued))
+        return queued
+
+    def claim_pending_matches(
+        self, max_attempts: int, limit: int, claimed_until: datetime
+    ) -> list[SavedSearchMatch]:
+        """
+        Claim matches waiting for delivery, so other runs skip them until a time.
+
+        Rows are locked only while claiming (skipping rows another run is
+        claiming), the claim lasts after the transaction is committed, so
+        webhooks are called without holding locks or a connection.
+
+        Args:
+            max_attempts: Skip matches that failed this many times
+            limit: Maximum number of matches
+            claimed_until: Time other runs can pick the matches up again
+                (if they aren't marked delivered or failed until then)
+
+        Returns:
+            Claimed matches, oldest first
+        """
+        now = datetime.now(timezone.utc)
+        pending = (
+            select(SavedSearchMatch.id)
+            .where(
+                SavedSearchMatch.delivered_at.is_(None),
+                SavedSearchMatch.attempts < max_attempts,
+                or_(
+                    SavedSearchMatch.next_attempt_at.is_(None),
+                    SavedSearchMatch.next_attempt_at <= now,
+                ),
+            )
+            .order_by(SavedSearchMatch.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(SavedSearchMatch)
+            .where(SavedSearchMatch.id.in_(pending.scalar_subquery()))
+            .values(next_attempt_at=claimed_until)
+            .returning(SavedSearchMatch)
+        )
+        claimed = self.session.execute(stmt).scalars().all()
+        return sorted(claimed, key=lambda match: match.id)
+
+    def mark_delivered(self, match_ids: list[int], claimed_until: datetime) -> None:
+        """
+        Mark matches as delivered.
+
+        Matches queued again while they were being sent (the listing changed,
+        which ends the claim) are left pending, the sent alert had the old
+        listing. So are matches claimed by another run after the claim expired.
+
+        Args:
+            match_ids: Match IDs
+            claimed_until: Claim the matches were sent under
+        """
+        if not match_ids:
+            return
+        stmt = (
+            update(SavedSearchMatch)
+            .where(
+                SavedSearchMatch.id.in_(match_ids),
+                SavedSearchMatch.next_attempt_at == claimed_until,
+            )
+            .values(delivered_at=datetime.now(timezone.utc), next_attempt_at=None)
+        )
+        self.session.execute(stmt)
+
+    def mark_failed(
+        self, match_ids: list[int], claimed_until: datetime, retry_at: datetime
+    ) -> None:
+        """
+        Count a failed delivery attempt of matches.
+
+        Matches queued again or claimed by another run since are left as they
+        are (see `mark_delivered`).
+
+        Args:
+            match_ids: Match IDs
+            claimed_until: Claim the matches were sent under
+            retry_at: Time the matches can be delivered again
+        """
+        if not match_ids:
+            return
+        stmt = (
+            update(SavedSearchMatch)
+            .where(
+                SavedSearchMatch.id.in_(match_ids),
+                SavedSearchMatch.next_attempt_at == claimed_until,
+            )
+            .values(attempts=SavedSearchMatch.attempts + 1, next_attempt_at=retry_at)
+        )
+        self.session.execute(stmt)
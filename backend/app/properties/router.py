@@ -1,33 +1,101 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 from typing import Annotated, Literal
 
-from fastapi import HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi import HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 
-from app.database.session_handler import DBAPIRouter
+from app.config.settings import Settings
+from app.database.session_handler import DBAPIRouter, release_session
 from app.properties.models.property import PropertySource, PropertyType
 from app.properties.repositories import PropertyFilters
 from app.properties.schemas import (
+    MAX_CHANGES_LIMIT,
+    BasePropertyResponse,
     CitiesResponse,
+    DistributionQuery,
+    ExportJob,
+    ExportJobCreate,
+    FullPropertyQueryBatchResponse,
     PlatformsResponse,
-    PropertyListResponse,
+    PropertyChangesResponse,
+    PropertyDistributionResponse,
+    PropertyQueryBatchRequest,
+    PropertyQueryBatchResponse,
     PropertyResponse,
+    SavedSearchCreate,
+    SavedSearchesResponse,
+    SavedSearchResponse,
+    SimilarPropertiesResponse,
+    SuggestionsResponse,
+    parse_property_fields,
 )
+from app.properties.services.columnar_export_service import MEDIA_TYPES
+from app.properties.services.export_job_service import (
+    MEDIA_TYPES as EXPORT_MEDIA_TYPES,
+)
+from app.properties.services.export_job_service import IExportJobService
 from app.properties.services.property_service import IPropertyService
+from app.properties.services.saved_search_service import ISavedSearchService
+from app.properties.services.similarity_service import ISimilarityService
+from app.properties.services.suggestion_service import ISuggestionService
+from app.properties.tasks.export_tasks import run_property_export
+from app.utils.admission import RouteClass
 from app.utils.di import get_from_di_container
+from app.utils.http_cache import (
+    format_http_date,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from app.utils.streaming import ClosingStreamingResponse, iter_file
 
 logger = logging.getLogger(__name__)
 
-router = DBAPIRouter(prefix="/properties", tags=["Properties"])
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return (e.g., id,priceEur,city,title), "
+    "all fields if omitted. id is always included"
+)
+
+# Statement timeouts (ms), broad searches shouldn't hold a worker and a DB backend
+DEFAULT_STATEMENT_TIMEOUT = 5_000
+LIST_STATEMENT_TIMEOUT = 15_000
+
+# Cache-Control of conditional (ETag) responses: lists are revalidated on every
+# request, dropdown data can be reused for a while
+LIST_CACHE_CONTROL = "no-cache"
+CITIES_CACHE_CONTROL = "public, max-age=300"
+PLATFORMS_CACHE_CONTROL = "public, max-age=86400"
+SUGGEST_CACHE_CONTROL = "public, max-age=60"
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Platforms only change with a deploy
+PLATFORMS_LAST_MODIFIED = datetime.now(timezone.utc)
+
+# Routes are admitted from the light capacity, unless they can scan many rows
+router = DBAPIRouter(
+    prefix="/properties",
+    tags=["Properties"],
+    statement_timeout=DEFAULT_STATEMENT_TIMEOUT,
+    admission=RouteClass.LIGHT,
+)
 
 
-@router.get("", response_model=None)
+@router.get(
+    "",
+    response_model=None,
+    statement_timeout=LIST_STATEMENT_TIMEOUT,
+    read_only=True,
+    admission=RouteClass.HEAVY,
+)
 def list_properties(
+    request: Request,
     format: Annotated[
-        Literal["json", "csv"],
-        Query(description="Response format (json or csv)"),
+        Literal["json", "csv", "ndjson", "parquet", "arrow"],
+        Query(description="Response format (json, csv, ndjson, parquet or arrow)"),
     ] = "json",
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     size: Annotated[int, Query(ge=1, le=500, description="Items per page")] = 50,
@@ -74,7 +142,29 @@ def list_properties(
             description="Search in title and location",
         ),
     ] = None,
-) -> PropertyListResponse | StreamingResponse:
+    created_after: Annotated[
+        datetime | None,
+        Query(
+            alias="createdAfter",
+            description="Only listings added at or after this time (ISO 8601)",
+        ),
+    ] = None,
+    created_before: Annotated[
+        datetime | None,
+        Query(
+            alias="createdBefore",
+            description="Only listings added before this time (ISO 8601)",
+        ),
+    ] = None,
+    updated_after: Annotated[
+        datetime | None,
+        Query(
+            alias="updatedAfter",
+            description="Only listings updated at or after this time (ISO 8601)",
+        ),
+    ] = None,
+    fields: Annotated[str | None, Query(description=FIELDS_DESCRIPTION)] = None,
+) -> StreamingResponse | Response:
     """
     List property listings with filtering and pagination, or export to CSV.
 
@@ -86,12 +176,23 @@ def list_properties(
     - Area range (min/max m²)
     - Room count (multiple)
     - Full-text search in title and location
+    - Time windows (createdAfter, createdBefore, updatedAfter)
 
     Format options:
     - json (default): Returns paginated JSON response
     - csv: Returns CSV file for download with all matching properties
+    - ndjson: Streams every matching property, one JSON object per line
+      (unpaginated, not subject to the CSV export limit)
+    - parquet / arrow: Returns a typed Parquet or Arrow IPC file for download
+      with all matching properties (same limit as CSV, use POST
+      /properties/exports for larger exports)
 
     Results are sorted by newest first.
+
+    `fields` narrows JSON/NDJSON items (and the columns loaded) to the given fields,
+    file exports always contain all columns.
+
+    JSON responses carry a weak ETag, a matching If-None-Match returns 304.
     """
     service = get_from_di_container(IPropertyService)
 
@@ -106,6 +207,10 @@ def list_properties(
         max_area=max_area,
         rooms=rooms,
         search=search,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        fields=parse_property_fields(fields),
         page=page,
         size=size,
     )
@@ -119,20 +224,41 @@ def list_properties(
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
-    # Handle JSON response (default)
-    properties, total = service.list_properties(filters)
+    # Columnar exports, written in row groups from a database cursor
+    if format == "parquet" or format == "arrow":
+        file, filename = service.export_properties_columnar(filters, format)
+        return ClosingStreamingResponse(
+            iter_file(file),
+            media_type=MEDIA_TYPES[format],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
 
-    # Build response
-    return PropertyListResponse.from_properties(
-        properties=properties,
-        total=total,
-        page=page,
-        size=size,
+    # Stream NDJSON straight from a database cursor, page/size are ignored
+    if format == "ndjson":
+        return ClosingStreamingResponse(
+            service.stream_properties(filters),
+            media_type=NDJSON_MEDIA_TYPE,
+            hold_admission=True,
+        )
+
+    # Handle JSON response (default), answer revalidations without querying
+    etag = make_etag(service.get_data_version().token, "list", filters.cache_key())
+    headers = {"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+    if is_not_modified(request, etag):
+        return not_modified_response(headers)
+
+    # Serialize straight to bytes, response_model=None keeps FastAPI from
+    # validating and encoding the (already typed) response a second time
+    result = service.list_properties(filters)
+    # Data is loaded, don't hold the connection while serializing
+    release_session()
+    return Response(
+        content=result.to_json_bytes(), media_type="application/json", headers=headers
     )
 
 
-@router.get("/cities", response_model=CitiesResponse)
-def get_cities() -> CitiesResponse:
+@router.get("/cities", response_model=CitiesResponse, read_only=True)
+def get_cities(request: Request, response: Response) -> CitiesResponse | Response:
     """
     Get all unique cities from properties.
 
@@ -140,12 +266,24 @@ def get_cities() -> CitiesResponse:
     Useful for populating filter dropdowns.
     """
     service = get_from_di_container(IPropertyService)
+
+    data_version = service.get_data_version()
+    etag = make_etag(data_version.token, "cities")
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(data_version.updated_at),
+        "Cache-Control": CITIES_CACHE_CONTROL,
+    }
+    if is_not_modified(request, etag, data_version.updated_at):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     cities = service.get_unique_cities()
     return CitiesResponse(cities=cities)
 
 
-@router.get("/platforms", response_model=PlatformsResponse)
-def get_platforms() -> PlatformsResponse:
+@router.get("/platforms", response_model=PlatformsResponse, read_only=True)
+def get_platforms(request: Request, response: Response) -> PlatformsResponse | Response:
     """
     Get all available platforms/sources.
 
@@ -154,11 +292,262 @@ def get_platforms() -> PlatformsResponse:
     """
     service = get_from_di_container(IPropertyService)
     platforms = service.get_available_platforms()
+
+    etag = make_etag("platforms", *(platform.value for platform in platforms))
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(PLATFORMS_LAST_MODIFIED),
+        "Cache-Control": PLATFORMS_CACHE_CONTROL,
+    }
+    if is_not_modified(request, etag, PLATFORMS_LAST_MODIFIED):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     return PlatformsResponse(platforms=platforms)
 
 
-@router.get("/{property_id}", response_model=PropertyResponse)
-def get_property(property_id: int) -> PropertyResponse:
+@router.get("/suggest", response_model=SuggestionsResponse, read_only=True)
+def suggest(
+    response: Response,
+    q: Annotated[
+        str, Query(min_length=1, max_length=100, description="Typed search text")
+    ],
+    limit: Annotated[
+        int, Query(ge=1, le=20, description="Maximum number of suggestions")
+    ] = 10,
+) -> SuggestionsResponse:
+    """
+    Get typeahead suggestions for the search box.
+
+    Suggests cities, locations and frequent title phrases having a word that
+    starts with `q` (case and diacritics are ignored), e.g. "kot" suggests
+    Kotor. Answered from an in-memory index, without querying the database.
+    """
+    service = get_from_di_container(ISuggestionService)
+
+    response.headers["Cache-Control"] = SUGGEST_CACHE_CONTROL
+    return SuggestionsResponse(suggestions=service.suggest(q, limit))
+
+
+@router.get(
+    "/distribution",
+    response_model=PropertyDistributionResponse,
+    statement_timeout=LIST_STATEMENT_TIMEOUT,
+    read_only=True,
+    admission=RouteClass.HEAVY,
+)
+def get_distribution(
+    request: Request,
+    response: Response,
+    query: Annotated[DistributionQuery, Query()],
+) -> PropertyDistributionResponse | Response:
+    """
+    Get price and area distributions per city and property type.
+
+    Takes the list endpoint's filters. For every city and property type of the
+    matching listings returns the count, min, max, mean, percentiles (5, 10,
+    25, 50, 75, 90, 95) and an equal-width histogram of prices and of areas.
+
+    Responses carry a weak ETag, a matching If-None-Match returns 304.
+    """
+    service = get_from_di_container(IPropertyService)
+    settings = get_from_di_container(Settings)
+
+    filters = PropertyFilters.from_params(query)
+    bins = query.bins or settings.DISTRIBUTION_DEFAULT_BINS
+
+    etag = make_etag(
+        service.get_data_version().token,
+        "distribution",
+        str(bins),
+        filters.cache_key(),
+    )
+    headers = {"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+    if is_not_modified(request, etag):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
+    return service.get_distribution(filters, bins)
+
+
+@router.get("/changes", response_model=PropertyChangesResponse, read_only=True)
+def get_changes(
+    since: Annotated[
+        int,
+        Query(ge=0, description="nextToken of the previous page, 0 for all changes"),
+    ] = 0,
+    limit: Annotated[
+        int,
+        Query(ge=1, le=MAX_CHANGES_LIMIT, description="Maximum number of changes"),
+    ] = 100,
+) -> PropertyChangesResponse:
+    """
+    Get listings added, changed or deleted since a token, for incremental sync.
+
+    Changes are returned in commit order: upserts with the listing's current
+    data, deletions with its ID only. A listing changed several times since
+    the token appears once, at its latest change. Pass `nextToken` as `since`
+    to get the following changes, until `hasMore` is false; starting from 0
+    returns every listing, including deleted ones.
+    """
+    service = get_from_di_container(IPropertyService)
+    return service.get_changes(since, limit)
+
+
+@router.post(
+    "/query-batch",
+    response_model=None,
+    responses={200: {"model": FullPropertyQueryBatchResponse}},
+    statement_timeout=LIST_STATEMENT_TIMEOUT,
+    read_only=True,
+    admission=RouteClass.HEAVY,
+)
+def query_batch(batch_request: PropertyQueryBatchRequest) -> Response:
+    """
+    Run several list queries at once, e.g. for the widgets of a dashboard.
+
+    Each query takes the list endpoint's filters, pagination and fields, and
+    gets a list response in `results`, in the same order. Queries not cached
+    yet run together as a single database query.
+    """
+    service = get_from_di_container(IPropertyService)
+
+    filters_list = [
+        PropertyFilters.from_params(
+            query,
+            fields=parse_property_fields(query.fields),
+            page=query.page,
+            size=query.size,
+        )
+        for query in batch_request.queries
+    ]
+    results = service.list_properties_batch(filters_list)
+    # Data is loaded, don't hold the connection while serializing
+    release_session()
+
+    response = PropertyQueryBatchResponse.model_construct(results=results)
+    return Response(content=response.to_json_bytes(), media_type="application/json")
+
+
+@router.post(
+    "/exports",
+    response_model=ExportJob,
+    status_code=202,
+    statement_timeout=LIST_STATEMENT_TIMEOUT,
+    read_only=True,
+    admission=RouteClass.HEAVY,
+)
+def create_export(
+    request: Request, response: Response, export_request: ExportJobCreate
+) -> ExportJob:
+    """
+    Queue a background export of all properties matching the filters.
+
+    Unlike format=csv on the list endpoint, the file is written by a worker,
+    so exports aren't bound to the request or EXPORT_LIMIT: each job has its
+    own row limit (maxRows). Returns 422 if more rows match than maxRows.
+
+    Poll the Location (status) until the job is completed, then fetch
+    /exports/{jobId}/download.
+    """
+    service = get_from_di_container(IExportJobService)
+
+    job = service.create_job(export_request)
+    run_property_export.delay(job.id)
+
+    response.headers["Location"] = f"{request.url.path}/{job.id}"
+    return job
+
+
+def _get_export_job(service: IExportJobService, job_id: str) -> ExportJob:
+    job = service.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "export_not_found",
+                "message": f"Export with ID {job_id} not found",
+            },
+        )
+    return job
+
+
+@router.get("/exports/{job_id}", response_model=ExportJob, read_only=True)
+def get_export(job_id: str) -> ExportJob:
+    """
+    Get status and progress (processedRows of totalRows) of an export job.
+
+    Jobs expire EXPORT_JOB_TTL after their last update.
+    """
+    service = get_from_di_container(IExportJobService)
+    return _get_export_job(service, job_id)
+
+
+@router.get("/exports/{job_id}/download", response_model=None, read_only=True)
+def download_export(job_id: str) -> FileResponse:
+    """
+    Download the file of a completed export job.
+
+    Supports Range requests, so interrupted downloads can be resumed.
+    Returns 409 while the job isn't completed.
+    """
+    service = get_from_di_container(IExportJobService)
+    job = _get_export_job(service, job_id)
+
+    return FileResponse(
+        service.get_job_file(job),
+        media_type=EXPORT_MEDIA_TYPES[job.request.format],
+        filename=job.file_name,
+    )
+
+
+@router.post("/saved-searches", response_model=SavedSearchResponse, status_code=201)
+def create_saved_search(saved_search: SavedSearchCreate) -> SavedSearchResponse:
+    """
+    Save a search, to be alerted of new listings matching its filters.
+
+    Listings added or changed from now on that match the filters (the list
+    endpoint's filters) are POSTed to webhookUrl, batched per saved search,
+    within a minute. Failed deliveries are retried.
+
+    webhookUrl must be a public host (loopback, private and link-local
+    addresses are refused) and isn't returned by the API.
+    """
+    service = get_from_di_container(ISavedSearchService)
+    return service.create_saved_search(saved_search)
+
+
+@router.get("/saved-searches", response_model=SavedSearchesResponse, read_only=True)
+def list_saved_searches() -> SavedSearchesResponse:
+    """Get all saved searches, oldest first, without their webhook URLs."""
+    service = get_from_di_container(ISavedSearchService)
+    return SavedSearchesResponse(items=service.list_saved_searches())
+
+
+@router.delete("/saved-searches/{saved_search_id}", status_code=204)
+def delete_saved_search(saved_search_id: int) -> Response:
+    """
+    Delete a saved search, its undelivered alerts are dropped.
+
+    Returns 404 if the saved search doesn't exist.
+    """
+    service = get_from_di_container(ISavedSearchService)
+    if not service.delete_saved_search(saved_search_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "saved_search_not_found",
+                "message": f"Saved search with ID {saved_search_id} not found",
+            },
+        )
+    return Response(status_code=204)
+
+
+@router.get("/{property_id}", response_model=PropertyResponse, read_only=True)
+def get_property(
+    property_id: int,
+    fields: Annotated[str | None, Query(description=FIELDS_DESCRIPTION)] = None,
+) -> BasePropertyResponse | Response:
     """
     Get a single property by ID.
 
@@ -166,8 +555,9 @@ def get_property(property_id: int) -> PropertyResponse:
     """
     service = get_from_di_container(IPropertyService)
 
-    property_obj = service.get_property(property_id)
-    if not property_obj:
+    field_names = parse_property_fields(fields)
+    property_response = service.get_property(property_id, field_names)
+    if not property_response:
         raise HTTPException(
             status_code=404,
             detail={
@@ -176,4 +566,42 @@ def get_property(property_id: int) -> PropertyResponse:
             },
         )
 
-    return PropertyResponse.from_model(property_obj)
+    # Sparse responses don't satisfy response_model, serialize them directly
+    if field_names:
+        return Response(
+            content=property_response.model_dump_json(by_alias=True),
+            media_type="application/json",
+        )
+
+    return property_response
+
+
+@router.get(
+    "/{property_id}/similar", response_model=SimilarPropertiesResponse, read_only=True
+)
+def get_similar_properties(
+    property_id: int,
+    limit: Annotated[
+        int, Query(ge=1, le=50, description="Maximum number of listings")
+    ] = 10,
+) -> SimilarPropertiesResponse:
+    """
+    Get listings similar to a property, most similar first.
+
+    Similar listings are in the same city and of the same property type, with
+    the closest price, area and number of rooms. Returns 404 if property not
+    found or deleted, and 503 (with Retry-After) while the similarity index of
+    a just started API process is being built.
+    """
+    service = get_from_di_container(ISimilarityService)
+
+    similar = service.get_similar_properties(property_id, limit)
+    if similar is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "property_not_found",
+                "message": f"Property with ID {property_id} not found",
+            },
+        )
+    return SimilarPropertiesResponse(items=similar)
@@ -1,15 +1,95 @@
 from __future__ import annotations
 
+from app.properties.schemas.change_schemas import (
+    MAX_CHANGES_LIMIT,
+    ChangeOperation,
+    PropertyChange,
+    PropertyChangesResponse,
+)
+from app.properties.schemas.distribution_schemas import (
+    MAX_DISTRIBUTION_BINS,
+    DistributionGroup,
+    DistributionQuery,
+    HistogramBin,
+    Percentile,
+    PropertyDistributionResponse,
+    ValueDistribution,
+)
+from app.properties.schemas.export_job_schemas import (
+    ExportFormat,
+    ExportJob,
+    ExportJobCreate,
+    ExportJobStatus,
+)
 from app.properties.schemas.property_schemas import (
+    BasePropertyResponse,
     CitiesResponse,
+    FullPropertyListResponse,
     PlatformsResponse,
+    PropertyChangeNotification,
+    PropertyFilterParams,
     PropertyListResponse,
     PropertyResponse,
+    SimilarPropertiesResponse,
+    parse_property_fields,
+    sparse_property_response,
+)
+from app.properties.schemas.query_batch_schemas import (
+    MAX_BATCH_QUERIES,
+    FullPropertyQueryBatchResponse,
+    PropertyQuery,
+    PropertyQueryBatchRequest,
+    PropertyQueryBatchResponse,
+)
+from app.properties.schemas.saved_search_schemas import (
+    SavedSearchAlert,
+    SavedSearchCreate,
+    SavedSearchesResponse,
+    SavedSearchResponse,
+)
+from app.properties.schemas.suggestion_schemas import (
+    Suggestion,
+    SuggestionKind,
+    SuggestionsResponse,
 )
 
 __all__ = [
+    "MAX_BATCH_QUERIES",
+    "MAX_CHANGES_LIMIT",
+    "MAX_DISTRIBUTION_BINS",
+    "BasePropertyResponse",
+    "ChangeOperation",
     "CitiesResponse",
+    "DistributionGroup",
+    "DistributionQuery",
+    "ExportFormat",
+    "ExportJob",
+    "ExportJobCreate",
+    "ExportJobStatus",
+    "FullPropertyListResponse",
+    "FullPropertyQueryBatchResponse",
+    "HistogramBin",
+    "Percentile",
     "PlatformsResponse",
+    "PropertyChange",
+    "PropertyChangeNotification",
+    "PropertyChangesResponse",
+    "PropertyDistributionResponse",
+    "PropertyFilterParams",
     "PropertyListResponse",
+    "PropertyQuery",
+    "PropertyQueryBatchRequest",
+    "PropertyQueryBatchResponse",
     "PropertyResponse",
+    "SavedSearchAlert",
+    "SavedSearchCreate",
+    "SavedSearchResponse",
+    "SavedSearchesResponse",
+    "SimilarPropertiesResponse",
+    "Suggestion",
+    "SuggestionKind",
+    "SuggestionsResponse",
+    "ValueDistribution",
+    "parse_property_fields",
+    "sparse_property_response",
 ]
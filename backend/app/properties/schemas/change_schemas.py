@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import enum
+
+from app.properties.schemas.property_schemas import PropertyResponse
+from app.utils.schemas import CamelCaseModel
+
+# Upper bound for the number of changes a request can ask for
+MAX_CHANGES_LIMIT = 1_000
+
+
+class ChangeOperation(str, enum.Enum):
+    """Kind of a property change"""
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+class PropertyChange(CamelCaseModel):
+    """A listing added or changed (with its data), or deleted (ID only)."""
+
+    # Position of the change in the feed, resuming from it skips the change
+    token: int
+    operation: ChangeOperation
+    id: int
+    property: PropertyResponse | None
+
+
+class PropertyChangesResponse(CamelCaseModel):
+    """Response schema for a page of the change feed, in commit order."""
+
+    items: list[PropertyChange]
+    # Pass as `since` to get the following changes
+    next_token: int
+    has_more: bool
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from app.properties.models.property import PropertyType
+from app.properties.schemas.property_schemas import PropertyFilterParams
+from app.utils.schemas import CamelCaseModel
+
+# Upper bound for the number of histogram bins a request can ask for
+MAX_DISTRIBUTION_BINS = 200
+
+
+class DistributionQuery(PropertyFilterParams):
+    """Query parameters of the distribution endpoint: list filters and bins."""
+
+    bins: int | None = Field(
+        default=None,
+        ge=1,
+        le=MAX_DISTRIBUTION_BINS,
+        description="Histogram bins (DISTRIBUTION_DEFAULT_BINS if omitted)",
+    )
+
+
+class HistogramBin(CamelCaseModel):
+    """Listings with a value in [lower, upper), the last bin includes upper."""
+
+    lower: float
+    upper: float
+    count: int
+
+
+class Percentile(CamelCaseModel):
+    """Value below which `percentile` percent of the listings fall."""
+
+    percentile: int
+    value: float
+
+
+class ValueDistribution(CamelCaseModel):
+    """Distribution of one numeric column, over listings that have a value."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    percentiles: list[Percentile]
+    histogram: list[HistogramBin]
+
+
+class DistributionGroup(CamelCaseModel):
+    """Price and area distributions of the listings of one city and property type."""
+
+    city: str
+    property_type: PropertyType | None
+    count: int
+    price_eur: ValueDistribution | None
+    area_sqm: ValueDistribution | None
+
+
+class PropertyDistributionResponse(CamelCaseModel):
+    """Response schema for price/area distributions, largest groups first."""
+
+    total: int
+    groups: list[DistributionGroup]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from app.properties.schemas.property_schemas import PropertyFilterParams
+from app.utils.schemas import CamelCaseModel
+
+type ExportFormat = Literal["csv", "ndjson", "parquet", "arrow"]
+
+
+class ExportJobStatus(str, enum.Enum):
+    """Lifecycle of a background export job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportJobCreate(PropertyFilterParams):
+    """Request schema for a background export, filters match the list endpoint."""
+
+    format: ExportFormat = "csv"
+    max_rows: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of rows for this job (default EXPORT_JOB_DEFAULT_MAX_ROWS)",
+    )
+
+
+class ExportJob(CamelCaseModel):
+    """State of a background export job (stored in Redis, returned as status)."""
+
+    id: str
+    status: ExportJobStatus
+    request: ExportJobCreate
+    max_rows: int
+    total_rows: int
+    processed_rows: int = 0
+    file_name: str
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -1,12 +1,56 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
+from functools import cache
+from typing import Self, cast
 
+from pydantic import Field, SerializeAsAny, create_model
+
+from app.properties.exceptions import UnknownFieldException
 from app.properties.models.property import Property, PropertySource, PropertyType
 from app.utils.schemas import CamelCaseModel
 
+# Numeric columns load as Decimal
+_NUMERIC_FIELDS = frozenset({"price_eur", "area_sqm"})
+
+
+def _float_or_none(value: Decimal | float | None) -> float | None:
+    return float(value) if value is not None else None
+
+
+class BasePropertyResponse(CamelCaseModel):
+    """Base of full (PropertyResponse) and sparse property responses."""
+
+    @classmethod
+    def from_model(cls, property: Property) -> Self:
+        """
+        Create response from Property model, copying only this class's fields.
+
+        Args:
+            property: Property model instance
+
+        Returns:
+            Response with stored display fields
+        """
+        values = {name: getattr(property, name) for name in cls.model_fields}
+        for name in _NUMERIC_FIELDS.intersection(values):
+            values[name] = _float_or_none(values[name])
+
+        # Rows come from the database already typed, skip validation
+        return cast(Self, cls.model_construct(**values))
 
-class PropertyResponse(CamelCaseModel):
+    @classmethod
+    def to_ndjson(cls, properties: list[Property]) -> bytes:
+        """Serialize properties as newline-terminated JSON objects."""
+        serializer = cls.__pydantic_serializer__
+        return b"".join(
+            serializer.to_json(cls.from_model(prop), by_alias=True) + b"\n"
+            for prop in properties
+        )
+
+
+class PropertyResponse(BasePropertyResponse):
     """Response schema for a single property."""
 
     id: int
@@ -36,54 +80,72 @@ class PropertyResponse(CamelCaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @classmethod
-    def from_model(cls, property: Property) -> PropertyResponse:
-        """
-        Create PropertyResponse from Property model.
 
-        Args:
-            property: Property model instance
+@cache
+def sparse_property_response(fields: frozenset[str]) -> type[BasePropertyResponse]:
+    """
+    Get a response model with a subset of PropertyResponse fields.
 
-        Returns:
-            PropertyResponse with formatted display fields
-        """
-        # Format price for display
-        price_display = property.price_raw
-        if property.price_eur is not None:
-            # Format with thousands separator
-            price_display = f"€{property.price_eur:,.0f}".replace(",", ".")
-
-        # Format area for display
-        area_display = property.area_raw
-        if property.area_sqm is not None and not property.area_raw:
-            area_display = f"{property.area_sqm:.0f} m²"
-
-        return cls(
-            id=property.id,
-            source=property.source,
-            link=property.link,
-            city=property.city,
-            location=property.location,
-            title=property.title,
-            property_type=property.property_type,
-            price_raw=property.price_raw,
-            area_raw=property.area_raw,
-            rooms_raw=property.rooms_raw,
-            price_eur=property.price_eur,
-            area_sqm=property.area_sqm,
-            rooms=property.rooms,
-            price_display=price_display,
-            area_display=area_display,
-            image_url=property.image_url,
-            created_at=property.created_at,
-            updated_at=property.updated_at,
-        )
+    Args:
+        fields: PropertyResponse field names (snake_case)
+
+    Returns:
+        Model class with the given fields, in PropertyResponse order
+    """
+    return create_model(  # type: ignore[no-any-return,call-overload]
+        "SparsePropertyResponse",
+        __base__=BasePropertyResponse,
+        **{
+            name: (field.annotation, ...)
+            for name, field in PropertyResponse.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+def parse_property_fields(fields: str | None) -> list[str] | None:
+    """
+    Parse the `fields` query parameter of property endpoints.
+
+    Accepts comma-separated camelCase (or snake_case) names of PropertyResponse
+    fields. `id` is always included so items can be linked to their details.
+
+    Args:
+        fields: Query parameter value, e.g. "id,priceEur,city,title"
+
+    Returns:
+        Field names (snake_case) in PropertyResponse order, or None for all fields
+
+    Raises:
+        UnknownFieldException: If a field name is unknown
+    """
+    if not fields:
+        return None
+
+    names_by_alias = {
+        field.alias or name: name
+        for name, field in PropertyResponse.model_fields.items()
+    }
+    requested = {"id"}
+    for raw_name in fields.split(","):
+        name = raw_name.strip()
+        if not name:
+            continue
+        if name in names_by_alias:
+            requested.add(names_by_alias[name])
+        elif name in PropertyResponse.model_fields:
+            requested.add(name)
+        else:
+            raise UnknownFieldException(name, list(names_by_alias))
+
+    return [name for name in PropertyResponse.model_fields if name in requested]
 
 
 class PropertyListResponse(CamelCaseModel):
     """Response schema for paginated property list."""
 
-    items: list[PropertyResponse]
+    # Full or sparse items, serialized by their runtime class
+    items: list[SerializeAsAny[BasePropertyResponse]]
     total: int
     page: int
     size: int
@@ -96,6 +158,7 @@ class PropertyListResponse(CamelCaseModel):
         total: int,
         page: int,
         size: int,
+        item_class: type[BasePropertyResponse] = PropertyResponse,
     ) -> PropertyListResponse:
         """
         Create PropertyListResponse from list of properties.
@@ -105,14 +168,15 @@ class PropertyListResponse(CamelCaseModel):
             total: Total count of properties (before pagination)
             page: Current page number
             size: Page size
+            item_class: Item model, PropertyResponse or a sparse response
 
         Returns:
             PropertyListResponse with pagination metadata
         """
-        items = [PropertyResponse.from_model(prop) for prop in properties]
+        items = [item_class.from_model(prop) for prop in properties]
         pages = (total + size - 1) // size if total > 0 else 0
 
-        return cls(
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
@@ -120,6 +184,53 @@ class PropertyListResponse(CamelCaseModel):
             pages=pages,
         )
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to camelCase JSON in a single pass through pydantic-core.
+
+        Produces the same document FastAPI would for this model, without
+        re-validating and walking it through `jsonable_encoder` first.
+        """
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
+
+class FullPropertyListResponse(CamelCaseModel):
+    """
+    Paginated property list with full items, documents PropertyListResponse.
+
+    Used only for OpenAPI: PropertyListResponse's items are typed by their
+    sparse base class, whose schema has no properties.
+    """
+
+    items: list[PropertyResponse]
+    total: int
+    page: int
+    size: int
+    pages: int
+
+
+class PropertyFilterParams(CamelCaseModel):
+    """Property filters in request bodies, matching the list endpoint's query parameters."""
+
+    cities: list[str] | None = None
+    property_types: list[PropertyType] | None = None
+    sources: list[PropertySource] | None = None
+    min_price: float | None = Field(default=None, ge=0)
+    max_price: float | None = Field(default=None, ge=0)
+    min_area: float | None = Field(default=None, ge=0)
+    max_area: float | None = Field(default=None, ge=0)
+    rooms: list[int] | None = None
+    search: str | None = Field(default=None, min_length=2, max_length=200)
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+
+
+class SimilarPropertiesResponse(CamelCaseModel):
+    """Response schema for similar listings, most similar first."""
+
+    items: list[PropertyResponse]
+
 
 class CitiesResponse(CamelCaseModel):
     """Response schema for cities list."""
@@ -131,3 +242,15 @@ class PlatformsResponse(CamelCaseModel):
     """Response schema for platforms/sources list."""
 
     platforms: list[PropertySource]
+
+
+class PropertyChangeNotification(CamelCaseModel):
+    """
+    Payload of property data-change notifications (Postgres NOTIFY).
+
+    None means the affected sources/cities are unknown, consumers must treat
+    the change as affecting all of them.
+    """
+
+    sources: list[PropertySource] | None = None
+    cities: list[str] | None = None
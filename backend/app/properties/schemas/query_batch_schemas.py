@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from app.properties.schemas.property_schemas import (
+    FullPropertyListResponse,
+    PropertyFilterParams,
+    PropertyListResponse,
+)
+from app.utils.schemas import CamelCaseModel
+
+# Filter sets per batch request, a dashboard's widgets, not bulk exports
+MAX_BATCH_QUERIES = 20
+
+
+class PropertyQuery(PropertyFilterParams):
+    """One filter set of a batch query, with the list endpoint's pagination."""
+
+    page: int = Field(default=1, ge=1)
+    size: int = Field(default=50, ge=1, le=500)
+    fields: str | None = Field(
+        default=None,
+        description="Comma-separated fields to return, all fields if omitted",
+    )
+
+
+class PropertyQueryBatchRequest(CamelCaseModel):
+    """Request schema for running several property list queries at once."""
+
+    queries: list[PropertyQuery] = Field(min_length=1, max_length=MAX_BATCH_QUERIES)
+
+
+class PropertyQueryBatchResponse(CamelCaseModel):
+    """Response schema for a batch query, one list result per query, in order."""
+
+    results: list[PropertyListResponse]
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to camelCase JSON in a single pass (see PropertyListResponse)."""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
+
+class FullPropertyQueryBatchResponse(CamelCaseModel):
+    """Batch query response with full items, documents PropertyQueryBatchResponse."""
+
+    results: list[FullPropertyListResponse]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Self
+
+from pydantic import AfterValidator, Field, HttpUrl, UrlConstraints
+
+from app.properties.models.saved_search import SavedSearch
+from app.properties.schemas.property_schemas import (
+    PropertyFilterParams,
+    PropertyResponse,
+)
+from app.utils.network import check_host_literal
+from app.utils.schemas import CamelCaseModel
+
+
+def _check_webhook_host(url: HttpUrl) -> HttpUrl:
+    # Hostnames are resolved and checked again on every delivery
+    check_host_literal(url.host or "")
+    return url
+
+
+# Alerts are POSTed by a worker inside the network, internal hosts are refused
+WebhookUrl = Annotated[
+    HttpUrl, UrlConstraints(max_length=2048), AfterValidator(_check_webhook_host)
+]
+
+
+class SavedSearchCreate(CamelCaseModel):
+    """Request body creating a saved search."""
+
+    name: str = Field(min_length=1, max_length=255)
+    webhook_url: WebhookUrl = Field(
+        description="New listings matching the filters are POSTed here, must be "
+        "a public host"
+    )
+    filters: PropertyFilterParams = Field(default_factory=PropertyFilterParams)
+
+
+class SavedSearchResponse(CamelCaseModel):
+    """Response schema for a saved search, without its (private) webhook URL."""
+
+    id: int
+    name: str
+    filters: PropertyFilterParams
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, saved_search: SavedSearch) -> Self:
+        """Create response from SavedSearch model."""
+        return cls(
+            id=saved_search.id,
+            name=saved_search.name,
+            filters=PropertyFilterParams.model_validate(saved_search.filters),
+            created_at=saved_search.created_at,
+        )
+
+
+class SavedSearchesResponse(CamelCaseModel):
+    """Response schema for saved searches, oldest first."""
+
+    items: list[SavedSearchResponse]
+
+
+class SavedSearchAlert(CamelCaseModel):
+    """Webhook payload: listings that matched a saved search since the last alert."""
+
+    saved_search_id: int
+    name: str
+    properties: list[PropertyResponse]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import enum
+
+from app.utils.schemas import CamelCaseModel
+
+
+class SuggestionKind(str, enum.Enum):
+    """Where a search suggestion comes from."""
+
+    CITY = "city"
+    LOCATION = "location"
+    TITLE = "title"
+
+
+class Suggestion(CamelCaseModel):
+    """Search box suggestion, count is the number of matching listings."""
+
+    text: str
+    kind: SuggestionKind
+    count: int
+
+
+class SuggestionsResponse(CamelCaseModel):
+    """Response schema for search suggestions, best first."""
+
+    suggestions: list[Suggestion]
@@ -1,14 +1,56 @@
 from __future__ import annotations
 
+from app.properties.services.columnar_export_service import (
+    ColumnarExportService,
+    IColumnarExportService,
+)
 from app.properties.services.csv_export_service import (
     CSVExportService,
     ICSVExportService,
 )
+from app.properties.services.distribution_service import (
+    DistributionService,
+    IDistributionService,
+)
+from app.properties.services.export_job_service import (
+    ExportJobService,
+    IExportJobService,
+)
+from app.properties.services.property_archive_service import (
+    IPropertyArchiveService,
+    PropertyArchiveService,
+)
 from app.properties.services.property_service import IPropertyService, PropertyService
+from app.properties.services.saved_search_service import (
+    ISavedSearchService,
+    SavedSearchService,
+)
+from app.properties.services.similarity_service import (
+    ISimilarityService,
+    SimilarityService,
+)
+from app.properties.services.suggestion_service import (
+    ISuggestionService,
+    SuggestionService,
+)
 
 __all__ = [
     "CSVExportService",
+    "ColumnarExportService",
+    "DistributionService",
+    "ExportJobService",
     "ICSVExportService",
+    "IColumnarExportService",
+    "IDistributionService",
+    "IExportJobService",
+    "IPropertyArchiveService",
     "IPropertyService",
+    "ISavedSearchService",
+    "ISimilarityService",
+    "ISuggestionService",
+    "PropertyArchiveService",
     "PropertyService",
+    "SavedSearchService",
+    "SimilarityService",
+    "SuggestionService",
 ]
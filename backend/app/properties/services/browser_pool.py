@@ -12,6 +12,11 @@ from typing import Protocol
 from playwright.sync_api import Browser, PlaywrightContextManager, sync_playwright
 
 from app.config.settings import Settings
+from app.properties.metrics import (
+    BROWSER_POOL_CHECKOUT_WAIT,
+    BROWSER_POOL_IDLE,
+    BROWSER_POOL_WAITING,
+)
 from app.utils.di import inject
 
 logger = logging.getLogger(__name__)
@@ -75,12 +80,15 @@ class BrowserPool:
         Raises:
             Empty: If no browser is available within the timeout period.
         """
-        browser = self._checkout_browser()
+        with BROWSER_POOL_WAITING.track_inprogress(), BROWSER_POOL_CHECKOUT_WAIT.time():
+            browser = self._checkout_browser()
+        BROWSER_POOL_IDLE.set(self._browsers.qsize())
         logger.debug("Browser checked out from pool")
         try:
             yield browser
         finally:
             self._return_browser(browser)
+            BROWSER_POOL_IDLE.set(self._browsers.qsize())
             logger.debug("Browser returned to pool")
 
     def _checkout_browser(self) -> Browser:
@@ -141,6 +149,7 @@ class BrowserPool:
             except Empty:
                 break
 
+        BROWSER_POOL_IDLE.set(0)
         logger.info(f"Closed {closed_count} browsers")
 
         # Stop Playwright context
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, Literal, Protocol
+
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from app.properties.models.property import Property, PropertySource, PropertyType
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+type ColumnarFormat = Literal["parquet", "arrow"]
+
+MEDIA_TYPES: dict[ColumnarFormat, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# Rows per Parquet row group / Arrow record batch
+ROW_GROUP_SIZE = 10_000
+
+# Same columns as the CSV export, typed
+PROPERTY_SCHEMA = pl.Schema(
+    {
+        "id": pl.Int64,
+        "source": pl.Enum([source.value for source in PropertySource]),
+        "city": pl.Categorical(),
+        "location": pl.String,
+        "title": pl.String,
+        "propertyType": pl.Enum([type_.value for type_ in PropertyType]),
+        "priceEur": pl.Float64,
+        "priceRaw": pl.String,
+        "areaSqm": pl.Float64,
+        "areaRaw": pl.String,
+        "rooms": pl.Int32,
+        "roomsRaw": pl.String,
+        "link": pl.String,
+        "imageUrl": pl.String,
+        # Stored as naive UTC
+        "createdAt": pl.Datetime("us", "UTC"),
+        "updatedAt": pl.Datetime("us", "UTC"),
+    }
+)
+
+
+class IColumnarExportService(Protocol):
+    """Protocol interface for Parquet/Arrow export service."""
+
+    def write_properties(
+        self,
+        batches: Iterable[list[Property]],
+        format: ColumnarFormat,
+        output: IO[bytes],
+    ) -> int:
+        """Write batches of properties to output. Returns count of written rows."""
+        ...
+
+
+@inject(alias=IColumnarExportService, singleton=True)
+class ColumnarExportService(IColumnarExportService):
+    """
+    Service for exporting properties to columnar formats (Parquet, Arrow IPC).
+
+    Batches are fed to a Polars streaming sink, which writes them out in row
+    groups as they arrive, so the whole result is never held in memory.
+    Columns are typed: enums as Enum (dictionary encoded), timestamps as
+    UTC datetimes and numbers as floats/ints.
+    """
+
+    def write_properties(
+        self,
+        batches: Iterable[list[Property]],
+        format: ColumnarFormat,
+        output: IO[bytes],
+    ) -> int:
+        """
+        Write properties to a Parquet or Arrow IPC file.
+
+        Args:
+            batches: Batches of properties, e.g. from a streaming query
+            format: parquet or arrow (Arrow IPC file)
+            output: Binary file to write to
+
+        Returns:
+            Count of written rows
+        """
+        written = 0
+
+        def frames(*_args: Any) -> Iterator[pl.DataFrame]:
+            nonlocal written
+            for batch in batches:
+                written += len(batch)
+                yield self._to_frame(batch)
+
+        lazy_frame = register_io_source(frames, schema=PROPERTY_SCHEMA)
+        if format == "parquet":
+            lazy_frame.sink_parquet(output, row_group_size=ROW_GROUP_SIZE)
+        else:
+            lazy_frame.sink_ipc(output, record_batch_size=ROW_GROUP_SIZE)
+
+        logger.info(f"Exported {written} properties to {format}")
+        return written
+
+    def _to_frame(self, properties: list[Property]) -> pl.DataFrame:
+        rows = [
+            (
+                prop.id,
+                prop.source.value,
+                prop.city,
+                prop.location,
+                prop.title,
+                prop.property_type.value if prop.property_type else None,
+                float(prop.price_eur) if prop.price_eur is not None else None,
+                prop.price_raw,
+                float(prop.area_sqm) if prop.area_sqm is not None else None,
+                prop.area_raw,
+                prop.rooms,
+                prop.rooms_raw,
+                prop.link,
+                prop.image_url,
+                prop.created_at,
+                prop.updated_at,
+            )
+            for prop in properties
+        ]
+        return pl.DataFrame(rows, schema=PROPERTY_SCHEMA, orient="row")
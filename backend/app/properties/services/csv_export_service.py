@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import Protocol
+from typing import IO, Protocol
 
 import polars as pl
 
@@ -14,6 +15,9 @@ from app.utils.di import inject
 
 logger = logging.getLogger(__name__)
 
+# Added for Excel compatibility
+UTF8_BOM = b"\xef\xbb\xbf"
+
 
 class ICSVExportService(Protocol):
     """Protocol interface for CSV export service."""
@@ -22,7 +26,15 @@ class ICSVExportService(Protocol):
         """Export properties to CSV format."""
         ...
 
-    def generate_filename(self, filters: PropertyFilters) -> str:
+    def write_properties(
+        self, batches: Iterable[list[Property]], output: IO[bytes]
+    ) -> int:
+        """Write batches of properties as CSV. Returns count of written rows."""
+        ...
+
+    def generate_filename(
+        self, filters: PropertyFilters, extension: str = "csv"
+    ) -> str:
         """Generate descriptive filename from filters."""
         ...
 
@@ -45,6 +57,47 @@ class CSVExportService(ICSVExportService):
         Returns:
             BytesIO buffer containing CSV data with UTF-8 BOM
         """
+        # Create Polars DataFrame
+        df = self._to_frame(properties)
+
+        # Write to BytesIO buffer
+        buffer = BytesIO()
+
+        # Add UTF-8 BOM for Excel compatibility
+        buffer.write(UTF8_BOM)
+
+        # Write CSV
+        df.write_csv(buffer)
+
+        # Reset buffer position
+        buffer.seek(0)
+
+        logger.info(f"Exported {len(properties)} properties to CSV")
+        return buffer
+
+    def write_properties(
+        self, batches: Iterable[list[Property]], output: IO[bytes]
+    ) -> int:
+        """
+        Write properties to CSV batch by batch, e.g. from a streaming query.
+
+        Args:
+            batches: Batches of properties
+            output: Binary file to write to
+
+        Returns:
+            Count of written rows
+        """
+        output.write(UTF8_BOM)
+        written = 0
+        for batch in batches:
+            self._to_frame(batch).write_csv(output, include_header=written == 0)
+            written += len(batch)
+
+        logger.info(f"Exported {written} properties to CSV")
+        return written
+
+    def _to_frame(self, properties: list[Property]) -> pl.DataFrame:
         # Convert properties to dictionaries with selected columns
         data = [
             {
@@ -53,7 +106,9 @@ class CSVExportService(ICSVExportService):
                 "city": prop.city,
                 "location": prop.location,
                 "title": prop.title,
-                "propertyType": prop.property_type.value if prop.property_type else None,
+                "propertyType": (
+                    prop.property_type.value if prop.property_type else None
+                ),
                 "priceEur": float(prop.price_eur) if prop.price_eur else None,
                 "priceRaw": prop.price_raw,
                 "areaSqm": float(prop.area_sqm) if prop.area_sqm else None,
@@ -67,33 +122,19 @@ class CSVExportService(ICSVExportService):
             }
             for prop in properties
         ]
+        return pl.DataFrame(data)
 
-        # Create Polars DataFrame
-        df = pl.DataFrame(data)
-
-        # Write to BytesIO buffer
-        buffer = BytesIO()
-
-        # Add UTF-8 BOM for Excel compatibility
-        buffer.write(b"\xef\xbb\xbf")
-
-        # Write CSV
-        df.write_csv(buffer)
-
-        # Reset buffer position
-        buffer.seek(0)
-
-        logger.info(f"Exported {len(properties)} properties to CSV")
-        return buffer
-
-    def generate_filename(self, filters: PropertyFilters) -> str:  # noqa: C901
+    def generate_filename(  # noqa: C901
+        self, filters: PropertyFilters, extension: str = "csv"
+    ) -> str:
         """
         Generate descriptive filename from filters.
 
-        Format: properties_export_YYYYMMDD_HHMMSS[_filter_summary].csv
+        Format: properties_export_YYYYMMDD_HHMMSS[_filter_summary].<extension>
 
         Args:
             filters: PropertyFilters to generate summary from
+            extension: File extension (csv, parquet, arrow)
 
         Returns:
             Sanitized filename string
@@ -149,9 +190,9 @@ class CSVExportService(ICSVExportService):
             # Sanitize and limit length
             filter_summary = re.sub(r"[^\w\s-]", "", filter_summary)
             filter_summary = filter_summary[:100]  # Max 100 chars
-            filename = f"{base}_{filter_summary}.csv"
+            filename = f"{base}_{filter_summary}.{extension}"
         else:
-            filename = f"{base}.csv"
+            filename = f"{base}.{extension}"
 
         # Final sanitization
         filename = filename.lower().replace(" ", "_")
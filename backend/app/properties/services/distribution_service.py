@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+import polars as pl
+
+from app.properties.models.property import PropertyType
+from app.properties.schemas import (
+    DistributionGroup,
+    HistogramBin,
+    Percentile,
+    PropertyDistributionResponse,
+    ValueDistribution,
+)
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+# Percentile bands reported for every column (median and 50/80/90% bands)
+DISTRIBUTION_PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+# Columns distributions are computed for, as returned by the repository
+DISTRIBUTION_COLUMNS = ("price_eur", "area_sqm")
+
+_GROUP_BY = ["city", "property_type"]
+
+_ROW_SCHEMA = pl.Schema(
+    {
+        "city": pl.String,
+        "property_type": pl.String,
+        "price_eur": pl.Float64,
+        "area_sqm": pl.Float64,
+    }
+)
+
+type GroupKey = tuple[str, str | None]
+
+
+class IDistributionService(Protocol):
+    """Protocol interface for price/area distribution statistics."""
+
+    def compute(
+        self,
+        batches: Iterable[
+            list[tuple[str, PropertyType | None, float | None, float | None]]
+        ],
+        bins: int,
+    ) -> PropertyDistributionResponse:
+        """Compute distributions per city and property type from batches of rows."""
+        ...
+
+
+@inject(alias=IDistributionService, singleton=True)
+class DistributionService(IDistributionService):
+    """Histograms and percentiles of listing prices and areas, computed with Polars."""
+
+    def compute(
+        self,
+        batches: Iterable[
+            list[tuple[str, PropertyType | None, float | None, float | None]]
+        ],
+        bins: int,
+    ) -> PropertyDistributionResponse:
+        """
+        Compute distributions per city and property type.
+
+        Batches are collected into one frame of four numeric/label columns,
+        statistics and bin counts of all groups are then computed vectorized.
+        Histograms split each group's [min, max] range into `bins` equal-width
+        bins (a single bin when all values are equal).
+
+        Args:
+            batches: Batches of (city, property type, price EUR, area m²) rows
+            bins: Number of histogram bins
+
+        Returns:
+            PropertyDistributionResponse, largest groups first
+        """
+        frames = [
+            pl.DataFrame(batch, schema=_ROW_SCHEMA, orient="row") for batch in batches
+        ]
+        rows = pl.concat(frames) if frames else _ROW_SCHEMA.to_frame()
+
+        group_counts = (
+            rows.group_by(_GROUP_BY)
+            .len("count")
+            .sort(["count", *_GROUP_BY], descending=[True, False, False])
+        )
+        distributions = {
+            column: _distributions(rows, column, bins)
+            for column in DISTRIBUTION_COLUMNS
+        }
+
+        groups = [
+            DistributionGroup(
+                city=city,
+                property_type=PropertyType(type_) if type_ is not None else None,
+                count=count,
+                price_eur=distributions["price_eur"].get((city, type_)),
+                area_sqm=distributions["area_sqm"].get((city, type_)),
+            )
+            for city, type_, count in group_counts.iter_rows()
+        ]
+        logger.info(
+            f"Computed distributions of {len(groups)} groups from {len(rows)} rows"
+        )
+        return PropertyDistributionResponse(total=len(rows), groups=groups)
+
+
+def _distributions(
+    rows: pl.DataFrame, column: str, bins: int
+) -> dict[GroupKey, ValueDistribution]:
+    """Get the distribution of a column per group, for groups having any values."""
+    values = rows.select(*_GROUP_BY, value=pl.col(column)).drop_nulls("value")
+
+    stats = values.group_by(_GROUP_BY).agg(
+        pl.len().alias("count"),
+        pl.col("value").min().alias("min"),
+        pl.col("value").max().alias("max"),
+        pl.col("value").mean().alias("mean"),
+        *(
+            pl.col("value").quantile(percentile / 100, "linear").alias(f"p{percentile}")
+            for percentile in DISTRIBUTION_PERCENTILES
+        ),
+    )
+
+    # Bin index of every value within its group's range, then counts per bin
+    value_range = pl.col("max") - pl.col("min")
+    bin_counts = (
+        values.join(
+            stats.select(*_GROUP_BY, "min", "max"), on=_GROUP_BY, nulls_equal=True
+        )
+        .with_columns(
+            bin=pl.when(value_range > 0)
+            .then(
+                ((pl.col("value") - pl.col("min")) / value_range * bins)
+                .floor()
+                .cast(pl.Int64)
+                .clip(upper_bound=bins - 1)
+            )
+            .otherwise(0)
+        )
+        .group_by(*_GROUP_BY, "bin")
+        .len("count")
+    )
+    histograms: dict[GroupKey, dict[int, int]] = {}
+    for city, type_, bin_, count in bin_counts.iter_rows():
+        histograms.setdefault((city, type_), {})[bin_] = count
+
+    return {
+        (group["city"], group["property_type"]): _value_distribution(
+            group, histograms[(group["city"], group["property_type"])], bins
+        )
+        for group in stats.iter_rows(named=True)
+    }
+
+
+def _value_distribution(
+    stats: dict[str, Any], bin_counts: dict[int, int], bins: int
+) -> ValueDistribution:
+    low, high = stats["min"], stats["max"]
+    if high == low:
+        histogram = [HistogramBin(lower=low, upper=high, count=stats["count"])]
+    else:
+        width = (high - low) / bins
+        histogram = [
+            HistogramBin(
+                lower=low + index * width,
+                # Exactly max for the last bin, despite rounding
+                upper=low + (index + 1) * width if index < bins - 1 else high,
+                count=bin_counts.get(index, 0),
+            )
+            for index in range(bins)
+        ]
+
+    return ValueDistribution(
+        count=stats["count"],
+        min=low,
+        max=high,
+        mean=stats["mean"],
+        percentiles=[
+            Percentile(percentile=percentile, value=stats[f"p{percentile}"])
+            for percentile in DISTRIBUTION_PERCENTILES
+        ],
+        histogram=histogram,
+    )
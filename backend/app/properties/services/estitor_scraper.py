@@ -8,6 +8,8 @@ from typing import Any, ClassVar, Protocol
 
 from playwright.sync_api import ElementHandle, Page
 
+from app.properties.metrics import SCRAPE_LISTINGS_PER_PAGE
+from app.properties.models.property import PropertySource
 from app.properties.services.browser_pool import IBrowserPool
 from app.utils.di import inject
 
@@ -229,6 +231,9 @@ class EstitorScraper(IEstitorScraper):
                         logger.debug(
                             f"Found {len(listings)} listing elements on page {page_num}"
                         )
+                        SCRAPE_LISTINGS_PER_PAGE.labels(
+                            source=PropertySource.ESTITOR.value
+                        ).observe(len(listings))
 
                         # Parse each listing
                         for listing in listings:
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections.abc import Generator, Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Protocol
+
+from app.config.settings import Settings
+from app.properties.exceptions import (
+    ExportNotReadyException,
+    ExportTooLargeException,
+    InvalidExportLimitException,
+)
+from app.properties.models.property import Property
+from app.properties.repositories import (
+    IExportJobRepository,
+    IPropertyRepository,
+    PropertyFilters,
+)
+from app.properties.schemas import (
+    ExportFormat,
+    ExportJob,
+    ExportJobCreate,
+    ExportJobStatus,
+    PropertyResponse,
+)
+from app.properties.services.columnar_export_service import (
+    MEDIA_TYPES as COLUMNAR_MEDIA_TYPES,
+)
+from app.properties.services.columnar_export_service import IColumnarExportService
+from app.properties.services.csv_export_service import ICSVExportService
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": COLUMNAR_MEDIA_TYPES["parquet"],
+    "arrow": COLUMNAR_MEDIA_TYPES["arrow"],
+}
+
+# Minimum time between progress updates written to Redis (seconds)
+PROGRESS_INTERVAL = 1.0
+
+# Suffix of files still being written
+PARTIAL_SUFFIX = ".part"
+
+
+class IExportJobService(Protocol):
+    def create_job(self, request: ExportJobCreate) -> ExportJob:
+        """Validate and register an export job (queued)."""
+        ...
+
+    def get_job(self, job_id: str) -> ExportJob | None:
+        """Get export job state."""
+        ...
+
+    def run_job(self, job_id: str) -> ExportJob | None:
+        """Write the export file of a queued job, reporting progress."""
+        ...
+
+    def get_job_file(self, job: ExportJob) -> Path:
+        """Get the file of a completed job."""
+        ...
+
+    def cleanup_expired_files(self) -> int:
+        """Delete export files older than EXPORT_JOB_TTL. Returns count of deleted files."""
+        ...
+
+
+@inject(alias=IExportJobService, singleton=True)
+class ExportJobService(IExportJobService):
+    """
+    Service for background export jobs.
+
+    The API registers a job (counting matching rows to validate its limit) and
+    a Celery worker writes the file to EXPORT_JOBS_DIR batch by batch from a
+    streaming query, reporting progress to Redis. Row limits are set per job
+    (maxRows, capped by EXPORT_JOB_MAX_ROWS) instead of EXPORT_LIMIT.
+    """
+
+    def __init__(
+        self,
+        repository: IPropertyRepository,
+        job_repository: IExportJobRepository,
+        csv_export_service: ICSVExportService,
+        columnar_export_service: IColumnarExportService,
+        settings: Settings,
+    ):
+        self.repository = repository
+        self.job_repository = job_repository
+        self.csv_export_service = csv_export_service
+        self.columnar_export_service = columnar_export_service
+        self.settings = settings
+        self.directory = Path(settings.EXPORT_JOBS_DIR)
+
+    def create_job(self, request: ExportJobCreate) -> ExportJob:
+        """
+        Validate and register an export job, to be run by `run_job`.
+
+        Args:
+            request: Export format, row limit and filters
+
+        Returns:
+            Queued job
+
+        Raises:
+            InvalidExportLimitException: If maxRows is above EXPORT_JOB_MAX_ROWS
+            ExportTooLargeException: If more rows match than the job's limit
+        """
+        max_rows_limit = self.settings.EXPORT_JOB_MAX_ROWS
+        max_rows = request.max_rows or min(
+            self.settings.EXPORT_JOB_DEFAULT_MAX_ROWS, max_rows_limit
+        )
+        if max_rows > max_rows_limit:
+            raise InvalidExportLimitException(max_rows, max_rows_limit)
+
+        filters = PropertyFilters.from_params(request)
+        total_rows = self.repository.count_properties(filters)
+        if total_rows > max_rows:
+            raise ExportTooLargeException(total_rows, max_rows, max_rows_limit)
+
+        job = ExportJob(
+            id=uuid.uuid4().hex,
+            status=ExportJobStatus.QUEUED,
+            request=request,
+            max_rows=max_rows,
+            total_rows=total_rows,
+            file_name=self.csv_export_service.generate_filename(
+                filters, extension=request.format
+            ),
+            created_at=datetime.now(timezone.utc),
+        )
+        self.job_repository.save(job)
+
+        logger.info(f"Queued {request.format} export {job.id} ({total_rows} rows)")
+        return job
+
+    def get_job(self, job_id: str) -> ExportJob | None:
+        """
+        Get export job state.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            ExportJob if found (and not expired), None otherwise
+        """
+        return self.job_repository.get(job_id)
+
+    def run_job(self, job_id: str) -> ExportJob | None:
+        """
+        Write the export file of a queued job.
+
+        The file is written under a temporary name and renamed once complete,
+        so a download never sees a partial file. Failures are recorded on the
+        job and re-raised.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Completed job, None if the job expired or was already picked up
+        """
+        job = self.job_repository.get(job_id)
+        if job is None or job.status != ExportJobStatus.QUEUED:
+            logger.warning(f"Export {job_id} not found or not queued, skipping")
+            return None
+
+        job.status = ExportJobStatus.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        if not self.job_repository.save_if_status(job, ExportJobStatus.QUEUED):
+            logger.warning(f"Export {job_id} was picked up by another worker, skipping")
+            return None
+
+        path = self._path(job)
+        partial_path = path.with_name(path.name + PARTIAL_SUFFIX)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        batches = self.repository.stream_properties(
+            PropertyFilters.from_params(job.request),
+            limit=job.max_rows,
+            check_cost=False,
+        )
+        try:
+            with partial_path.open("wb") as output:
+                self._write(job, self._track_progress(job, batches), output)
+            partial_path.replace(path)
+        except Exception as e:
+            partial_path.unlink(missing_ok=True)
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+            job.finished_at = datetime.now(timezone.utc)
+            self.job_repository.save(job)
+            raise
+        finally:
+            batches.close()
+
+        job.status = ExportJobStatus.COMPLETED
+        job.finished_at = datetime.now(timezone.utc)
+        self.job_repository.save(job)
+
+        logger.info(f"Completed export {job.id} ({job.processed_rows} rows)")
+        return job
+
+    def get_job_file(self, job: ExportJob) -> Path:
+        """
+        Get the file of a completed job.
+
+        Args:
+            job: Export job
+
+        Returns:
+            Path of the export file
+
+        Raises:
+            ExportNotReadyException: If the job hasn't completed or its file is gone
+        """
+        path = self._path(job)
+        if job.status != ExportJobStatus.COMPLETED or not path.is_file():
+            raise ExportNotReadyException(job.id, job.status.value)
+        return path
+
+    def cleanup_expired_files(self) -> int:
+        """
+        Delete export files (including abandoned partial files) older than EXPORT_JOB_TTL.
+
+        Returns:
+            Count of deleted files
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        cutoff = time.time() - self.settings.EXPORT_JOB_TTL
+        deleted = 0
+        for path in self.directory.iterdir():
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                deleted += 1
+
+        logger.info(f"Deleted {deleted} expired export files")
+        return deleted
+
+    def _write(
+        self, job: ExportJob, batches: Iterable[list[Property]], output: IO[bytes]
+    ) -> None:
+        match job.request.format:
+            case "csv":
+                self.csv_export_service.write_properties(batches, output)
+            case "ndjson":
+                for batch in batches:
+                    output.write(PropertyResponse.to_ndjson(batch))
+            case "parquet" | "arrow" as format:
+                self.columnar_export_service.write_properties(batches, format, output)
+
+    def _track_progress(
+        self, job: ExportJob, batches: Iterable[list[Property]]
+    ) -> Generator[list[Property]]:
+        saved_at = time.monotonic()
+        for batch in batches:
+            yield batch
+            job.processed_rows += len(batch)
+            if time.monotonic() - saved_at >= PROGRESS_INTERVAL:
+                self.job_repository.save(job)
+                saved_at = time.monotonic()
+
+    def _path(self, job: ExportJob) -> Path:
+        return self.directory / f"{job.id}.{job.request.format}"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+from app.config.settings import Settings
+from app.properties.repositories import IPropertyArchiveRepository
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+
+class IPropertyArchiveService(Protocol):
+    """Protocol interface for property archive service."""
+
+    @property
+    def batch_size(self) -> int:
+        """Number of rows moved per archive batch."""
+        ...
+
+    def get_archive_cutoff(self) -> datetime:
+        """Get the deleted_at cutoff for archiving."""
+        ...
+
+    def archive_batch(self, deleted_before: datetime) -> int:
+        """Archive one batch of long-deleted properties. Returns moved count."""
+        ...
+
+    def restore_properties(
+        self, ids: list[int], links: list[str], undelete: bool = False
+    ) -> int:
+        """Restore archived properties by ID or link. Returns restored count."""
+        ...
+
+
+@inject(alias=IPropertyArchiveService, singleton=True)
+class PropertyArchiveService(IPropertyArchiveService):
+    """
+    Service for moving long-deleted properties to cold storage and back.
+
+    Keeps the active `properties` table proportional to live inventory so
+    indexes and vacuum work don't grow with deleted history.
+    """
+
+    def __init__(self, repository: IPropertyArchiveRepository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+
+    @property
+    def batch_size(self) -> int:
+        """Number of rows moved per archive batch."""
+        return self.settings.ARCHIVE_BATCH_SIZE
+
+    def get_archive_cutoff(self) -> datetime:
+        """
+        Get the deleted_at cutoff for archiving.
+
+        Returns:
+            Naive UTC datetime, rows deleted before it are archived
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return now - timedelta(days=self.settings.ARCHIVE_DELETED_AFTER_DAYS)
+
+    def archive_batch(self, deleted_before: datetime) -> int:
+        """
+        Archive one batch of long-deleted properties.
+
+        Args:
+            deleted_before: Archive rows with deleted_at older than this
+
+        Returns:
+            Count of archived rows (0 when nothing is left)
+        """
+        return self.repository.archive_deleted(deleted_before, self.batch_size)
+
+    def restore_properties(
+        self, ids: list[int], links: list[str], undelete: bool = False
+    ) -> int:
+        """
+        Restore archived properties by ID or link.
+
+        Args:
+            ids: Property IDs to restore
+            links: Property links to restore
+            undelete: Also clear deleted_at so restored rows are listed again
+
+        Returns:
+            Count of restored rows
+        """
+        restored = self.repository.restore(ids, links, undelete=undelete)
+        requested = len(ids) + len(links)
+        if restored < requested:
+            logger.warning(
+                f"Restored {restored} of {requested} requested properties "
+                "(missing from the archive or link already live)"
+            )
+        return restored
@@ -29,6 +29,16 @@ class IPropertyParser(Protocol):
         """Map property type string to PropertyType enum."""
         ...
 
+    def format_price_display(self, price_raw: str, price_eur: float | None) -> str:
+        """Format price for display."""
+        ...
+
+    def format_area_display(
+        self, area_raw: str | None, area_sqm: float | None
+    ) -> str | None:
+        """Format area for display."""
+        ...
+
 
 @inject(alias=IPropertyParser, singleton=True)
 class PropertyParser(IPropertyParser):
@@ -206,3 +216,46 @@ class PropertyParser(IPropertyParser):
         except (AttributeError, KeyError) as e:
             logger.warning(f"Failed to parse property type '{type_str}': {e}")
             return PropertyType.UNKNOWN
+
+    def format_price_display(self, price_raw: str, price_eur: float | None) -> str:
+        """
+        Format price for display.
+
+        Examples:
+            ("150.000 €", 150000.0) -> "€150.000"
+            ("Na upit", None) -> "Na upit"
+
+        Args:
+            price_raw: Price string from scraper
+            price_eur: Parsed price
+
+        Returns:
+            Price in EUR with "." thousands separators, or the raw string if
+            it couldn't be parsed
+        """
+        if price_eur is None:
+            return price_raw
+
+        return f"€{price_eur:,.0f}".replace(",", ".")
+
+    def format_area_display(
+        self, area_raw: str | None, area_sqm: float | None
+    ) -> str | None:
+        """
+        Format area for display.
+
+        Examples:
+            ("85 m2", 85.0) -> "85 m2"
+            (None, 85.0) -> "85 m²"
+
+        Args:
+            area_raw: Area string from scraper
+            area_sqm: Parsed area
+
+        Returns:
+            Raw area string if present, otherwise the parsed area in m²
+        """
+        if area_sqm is not None and not area_raw:
+            return f"{area_sqm:.0f} m²"
+
+        return area_raw
@@ -1,40 +1,133 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable, Generator, Iterable
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import Any, Protocol
+from typing import IO, Any, Protocol
 
 from fastapi import HTTPException
 
+from app.config.settings import Settings
 from app.properties.models.property import Property, PropertySource
 from app.properties.repositories import (
     EXPORT_LIMIT,
     IPropertyRepository,
     PropertyFilters,
 )
+from app.properties.schemas import (
+    BasePropertyResponse,
+    ChangeOperation,
+    PropertyChange,
+    PropertyChangeNotification,
+    PropertyChangesResponse,
+    PropertyDistributionResponse,
+    PropertyListResponse,
+    PropertyResponse,
+    sparse_property_response,
+)
+from app.properties.services.columnar_export_service import (
+    ColumnarFormat,
+    IColumnarExportService,
+)
 from app.properties.services.csv_export_service import ICSVExportService
+from app.properties.services.distribution_service import IDistributionService
 from app.properties.services.property_parser import IPropertyParser
+from app.properties.services.saved_search_service import ISavedSearchService
+from app.utils.cache import (
+    CacheStats,
+    DataVersion,
+    LRUCache,
+    SingleFlight,
+    VersionStamp,
+)
 from app.utils.di import inject
+from app.utils.pagination import CacheablePage
+from app.utils.shared_cache import ISharedCache
 
 logger = logging.getLogger(__name__)
 
+# Tag of cache entries not limited to particular cities/sources
+ANY_TAG = "*"
+
+
+def _scope_tags(
+    cities: list[str] | None, sources: list[PropertySource] | None
+) -> frozenset[str]:
+    """Get cache tags describing which cities and sources a result depends on."""
+    city_tags = [f"city:{city}" for city in cities] if cities else [f"city:{ANY_TAG}"]
+    source_tags = (
+        [f"source:{source.value}" for source in sources]
+        if sources
+        else [f"source:{ANY_TAG}"]
+    )
+    return frozenset(city_tags + source_tags)
+
+
+def _is_affected(tags: frozenset[str], change: PropertyChangeNotification) -> bool:
+    """Check whether a change can affect a cache entry tagged by `_scope_tags`."""
+    if change.cities is not None and tags.isdisjoint(
+        [f"city:{ANY_TAG}", *(f"city:{city}" for city in change.cities)]
+    ):
+        return False
+    return not (
+        change.sources is not None
+        and tags.isdisjoint(
+            [
+                f"source:{ANY_TAG}",
+                *(f"source:{source.value}" for source in change.sources),
+            ]
+        )
+    )
+
 
 class IPropertyService(Protocol):
     """Protocol interface for property service."""
 
-    def get_property(self, property_id: int) -> Property | None:
+    def get_property(
+        self, property_id: int, fields: list[str] | None = None
+    ) -> BasePropertyResponse | None:
         """Get property by ID."""
         ...
 
-    def list_properties(self, filters: PropertyFilters) -> tuple[list[Property], int]:
+    def list_properties(self, filters: PropertyFilters) -> PropertyListResponse:
         """List properties with filters."""
         ...
 
+    def list_properties_batch(
+        self, filters_list: list[PropertyFilters]
+    ) -> list[PropertyListResponse]:
+        """List properties for several filter sets at once."""
+        ...
+
     def export_properties(self, filters: PropertyFilters) -> tuple[BytesIO, str]:
         """Export properties to CSV. Returns (csv_buffer, filename)."""
         ...
 
+    def stream_properties(self, filters: PropertyFilters) -> Generator[bytes]:
+        """Stream all matching properties as NDJSON chunks."""
+        ...
+
+    def export_properties_columnar(
+        self, filters: PropertyFilters, format: ColumnarFormat
+    ) -> tuple[IO[bytes], str]:
+        """Export properties to Parquet/Arrow. Returns (file, filename)."""
+        ...
+
+    def get_distribution(
+        self, filters: PropertyFilters, bins: int
+    ) -> PropertyDistributionResponse:
+        """Get price/area histograms and percentiles per city and property type."""
+        ...
+
+    def get_changes(self, since: int, limit: int) -> PropertyChangesResponse:
+        """Get upserts and deletions after a change feed token, in commit order."""
+        ...
+
     def get_unique_cities(self) -> list[str]:
         """Get all unique cities from non-deleted properties."""
         ...
@@ -43,6 +136,22 @@ class IPropertyService(Protocol):
         """Get all available platforms/sources."""
         ...
 
+    def get_cache_stats(self) -> CacheStats:
+        """Get query result cache metrics."""
+        ...
+
+    def get_data_version(self) -> VersionStamp:
+        """Get a token that changes whenever visible property data changes."""
+        ...
+
+    def warm_cache(self, cities: list[str]) -> None:
+        """Precompute commonly requested results after new data was saved."""
+        ...
+
+    def handle_property_change(self, payload: str | None) -> None:
+        """Invalidate cached results affected by a property change notification."""
+        ...
+
     def save_scraped_property(
         self, scraped_data: dict[str, Any], source: PropertySource
     ) -> Property:
@@ -56,6 +165,46 @@ class IPropertyService(Protocol):
         ...
 
 
+def _response_class(fields: list[str] | None) -> type[BasePropertyResponse]:
+    return sparse_property_response(frozenset(fields)) if fields else PropertyResponse
+
+
+def _ndjson_chunks(
+    item_class: type[BasePropertyResponse], batches: Generator[list[Property]]
+) -> Generator[bytes]:
+    try:
+        for batch in batches:
+            yield item_class.to_ndjson(batch)
+    finally:
+        # Ends the query when the consumer stops early (client disconnected)
+        batches.close()
+
+
+def _limit_export(batches: Iterable[list[Property]]) -> Generator[list[Property]]:
+    """Pass batches through, failing once they exceed EXPORT_LIMIT rows."""
+    exported = 0
+    for batch in batches:
+        exported += len(batch)
+        if exported > EXPORT_LIMIT:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Export limited to {EXPORT_LIMIT:,} properties. "
+                "Please refine your filters or create an export job "
+                "(POST /properties/exports).",
+            )
+        yield batch
+
+
+def _property_tags(response: BasePropertyResponse | None) -> frozenset[str]:
+    """Tags of a single property, sparse responses may lack city/source."""
+    city: str | None = getattr(response, "city", None)
+    source: PropertySource | None = getattr(response, "source", None)
+    return _scope_tags(
+        [city] if city else None,
+        [source] if source else None,
+    )
+
+
 @inject(alias=IPropertyService, singleton=True)
 class PropertyService(IPropertyService):
     """
@@ -70,34 +219,250 @@ class PropertyService(IPropertyService):
         repository: IPropertyRepository,
         parser: IPropertyParser,
         csv_export_service: ICSVExportService,
+        columnar_export_service: IColumnarExportService,
+        distribution_service: IDistributionService,
+        saved_search_service: ISavedSearchService,
+        settings: Settings,
+        data_version: DataVersion,
+        shared_cache: ISharedCache,
     ):
         self.repository = repository
         self.parser = parser
         self.csv_export_service = csv_export_service
+        self.columnar_export_service = columnar_export_service
+        self.distribution_service = distribution_service
+        self.saved_search_service = saved_search_service
+        self.settings = settings
+        self.data_version = data_version
+        self.shared_cache = shared_cache
+        # Results are cached as DTOs, ORM objects are bound to a request's session
+        self.cache: LRUCache[Any] = LRUCache(
+            max_entries=settings.PROPERTY_CACHE_MAX_ENTRIES,
+            max_bytes=settings.PROPERTY_CACHE_MAX_BYTES,
+            ttl=settings.PROPERTY_CACHE_TTL,
+        )
+        # Identical concurrent misses (e.g. everyone asking for the first page
+        # right after an invalidation) share one computation
+        self.single_flight: SingleFlight[Any] = SingleFlight()
+        # Fallback data version when the shared cache is unavailable: changes
+        # seen by this process (own writes and notifications)
+        self._instance_token = uuid.uuid4().hex[:8]
+        self._changes_seen = 0
+        self._changed_at = data_version.updated_at
+        # Makes checking for notifications and storing a result atomic
+        self._invalidation_lock = threading.Lock()
+
+    def _cached[V](
+        self,
+        route: str,
+        key: str,
+        compute: Callable[[], V],
+        sizeof: Callable[[V], int],
+        tags: Callable[[V], frozenset[str]],
+        ttl: int,
+        encode: Callable[[V], Any],
+        decode: Callable[[Any], V],
+    ) -> V:
+        """
+        Get value from the in-process cache, the shared cache or compute it.
+
+        In-process keys are prefixed with the data version (see
+        `_cache_version`), so writes make previously cached results
+        unreachable. Without the shared cache, writes from other processes
+        arrive as notifications and invalidate entries by tags (see
+        `handle_property_change`). A result computed while a notification
+        arrived may predate that write, so it is returned but not stored.
+
+        On a miss, concurrent identical requests in this process share one
+        computation (single-flight), and the shared (Redis) cache lets only one
+        process compute it while the others wait for its result.
 
-    def get_property(self, property_id: int) -> Property | None:
+        Args:
+            route: Route the value belongs to
+            key: Normalized request key
+            compute: Computes the value from the database
+            sizeof: Approximate size of the value in bytes
+            tags: Cities/sources the value depends on (see `_scope_tags`)
+            ttl: Shared cache time to live in seconds
+            encode: Converts the value to JSON-serializable data
+            decode: Restores the value from data produced by encode
+        """
+        versioned_key = f"{self._cache_version()}:{route}:{key}"
+        cached = self.cache.get(versioned_key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+        def load() -> V:
+            changes_seen = self._changes_seen
+            value = self.shared_cache.get_or_compute(
+                route, key, compute, ttl=ttl, encode=encode, decode=decode
+            )
+            if value is not None:
+                with self._invalidation_lock:
+                    if self._changes_seen == changes_seen:
+                        self.cache.set(
+                            versioned_key,
+                            value,
+                            size=sizeof(value),
+                            tags=tags(value),
+                        )
+            return value
+
+        return self.single_flight.do(versioned_key, load)  # type: ignore[no-any-return]
+
+    def _cache_version(self) -> str:
+        """
+        Get the data version prefixing in-process cache keys.
+
+        The shared version when there is one: it's what ETags are built from,
+        and writers bump it on commit, before this process gets their
+        notification. Keying by it means a body is never older than the ETag
+        sent with it. Without it, this process's version, bumped by its own
+        writes (other processes' writes invalidate entries by tags).
+        """
+        shared_version = self.shared_cache.get_version()
+        if shared_version is not None:
+            return shared_version.token
+        return str(self.data_version.current)
+
+    def get_property(
+        self, property_id: int, fields: list[str] | None = None
+    ) -> BasePropertyResponse | None:
         """
         Get property by ID.
 
         Args:
             property_id: Property ID
+            fields: PropertyResponse fields to load and return (None for all)
 
         Returns:
-            Property if found, None otherwise
+            PropertyResponse (or a sparse response with only `fields`) if
+            found, None otherwise
         """
-        return self.repository.get_by_id(property_id)
+        response_class = _response_class(fields)
+
+        def compute() -> BasePropertyResponse | None:
+            property_obj = self.repository.get_by_id(property_id, fields)
+            return response_class.from_model(property_obj) if property_obj else None
+
+        return self._cached(
+            "property",
+            f"{property_id}:{','.join(fields or [])}",
+            compute,
+            sizeof=lambda response: len(response.model_dump_json()) if response else 0,
+            tags=_property_tags,
+            ttl=self.settings.CACHE_PROPERTY_TTL,
+            encode=lambda response: response.model_dump() if response else None,
+            decode=lambda data: response_class(**data) if data else None,
+        )
 
-    def list_properties(self, filters: PropertyFilters) -> tuple[list[Property], int]:
+    def list_properties(self, filters: PropertyFilters) -> PropertyListResponse:
         """
         List properties with filtering and pagination.
 
+        Results are cached by normalized filters and data version.
+
         Args:
             filters: PropertyFilters with filter criteria
 
         Returns:
-            Tuple of (list of properties, total count)
+            PropertyListResponse with pagination metadata
         """
-        return self.repository.list_properties(filters)
+
+        item_class = _response_class(filters.fields)
+
+        def compute() -> PropertyListResponse:
+            properties, total = self.repository.list_properties(filters)
+            return PropertyListResponse.from_properties(
+                properties=properties,
+                total=total,
+                page=filters.page,
+                size=filters.size,
+                item_class=item_class,
+            )
+
+        def encode(response: PropertyListResponse) -> dict[str, Any]:
+            return CacheablePage[BasePropertyResponse](
+                total=response.total, pages=response.pages, items=response.items
+            ).to_cache_dict()
+
+        def decode(data: dict[str, Any]) -> PropertyListResponse:
+            page = CacheablePage[BasePropertyResponse].from_cache_dict(data, item_class)
+            return PropertyListResponse(
+                items=list(page.items),
+                total=page.total,
+                page=filters.page,
+                size=filters.size,
+                pages=page.pages or 0,
+            )
+
+        return self._cached(
+            "list",
+            filters.cache_key(),
+            compute,
+            sizeof=lambda response: len(response.model_dump_json()),
+            tags=lambda _: _scope_tags(filters.cities, filters.sources),
+            ttl=self.settings.CACHE_LIST_TTL,
+            encode=encode,
+            decode=decode,
+        )
+
+    def list_properties_batch(
+        self, filters_list: list[PropertyFilters]
+    ) -> list[PropertyListResponse]:
+        """
+        List properties for several filter sets at once (e.g. dashboard widgets).
+
+        Filter sets cached in this process are answered from the cache, the
+        rest are listed together in a single query and cached like results of
+        `list_properties`, so entries are shared with the list endpoint. The
+        shared cache is skipped, its per-key locking would split the batch
+        back into one query per filter set.
+
+        Args:
+            filters_list: Filter sets with pagination
+
+        Returns:
+            PropertyListResponse per filter set, in order
+        """
+        # Read before querying, like `_cached`, so results of a query racing a
+        # write are stored under the old version
+        version = self._cache_version()
+
+        results: list[PropertyListResponse | None] = []
+        misses: list[tuple[int, PropertyFilters]] = []
+        for index, filters in enumerate(filters_list):
+            cached = self.cache.get(f"{version}:list:{filters.cache_key()}")
+            results.append(cached)
+            if cached is None:
+                misses.append((index, filters))
+
+        if misses:
+            pages = self.repository.list_properties_batch(
+                [filters for _, filters in misses]
+            )
+            for (index, filters), (properties, total) in zip(
+                misses, pages, strict=True
+            ):
+                response = PropertyListResponse.from_properties(
+                    properties=properties,
+                    total=total,
+                    page=filters.page,
+                    size=filters.size,
+                    item_class=_response_class(filters.fields),
+                )
+                self.cache.set(
+                    f"{version}:list:{filters.cache_key()}",
+                    response,
+                    size=len(response.model_dump_json()),
+                    tags=_scope_tags(filters.cities, filters.sources),
+                )
+                results[index] = response
+
+        logger.info(
+            f"Listed {len(filters_list)} filter sets ({len(misses)} not cached)"
+        )
+        return [result for result in results if result is not None]
 
     def export_properties(self, filters: PropertyFilters) -> tuple[BytesIO, str]:
         """
@@ -131,6 +496,144 @@ class PropertyService(IPropertyService):
         logger.info(f"Exported {len(properties)} properties as {filename}")
         return csv_buffer, filename
 
+    def stream_properties(self, filters: PropertyFilters) -> Generator[bytes]:
+        """
+        Stream all properties matching filters as NDJSON (one object per line).
+
+        Not cached and not subject to EXPORT_LIMIT, rows are serialized batch by
+        batch as they come from the database cursor.
+
+        The query's cost is checked when this is called, so a rejected query
+        fails before the response starts.
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size ignored)
+
+        Returns:
+            Generator of newline-terminated JSON objects, one chunk per batch
+
+        Raises:
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        item_class = _response_class(filters.fields)
+        return _ndjson_chunks(item_class, self.repository.stream_properties(filters))
+
+    def export_properties_columnar(
+        self, filters: PropertyFilters, format: ColumnarFormat
+    ) -> tuple[IO[bytes], str]:
+        """
+        Export properties to Parquet or Arrow IPC.
+
+        Rows are streamed from the database into row groups of a temporary
+        file, so memory stays constant. The file has to be complete before
+        sending it (both formats end with a footer), so like CSV exports it's
+        limited to EXPORT_LIMIT rows, larger exports go through export jobs
+        (POST /properties/exports).
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size and
+                fields ignored)
+            format: parquet or arrow
+
+        Returns:
+            Tuple of (temporary file positioned at the start, filename), the
+            caller closes the file
+
+        Raises:
+            HTTPException: If more than EXPORT_LIMIT properties match
+            QueryTooExpensiveException: If estimated cost exceeds QUERY_COST_LIMIT
+        """
+        # Files always contain all columns, like CSV exports. One row past the
+        # limit tells a full export from one that doesn't fit.
+        batches = self.repository.stream_properties(
+            dataclasses.replace(filters, fields=None), limit=EXPORT_LIMIT + 1
+        )
+        output = tempfile.TemporaryFile()  # noqa: SIM115
+        try:
+            self.columnar_export_service.write_properties(
+                _limit_export(batches), format, output
+            )
+        except:
+            output.close()
+            raise
+        finally:
+            batches.close()
+        output.seek(0)
+
+        filename = self.csv_export_service.generate_filename(filters, extension=format)
+        return output, filename
+
+    def get_distribution(
+        self, filters: PropertyFilters, bins: int
+    ) -> PropertyDistributionResponse:
+        """
+        Get price/area histograms and percentiles per city and property type.
+
+        Matching rows are streamed into Polars, results are cached by
+        normalized filters, number of bins and data version.
+
+        Args:
+            filters: PropertyFilters with filter criteria (page/size ignored)
+            bins: Number of histogram bins
+
+        Returns:
+            PropertyDistributionResponse, largest groups first
+        """
+
+        def compute() -> PropertyDistributionResponse:
+            return self.distribution_service.compute(
+                self.repository.stream_distribution_rows(filters), bins
+            )
+
+        return self._cached(
+            "distribution",
+            f"{bins}:{filters.cache_key()}",
+            compute,
+            sizeof=lambda response: len(response.model_dump_json()),
+            tags=lambda _: _scope_tags(filters.cities, filters.sources),
+            ttl=self.settings.CACHE_DISTRIBUTION_TTL,
+            encode=lambda response: response.model_dump(mode="json"),
+            decode=PropertyDistributionResponse.model_validate,
+        )
+
+    def get_changes(self, since: int, limit: int) -> PropertyChangesResponse:
+        """
+        Get upserts and deletions after a change feed token, in commit order.
+
+        Pages are read by keyset (change_seq > since), not cached: a consumer
+        passing each page's next token syncs in time proportional to the
+        number of changes, however large the table is.
+
+        Args:
+            since: Token of the last change seen (0 for all)
+            limit: Maximum number of changes
+
+        Returns:
+            PropertyChangesResponse, next_token is `since` when nothing changed
+        """
+        # One extra row tells whether more changes follow
+        rows = self.repository.get_changes(since, limit + 1)
+        items = [
+            PropertyChange(
+                token=change_seq,
+                operation=(
+                    ChangeOperation.UPSERT
+                    if prop is not None
+                    else ChangeOperation.DELETE
+                ),
+                id=property_id,
+                property=(
+                    PropertyResponse.from_model(prop) if prop is not None else None
+                ),
+            )
+            for change_seq, property_id, prop in rows[:limit]
+        ]
+        return PropertyChangesResponse(
+            items=items,
+            next_token=items[-1].token if items else since,
+            has_more=len(rows) > limit,
+        )
+
     def get_unique_cities(self) -> list[str]:
         """
         Get all unique cities from non-deleted properties.
@@ -138,7 +641,16 @@ class PropertyService(IPropertyService):
         Returns:
             List of unique city names sorted alphabetically
         """
-        return self.repository.get_unique_cities()
+        return self._cached(
+            "cities",
+            "",
+            self.repository.get_unique_cities,
+            sizeof=lambda cities: sum(len(city) for city in cities),
+            tags=lambda _: _scope_tags(None, None),
+            ttl=self.settings.CACHE_CITIES_TTL,
+            encode=lambda cities: cities,
+            decode=lambda data: list(data),
+        )
 
     def get_available_platforms(self) -> list[PropertySource]:
         """
@@ -149,6 +661,87 @@ class PropertyService(IPropertyService):
         """
         return list(PropertySource)
 
+    def get_cache_stats(self) -> CacheStats:
+        """
+        Get query result cache metrics.
+
+        Returns:
+            CacheStats with hit/miss/eviction counters, current size and
+            coalesced requests
+        """
+        return dataclasses.replace(
+            self.cache.stats(), coalesced=self.single_flight.coalesced
+        )
+
+    def get_data_version(self) -> VersionStamp:
+        """
+        Get a token that changes whenever visible property data changes.
+
+        Uses the shared (Redis) version, identical in every worker. Without it,
+        falls back to a token of this process, so validators built from it
+        still change with the data but differ between workers.
+
+        Returns:
+            VersionStamp with the token and the time of the last change
+        """
+        shared_version = self.shared_cache.get_version()
+        if shared_version is not None:
+            return shared_version
+
+        return VersionStamp(
+            token=(
+                f"{self._instance_token}.{self.data_version.current}"
+                f".{self._changes_seen}"
+            ),
+            updated_at=max(self.data_version.updated_at, self._changed_at),
+        )
+
+    def warm_cache(self, cities: list[str]) -> None:
+        """
+        Precompute commonly requested results after new data was saved.
+
+        Computes the city list and the first list page, unfiltered and for each
+        of the given cities, so the first visitors after a scrape hit the cache.
+
+        Args:
+            cities: Cities whose listings changed
+        """
+        self.get_unique_cities()
+        self.list_properties(PropertyFilters())
+        for city in cities:
+            self.list_properties(PropertyFilters(cities=[city]))
+
+    def handle_property_change(self, payload: str | None) -> None:
+        """
+        Invalidate cached results affected by a property change notification.
+
+        Args:
+            payload: PropertyChangeNotification JSON, or None when notifications
+                may have been missed (everything is invalidated)
+        """
+        change: PropertyChangeNotification | None = None
+        if payload is not None:
+            try:
+                change = PropertyChangeNotification.model_validate_json(payload)
+            except ValueError:
+                logger.warning(f"Invalid property change notification: {payload!r}")
+                change = PropertyChangeNotification()
+
+        # Loads in flight don't store their (possibly older) results after this
+        with self._invalidation_lock:
+            self._changes_seen += 1
+            self._changed_at = datetime.now(timezone.utc)
+
+            if change is None:
+                self.cache.clear()
+                return
+
+            affected_by = change
+            removed = self.cache.invalidate(
+                lambda _key, tags: _is_affected(tags, affected_by)
+            )
+        logger.debug(f"Invalidated {removed} cached results after {payload}")
+
     def _transform_scraped_data(
         self, scraped_data: dict[str, Any], source: PropertySource
     ) -> dict[str, Any]:
@@ -179,6 +772,14 @@ class PropertyService(IPropertyService):
         rooms = self.parser.parse_rooms(scraped_data.get("broj_soba"))
         property_type = self.parser.parse_property_type(scraped_data.get("tip"))
 
+        # Display values only change when the listing is scraped again
+        price_display = self.parser.format_price_display(
+            scraped_data.get("cijena", ""), price_eur
+        )
+        area_display = self.parser.format_area_display(
+            scraped_data.get("kvadratura"), area_sqm
+        )
+
         return {
             "source": source,
             "link": scraped_data["link"],
@@ -195,6 +796,9 @@ class PropertyService(IPropertyService):
             "price_eur": price_eur,
             "area_sqm": area_sqm,
             "rooms": rooms,
+            # Display values
+            "price_display": price_display,
+            "area_display": area_display,
             # Timestamps
             "created_at": now,
             "updated_at": now,
@@ -222,6 +826,9 @@ class PropertyService(IPropertyService):
         """
         Bulk save scraped properties.
 
+        New and changed listings are matched against saved searches in the
+        same transaction, so their alerts are queued exactly when they commit.
+
         Args:
             scraped_data_list: List of raw scraped data dictionaries
             source: PropertySource enum (ESTITOR or REALITICA)
@@ -239,7 +846,12 @@ class PropertyService(IPropertyService):
         ]
 
         # Bulk upsert
-        count = self.repository.bulk_upsert(properties_data)
+        result = self.repository.bulk_upsert(properties_data)
+        count = result.affected_rows
+        if result.changed_ids:
+            self.saved_search_service.match_properties(
+                self.repository.get_by_ids(result.changed_ids)
+            )
         logger.info(
             f"Saved {count} properties from {source.value} (total scraped: {len(scraped_data_list)})"
         )
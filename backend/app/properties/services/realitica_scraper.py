@@ -8,6 +8,8 @@ from typing import Any, ClassVar, Protocol
 
 from playwright.sync_api import Locator, Page
 
+from app.properties.metrics import SCRAPE_LISTINGS_PER_PAGE
+from app.properties.models.property import PropertySource
 from app.properties.services.browser_pool import IBrowserPool
 from app.utils.di import inject
 
@@ -147,6 +149,9 @@ class RealiticaScraper(IRealiticaScraper):
                         logger.debug(
                             f"Found {listing_count} listing elements on page {page_num}"
                         )
+                        SCRAPE_LISTINGS_PER_PAGE.labels(
+                            source=PropertySource.REALITICA.value
+                        ).observe(listing_count)
 
                         new_items = 0
 
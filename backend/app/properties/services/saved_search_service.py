@@ -0,0 +1,498 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol
+
+import requests
+
+from app.config.settings import Settings
+from app.properties.metrics import SAVED_SEARCH_DELIVERIES
+from app.properties.models.property import Property, PropertySource, PropertyType
+from app.properties.models.saved_search import SavedSearchMatch
+from app.properties.repositories import (
+    IPropertyRepository,
+    ISavedSearchRepository,
+    PropertyFilters,
+)
+from app.properties.repositories.property_repository import to_naive_utc
+from app.properties.schemas import (
+    PropertyFilterParams,
+    PropertyResponse,
+    SavedSearchAlert,
+    SavedSearchCreate,
+    SavedSearchResponse,
+)
+from app.utils.di import inject
+from app.utils.interval_tree import Interval, IntervalTree
+from app.utils.network import NonPublicHostError, post_to_public_host
+
+logger = logging.getLogger(__name__)
+
+# Pending matches claimed by a delivery run at a time
+DELIVERY_RUN_SIZE = 1_000
+
+_INF = float("inf")
+
+
+class _ValueIndex[K: Hashable]:
+    """Saved searches by the values they accept for one column."""
+
+    def __init__(self) -> None:
+        self._by_value: defaultdict[K, set[int]] = defaultdict(set)
+        # Searches without a condition on the column
+        self._any: set[int] = set()
+
+    def add(self, search_id: int, values: Iterable[K] | None) -> None:
+        if not values:
+            self._any.add(search_id)
+            return
+        for value in values:
+            self._by_value[value].add(search_id)
+
+    def lookup(self, value: K | None) -> set[int]:
+        """Get searches accepting a value, only unconditioned ones accept None."""
+        if value is None or value not in self._by_value:
+            return self._any
+        return self._any | self._by_value[value]
+
+
+class _RangeIndex:
+    """Saved searches by the [min, max] range they accept for one column."""
+
+    def __init__(self, ranges: Iterable[tuple[int, float | None, float | None]]):
+        intervals: list[Interval[int]] = []
+        # Searches without a condition on the column
+        self._any: set[int] = set()
+        for search_id, low, high in ranges:
+            if low is None and high is None:
+                self._any.add(search_id)
+            else:
+                intervals.append(
+                    Interval(
+                        low if low is not None else -_INF,
+                        high if high is not None else _INF,
+                        search_id,
+                    )
+                )
+        self._tree = IntervalTree(intervals)
+
+    def lookup(self, value: float | None) -> set[int]:
+        """Get searches accepting a value, only unconditioned ones accept None."""
+        if value is None:
+            return self._any
+        return self._any.union(self._tree.stab(value))
+
+
+class SavedSearchIndex:
+    """
+    Immutable in-memory predicate index of saved searches.
+
+    Conditions a listing matches by equality (city, type, source, rooms) are
+    hash sets of the searches accepting each value, price and area ranges are
+    interval trees. A listing's candidates are the intersection of its lookups,
+    so matching a batch takes one pass over the listings, without evaluating
+    every search against every listing. Only the remaining conditions (text
+    search, time windows) are checked per candidate.
+
+    Conditions match like the list query's SQL: a listing without a value
+    (e.g. no price) only matches searches without a condition on it.
+    """
+
+    def __init__(self, searches: Iterable[tuple[int, PropertyFilters]]):
+        self._filters = dict(searches)
+        self._cities: _ValueIndex[str] = _ValueIndex()
+        self._property_types: _ValueIndex[PropertyType] = _ValueIndex()
+        self._sources: _ValueIndex[PropertySource] = _ValueIndex()
+        self._rooms: _ValueIndex[int] = _ValueIndex()
+        for search_id, filters in self._filters.items():
+            self._cities.add(search_id, filters.cities)
+            self._property_types.add(search_id, filters.property_types)
+            self._sources.add(search_id, filters.sources)
+            self._rooms.add(search_id, filters.rooms)
+        self._prices = _RangeIndex(
+            (search_id, filters.min_price, filters.max_price)
+            for search_id, filters in self._filters.items()
+        )
+        self._areas = _RangeIndex(
+            (search_id, filters.min_area, filters.max_area)
+            for search_id, filters in self._filters.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def match(self, properties: Iterable[Property]) -> list[tuple[int, int]]:
+        """
+        Match listings against all saved searches.
+
+        Args:
+            properties: Listings to match
+
+        Returns:
+            List of (saved search ID, property ID), once per pair
+        """
+        matches: list[tuple[int, int]] = []
+        for prop in properties:
+            candidates = self._cities.lookup(prop.city)
+            lookups: list[tuple[_ValueIndex[Any] | _RangeIndex, Any]] = [
+                (self._property_types, prop.property_type),
+                (self._sources, prop.source),
+                (self._rooms, prop.rooms),
+                (self._prices, _float_or_none(prop.price_eur)),
+                (self._areas, _float_or_none(prop.area_sqm)),
+            ]
+            for index, value in lookups:
+                if not candidates:
+                    break
+                candidates = candidates & index.lookup(value)
+
+            matches.extend(
+                (search_id, prop.id)
+                for search_id in sorted(candidates)
+                if _matches_remaining(self._filters[search_id], prop)
+            )
+        return matches
+
+
+def _float_or_none(value: float | None) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _matches_remaining(filters: PropertyFilters, prop: Property) -> bool:
+    """Check the conditions the index doesn't cover, like `_build_filter_conditions`."""
+    if filters.search:
+        term = filters.search.casefold()
+        if term not in prop.title.casefold() and term not in prop.location.casefold():
+            return False
+    if filters.created_after is not None and prop.created_at < to_naive_utc(
+        filters.created_after
+    ):
+        return False
+    if filters.created_before is not None and prop.created_at >= to_naive_utc(
+        filters.created_before
+    ):
+        return False
+    return not (
+        filters.updated_after is not None
+        and prop.updated_at < to_naive_utc(filters.updated_after)
+    )
+
+
+@dataclass(frozen=True)
+class ClaimedAlert:
+    """Alert of one saved search, with the matches it delivers."""
+
+    webhook_url: str
+    alert: SavedSearchAlert
+    match_ids: list[int]
+
+
+@dataclass
+class AlertClaim:
+    """Alerts claimed by one delivery run."""
+
+    claimed_until: datetime
+    # Claimed matches, including dropped ones of deleted listings
+    match_count: int
+    alerts: list[ClaimedAlert] = field(default_factory=list)
+
+
+class ISavedSearchService(Protocol):
+    def create_saved_search(self, request: SavedSearchCreate) -> SavedSearchResponse:
+        """Create a saved search."""
+        ...
+
+    def list_saved_searches(self) -> list[SavedSearchResponse]:
+        """Get all saved searches."""
+        ...
+
+    def delete_saved_search(self, saved_search_id: int) -> bool:
+        """Delete a saved search. Returns whether it existed."""
+        ...
+
+    def match_properties(self, properties: list[Property]) -> int:
+        """Queue alerts of saved searches new or changed listings match."""
+        ...
+
+    def claim_alerts(self) -> AlertClaim:
+        """Claim one batch of queued alerts for delivery."""
+        ...
+
+    def send_alerts(self, claim: AlertClaim) -> tuple[list[int], list[int]]:
+        """POST claimed alerts to their webhooks. Returns (delivered, failed) match IDs."""
+        ...
+
+    def record_deliveries(
+        self, claim: AlertClaim, delivered: list[int], failed: list[int]
+    ) -> None:
+        """Record which claimed matches were delivered and which failed."""
+        ...
+
+
+@inject(alias=ISavedSearchService, singleton=True)
+class SavedSearchService(ISavedSearchService):
+    """
+    Saved searches and new-listing alerts.
+
+    Listings saved by scrapers are matched in the saving transaction against a
+    SavedSearchIndex held by each process, matches are queued in the database
+    and POSTed to the searches' webhooks by `deliver_saved_search_alerts`
+    (claim, send and record, each claimed batch).
+    """
+
+    def __init__(
+        self,
+        repository: ISavedSearchRepository,
+        property_repository: IPropertyRepository,
+        settings: Settings,
+    ):
+        self.repository = repository
+        self.property_repository = property_repository
+        self.settings = settings
+        self._index: SavedSearchIndex | None = None
+        self._index_version: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def create_saved_search(self, request: SavedSearchCreate) -> SavedSearchResponse:
+        """
+        Create a saved search, matching listings saved from now on.
+
+        Args:
+            request: Name, webhook URL and filters
+
+        Returns:
+            Created saved search
+        """
+        saved_search = self.repository.create(
+            name=request.name,
+            filters=request.filters.model_dump(mode="json", exclude_none=True),
+            webhook_url=str(request.webhook_url),
+        )
+        logger.info(f"Created saved search {saved_search.id}")
+        return SavedSearchResponse.from_model(saved_search)
+
+    def list_saved_searches(self) -> list[SavedSearchResponse]:
+        """
+        Get all saved searches.
+
+        Returns:
+            List of saved searches, oldest first
+        """
+        return [
+            SavedSearchResponse.from_model(saved_search)
+            for saved_search in self.repository.get_all()
+        ]
+
+    def delete_saved_search(self, saved_search_id: int) -> bool:
+        """
+        Delete a saved search and its undelivered alerts.
+
+        Args:
+            saved_search_id: Saved search ID
+
+        Returns:
+            True if the saved search existed
+        """
+        return self.repository.delete(saved_search_id)
+
+    def match_properties(self, properties: list[Property]) -> int:
+        """
+        Queue alerts of saved searches new or changed listings match.
+
+        Runs in the caller's transaction, alerts are queued only if the
+        listings are committed.
+
+        Args:
+            properties: New or changed listings (deleted ones are skipped)
+
+        Returns:
+            Count of queued matches
+        """
+        index = self._get_index()
+        if not index or not properties:
+            return 0
+
+        matches = index.match(prop for prop in properties if prop.deleted_at is None)
+        logger.info(
+            f"Matched {len(properties)} listings against {len(index)} saved searches: "
+            f"{len(matches)} matches"
+        )
+        return self.repository.queue_matches(matches)
+
+    def claim_alerts(self) -> AlertClaim:
+        """
+        Claim one batch of queued alerts (up to DELIVERY_RUN_SIZE matches).
+
+        Run in a short transaction of its own and commit before `send_alerts`,
+        claimed matches are skipped by other runs for SAVED_SEARCH_CLAIM_TIMEOUT
+        without staying locked. Each saved search gets its listings in alerts of
+        at most SAVED_SEARCH_DELIVERY_BATCH listings. Matches of listings
+        deleted since are dropped.
+
+        Returns:
+            Claimed alerts
+        """
+        claimed_until = datetime.now(timezone.utc) + timedelta(
+            seconds=self.settings.SAVED_SEARCH_CLAIM_TIMEOUT
+        )
+        pending = self.repository.claim_pending_matches(
+            self.settings.SAVED_SEARCH_MAX_ATTEMPTS, DELIVERY_RUN_SIZE, claimed_until
+        )
+        claim = AlertClaim(claimed_until=claimed_until, match_count=len(pending))
+        if not pending:
+            return claim
+
+        matches_by_search: defaultdict[int, list[SavedSearchMatch]] = defaultdict(list)
+        for match in pending:
+            matches_by_search[match.saved_search_id].append(match)
+        saved_searches = {
+            saved_search.id: saved_search
+            for saved_search in self.repository.get_by_ids(list(matches_by_search))
+        }
+        properties = {
+            prop.id: prop
+            for prop in self.property_repository.get_by_ids(
+                [match.property_id for match in pending]
+            )
+        }
+
+        dropped: list[int] = []
+        batch_size = self.settings.SAVED_SEARCH_DELIVERY_BATCH
+        for saved_search_id, matches in matches_by_search.items():
+            saved_search = saved_searches[saved_search_id]
+            live: list[SavedSearchMatch] = []
+            for match in matches:
+                if match.property_id in properties:
+                    live.append(match)
+                else:
+                    dropped.append(match.id)
+            for start in range(0, len(live), batch_size):
+                batch = live[start : start + batch_size]
+                claim.alerts.append(
+                    ClaimedAlert(
+                        webhook_url=saved_search.webhook_url,
+                        alert=SavedSearchAlert(
+                            saved_search_id=saved_search.id,
+                            name=saved_search.name,
+                            properties=[
+                                PropertyResponse.from_model(
+                                    properties[match.property_id]
+                                )
+                                for match in batch
+                            ],
+                        ),
+                        match_ids=[match.id for match in batch],
+                    )
+                )
+        self.repository.mark_delivered(dropped, claimed_until)
+        return claim
+
+    def send_alerts(self, claim: AlertClaim) -> tuple[list[int], list[int]]:
+        """
+        POST claimed alerts to their webhooks, outside of any transaction.
+
+        A failed webhook doesn't stop the others. Its saved search's remaining
+        alerts count as failed without being sent, so an unreachable webhook
+        costs one timeout per run. Failed matches are retried by a later run
+        after SAVED_SEARCH_RETRY_DELAY, up to SAVED_SEARCH_MAX_ATTEMPTS times.
+
+        Args:
+            claim: Alerts claimed by `claim_alerts`
+
+        Returns:
+            Tuple of (delivered, failed) match IDs
+        """
+        delivered: list[int] = []
+        failed: list[int] = []
+        failed_searches: set[int] = set()
+        for claimed in claim.alerts:
+            saved_search_id = claimed.alert.saved_search_id
+            if saved_search_id not in failed_searches and self._post(
+                claimed.webhook_url, claimed.alert
+            ):
+                delivered.extend(claimed.match_ids)
+            else:
+                failed_searches.add(saved_search_id)
+                failed.extend(claimed.match_ids)
+        return delivered, failed
+
+    def record_deliveries(
+        self, claim: AlertClaim, delivered: list[int], failed: list[int]
+    ) -> None:
+        """
+        Record which claimed matches were delivered and which failed.
+
+        Args:
+            claim: Claim the alerts were sent under
+            delivered: Delivered match IDs
+            failed: Failed match IDs
+        """
+        retry_at = datetime.now(timezone.utc) + timedelta(
+            seconds=self.settings.SAVED_SEARCH_RETRY_DELAY
+        )
+        self.repository.mark_delivered(delivered, claim.claimed_until)
+        self.repository.mark_failed(failed, claim.claimed_until, retry_at)
+        logger.info(
+            f"Delivered {len(delivered)} saved search matches, {len(failed)} failed"
+        )
+
+    def _post(self, url: str, alert: SavedSearchAlert) -> bool:
+        """
+        POST an alert to a webhook. Returns whether it was accepted (2xx).
+
+        Webhooks are set by API callers, so hosts resolving to loopback,
+        private or link-local addresses (internal services, cloud metadata)
+        are refused, and redirects aren't followed.
+        """
+        error: str | None = None
+        try:
+            response = post_to_public_host(
+                url,
+                data=alert.model_dump_json(by_alias=True),
+                headers={"Content-Type": "application/json"},
+                timeout=self.settings.SAVED_SEARCH_WEBHOOK_TIMEOUT,
+            )
+            if response.is_redirect:
+                error = f"redirect ({response.status_code}) not followed"
+            else:
+                response.raise_for_status()
+        except NonPublicHostError as e:
+            SAVED_SEARCH_DELIVERIES.labels(status="rejected").inc()
+            logger.warning(f"Saved search {alert.saved_search_id} webhook refused: {e}")
+            return False
+        except (requests.RequestException, OSError) as e:
+            error = str(e)
+
+        if error is not None:
+            SAVED_SEARCH_DELIVERIES.labels(status="failed").inc()
+            logger.warning(
+                f"Saved search {alert.saved_search_id} webhook failed: {error}"
+            )
+            return False
+
+        SAVED_SEARCH_DELIVERIES.labels(status="success").inc()
+        return True
+
+    def _get_index(self) -> SavedSearchIndex:
+        """Get the index, rebuilt when saved searches were created or deleted."""
+        version = self.repository.get_version()
+        with self._lock:
+            if self._index is None or version != self._index_version:
+                saved_searches = self.repository.get_all()
+                self._index = SavedSearchIndex(
+                    (
+                        saved_search.id,
+                        PropertyFilters.from_params(
+                            PropertyFilterParams.model_validate(saved_search.filters)
+                        ),
+                    )
+                    for saved_search in saved_searches
+                )
+                self._index_version = version
+                logger.info(f"Indexed {len(saved_searches)} saved searches")
+            return self._index
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Protocol
+
+import polars as pl
+
+from app.config.settings import Settings
+from app.database.session_handler import db_session_handler
+from app.properties.exceptions import SimilarityIndexNotReadyException
+from app.properties.models.property import Property, PropertyType
+from app.properties.repositories import IPropertyRepository
+from app.properties.schemas import PropertyChangeNotification, PropertyResponse
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+# Listings are only compared within the same city and property type
+type PartitionKey = tuple[str, PropertyType | None]
+
+# Feature weights in the distance, after scaling to unit spread. Prices and
+# areas are compared on a log scale (100k vs 120k is as close as 1M vs 1.2M)
+FEATURE_WEIGHTS = {"log_price": 1.0, "log_area": 1.0, "rooms": 0.5}
+
+_FEATURES = list(FEATURE_WEIGHTS)
+
+# Retry-After (seconds) of requests arriving before the index is built
+NOT_READY_RETRY_AFTER = 5
+
+
+@dataclass(frozen=True)
+class _Partition:
+    """Scaled feature vectors of the listings of one city and property type."""
+
+    # id column and one column per feature, centered, scaled and weighted
+    vectors: pl.DataFrame
+    centers: dict[str, float]
+    scales: dict[str, float]
+
+    @classmethod
+    def build(cls, rows: pl.DataFrame) -> _Partition:
+        """Scale raw features (see `_raw_features`) by the partition's median and spread."""
+        centers: dict[str, float] = {}
+        scales: dict[str, float] = {}
+        for feature in _FEATURES:
+            values = rows[feature].drop_nulls()
+            median = values.median() if len(values) else None
+            std = values.std() if len(values) > 1 else None
+            centers[feature] = float(median) if median is not None else 0.0  # type: ignore[arg-type]
+            scales[feature] = float(std) if std else 1.0  # type: ignore[arg-type]
+        return cls(
+            vectors=_scale(rows, centers, scales), centers=centers, scales=scales
+        )
+
+    def scale(self, rows: pl.DataFrame) -> pl.DataFrame:
+        """Scale raw features of rows like the partition's listings."""
+        return _scale(rows, self.centers, self.scales)
+
+    def nearest(self, queries: pl.DataFrame, k: int) -> dict[int, list[int]]:
+        """
+        Get the k nearest listings of each query vector.
+
+        Each query computes its distance to every listing of the partition and
+        selects the k smallest (linear in the partition), only those k are
+        sorted.
+
+        Args:
+            queries: Scaled vectors, `id` is the listing to find neighbours of
+            k: Number of neighbours
+
+        Returns:
+            Neighbour IDs, nearest first, by query ID
+        """
+        neighbours: dict[int, list[int]] = {}
+        for query in queries.iter_rows(named=True):
+            distance = pl.sum_horizontal(
+                (pl.col(feature) - query[feature]) ** 2 for feature in _FEATURES
+            )
+            nearest = (
+                self.vectors.lazy()
+                .filter(pl.col("id") != query["id"])
+                .select("id", distance=distance)
+                .bottom_k(k, by=["distance", "id"])
+                .sort("distance", "id")
+                .collect()
+            )
+            neighbours[query["id"]] = nearest["id"].to_list()
+        return neighbours
+
+
+class ISimilarityService(Protocol):
+    def get_similar_properties(
+        self, property_id: int, limit: int
+    ) -> list[PropertyResponse] | None:
+        """Get the listings most similar to a property."""
+        ...
+
+    def find_similar_ids(
+        self, properties: list[Property], limit: int
+    ) -> dict[int, list[int]]:
+        """Get IDs of the listings most similar to each property."""
+        ...
+
+    def rebuild(self, cities: list[str] | None = None) -> None:
+        """Rebuild the index partitions of cities (all when None)."""
+        ...
+
+    def handle_property_change(self, payload: str | None) -> None:
+        """Schedule a rebuild of the cities a property change notification affects."""
+        ...
+
+    def close(self) -> None:
+        """Cancel a scheduled rebuild."""
+        ...
+
+
+@inject(alias=ISimilarityService, singleton=True)
+class SimilarityService(ISimilarityService):
+    """
+    "Similar listings" by nearest neighbours over price, area and rooms.
+
+    Every API process holds the feature vectors of all listings in memory as
+    Polars frames, one per city and property type, so a query compares only
+    vectors of its partition, vectorized, without scanning the table.
+
+    Partitions are rebuilt per city after data changes: `bulk_save_scraped_properties`
+    notifies the cities it saved, only their partitions are reloaded (in a
+    background thread, at most once per SIMILAR_REBUILD_DELAY) and swapped in.
+    The index is always built in the background, requests arriving before the
+    first build finished get 503.
+    """
+
+    def __init__(self, repository: IPropertyRepository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+        self._partitions: dict[PartitionKey, _Partition] | None = None
+        self._lock = threading.Lock()
+        self._rebuild_timer: threading.Timer | None = None
+        self._rebuilding = False
+        # Cities changed since the scheduled rebuild was planned, None for all
+        self._dirty_cities: set[str] | None = set()
+
+    def get_similar_properties(
+        self, property_id: int, limit: int
+    ) -> list[PropertyResponse] | None:
+        """
+        Get the listings most similar to a property.
+
+        Args:
+            property_id: Property ID
+            limit: Maximum number of listings
+
+        Returns:
+            Similar listings, most similar first, None if the property isn't found
+
+        Raises:
+            SimilarityIndexNotReadyException: If the index isn't built yet
+        """
+        properties = self.repository.get_by_ids([property_id])
+        if not properties:
+            return None
+
+        similar_ids = self.find_similar_ids(properties, limit).get(property_id, [])
+        similar = {prop.id: prop for prop in self.repository.get_by_ids(similar_ids)}
+        # Listings deleted since the index was built are skipped
+        return [
+            PropertyResponse.from_model(similar[similar_id])
+            for similar_id in similar_ids
+            if similar_id in similar
+        ]
+
+    def find_similar_ids(
+        self, properties: list[Property], limit: int
+    ) -> dict[int, list[int]]:
+        """
+        Get IDs of the listings most similar to each property (batch kNN).
+
+        Properties are compared with listings of the same city and property
+        type, including properties saved after the index was built.
+
+        Args:
+            properties: Properties to find similar listings for
+            limit: Maximum number of listings per property
+
+        Returns:
+            Similar IDs, most similar first, by property ID
+
+        Raises:
+            SimilarityIndexNotReadyException: If the index isn't built yet
+        """
+        partitions = self._get_partitions()
+
+        queries_by_partition: dict[PartitionKey, list[Property]] = {}
+        for prop in properties:
+            queries_by_partition.setdefault((prop.city, prop.property_type), []).append(
+                prop
+            )
+
+        similar_ids: dict[int, list[int]] = {prop.id: [] for prop in properties}
+        for key, queries in queries_by_partition.items():
+            partition = partitions.get(key)
+            if partition is None:
+                continue
+            vectors = partition.scale(_raw_features(_feature_rows(queries)))
+            similar_ids.update(partition.nearest(vectors, limit))
+        return similar_ids
+
+    @db_session_handler(read_only=True)
+    def rebuild(self, cities: list[str] | None = None) -> None:
+        """
+        Rebuild the index partitions of cities, in its own session.
+
+        Args:
+            cities: Cities to reload (None for all, also when no index is built yet)
+        """
+        if self._partitions is None:
+            cities = None
+        self._swap(self._load(cities), cities)
+
+    def handle_property_change(self, payload: str | None) -> None:
+        """
+        Schedule a rebuild of the cities a property change notification affects.
+
+        Changes arriving while a rebuild is scheduled are added to it, changes
+        arriving while one runs are rebuilt after it. The first notification
+        (sent when the listener connects) builds the index right away.
+
+        Args:
+            payload: PropertyChangeNotification JSON, or None when notifications
+                may have been missed (everything is rebuilt)
+        """
+        cities: list[str] | None = None
+        if payload is not None:
+            try:
+                cities = PropertyChangeNotification.model_validate_json(payload).cities
+            except ValueError:
+                logger.warning(f"Invalid property change notification: {payload!r}")
+
+        with self._lock:
+            if cities is None or self._dirty_cities is None:
+                self._dirty_cities = None
+            else:
+                self._dirty_cities.update(cities)
+            self._schedule_rebuild()
+
+    def close(self) -> None:
+        """Cancel a scheduled rebuild."""
+        with self._lock:
+            if self._rebuild_timer is not None:
+                self._rebuild_timer.cancel()
+                self._rebuild_timer = None
+
+    def _schedule_rebuild(self) -> None:
+        """Start the rebuild timer if anything changed and no rebuild is pending (hold the lock)."""
+        if self._rebuild_timer is not None or self._rebuilding:
+            return
+        if self._dirty_cities is not None and not self._dirty_cities:
+            return
+        delay = (
+            self.settings.SIMILAR_REBUILD_DELAY if self._partitions is not None else 0
+        )
+        self._rebuild_timer = threading.Timer(delay, self._run_scheduled_rebuild)
+        self._rebuild_timer.daemon = True
+        self._rebuild_timer.start()
+
+    def _run_scheduled_rebuild(self) -> None:
+        with self._lock:
+            # Later changes are rebuilt once this rebuild is done
+            self._rebuild_timer = None
+            self._rebuilding = True
+            dirty_cities, self._dirty_cities = self._dirty_cities, set()
+        try:
+            self.rebuild(sorted(dirty_cities) if dirty_cities is not None else None)
+        except Exception:
+            logger.exception("Failed to rebuild similar listings index")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._schedule_rebuild()
+
+    def _get_partitions(self) -> dict[PartitionKey, _Partition]:
+        """
+        Get the index, the request path never builds it.
+
+        Raises:
+            SimilarityIndexNotReadyException: If no build has finished yet, a
+                build is scheduled unless one is already scheduled or running
+        """
+        partitions = self._partitions
+        if partitions is None:
+            with self._lock:
+                if self._partitions is None:
+                    self._dirty_cities = None
+                    self._schedule_rebuild()
+            raise SimilarityIndexNotReadyException(NOT_READY_RETRY_AFTER)
+        return partitions
+
+    def _load(self, cities: list[str] | None) -> dict[PartitionKey, _Partition]:
+        started_at = time.perf_counter()
+
+        rows = self.repository.get_feature_rows(cities)
+        frame = _raw_features(
+            pl.DataFrame(
+                [
+                    (
+                        id_,
+                        city,
+                        property_type.value if property_type else None,
+                        float(price) if price is not None else None,
+                        float(area) if area is not None else None,
+                        rooms,
+                    )
+                    for id_, city, property_type, price, area, rooms in rows
+                ],
+                schema={
+                    "id": pl.Int64,
+                    "city": pl.String,
+                    "property_type": pl.String,
+                    "price_eur": pl.Float64,
+                    "area_sqm": pl.Float64,
+                    "rooms": pl.Float64,
+                },
+                orient="row",
+            )
+        )
+        partitions = {
+            (
+                city,
+                PropertyType(type_) if type_ is not None else None,
+            ): _Partition.build(group)
+            for (city, type_), group in frame.partition_by(
+                "city", "property_type", as_dict=True
+            ).items()
+        }
+
+        logger.info(
+            f"Loaded {len(rows)} listings into {len(partitions)} similarity partitions "
+            f"in {time.perf_counter() - started_at:.2f}s"
+        )
+        return partitions
+
+    def _swap(
+        self, loaded: dict[PartitionKey, _Partition], cities: list[str] | None
+    ) -> None:
+        """Replace partitions of cities (all when None) with loaded ones."""
+        with self._lock:
+            if cities is None or self._partitions is None:
+                partitions = loaded
+            else:
+                reloaded = set(cities)
+                partitions = {
+                    key: partition
+                    for key, partition in self._partitions.items()
+                    if key[0] not in reloaded
+                }
+                partitions.update(loaded)
+
+            # Readers get either the old or the new index, never a mix
+            self._partitions = partitions
+
+
+def _feature_rows(properties: Iterable[Property]) -> pl.DataFrame:
+    return pl.DataFrame(
+        [
+            (
+                prop.id,
+                float(prop.price_eur) if prop.price_eur is not None else None,
+                float(prop.area_sqm) if prop.area_sqm is not None else None,
+                float(prop.rooms) if prop.rooms is not None else None,
+            )
+            for prop in properties
+        ],
+        schema={
+            "id": pl.Int64,
+            "price_eur": pl.Float64,
+            "area_sqm": pl.Float64,
+            "rooms": pl.Float64,
+        },
+        orient="row",
+    )
+
+
+def _scale(
+    rows: pl.DataFrame, centers: dict[str, float], scales: dict[str, float]
+) -> pl.DataFrame:
+    """Center, scale and weight features, missing values count as the center."""
+    return rows.select(
+        "id",
+        *(
+            (
+                (pl.col(feature).fill_null(centers[feature]) - centers[feature])
+                / scales[feature]
+                * weight
+            ).alias(feature)
+            for feature, weight in FEATURE_WEIGHTS.items()
+        ),
+    )
+
+
+def _raw_features(rows: pl.DataFrame) -> pl.DataFrame:
+    """Compute unscaled features, non-positive prices/areas count as missing."""
+    return rows.with_columns(
+        log_price=pl.when(pl.col("price_eur") > 0).then(pl.col("price_eur").log()),
+        log_area=pl.when(pl.col("area_sqm") > 0).then(pl.col("area_sqm").log()),
+    )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import Protocol
+
+from app.config.settings import Settings
+from app.database.session_handler import db_session_handler
+from app.properties.repositories import IPropertyRepository
+from app.properties.schemas import Suggestion, SuggestionKind
+from app.utils.di import inject
+from app.utils.prefix_index import IndexEntry, PrefixIndex, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Title phrases are runs of up to this many words
+MAX_PHRASE_WORDS = 3
+
+# Words of titles: letters only (no prices, areas, etc.), at least 3 of them
+_TITLE_WORD = re.compile(r"[^\W\d_]{3,}")
+
+
+class ISuggestionService(Protocol):
+    def suggest(self, query: str, limit: int) -> list[Suggestion]:
+        """Get search suggestions for typed text."""
+        ...
+
+    def rebuild(self) -> None:
+        """Rebuild the suggestion index from the database."""
+        ...
+
+    def handle_property_change(self, payload: str | None) -> None:
+        """Schedule an index rebuild after a property change notification."""
+        ...
+
+    def close(self) -> None:
+        """Cancel a scheduled rebuild."""
+        ...
+
+
+@inject(alias=ISuggestionService, singleton=True)
+class SuggestionService(ISuggestionService):
+    """
+    Typeahead suggestions for the search box, from cities, locations and
+    frequent title phrases.
+
+    Suggestions come from a PrefixIndex held in memory by every API process,
+    so answering doesn't touch the database. The index is rebuilt in a
+    background thread after data changes (a scrape notifies a change per
+    city), at most once per SUGGEST_REBUILD_DELAY, and swapped in when done.
+    """
+
+    def __init__(self, repository: IPropertyRepository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+        self._index: PrefixIndex[Suggestion] | None = None
+        self._lock = threading.Lock()
+        self._rebuild_timer: threading.Timer | None = None
+
+    def suggest(self, query: str, limit: int) -> list[Suggestion]:
+        """
+        Get search suggestions for typed text.
+
+        Matches the start of any word of a suggestion, ignoring case and
+        diacritics. Builds the index (in the caller's session) if no build
+        has finished yet.
+
+        Args:
+            query: Typed text
+            limit: Maximum number of suggestions
+
+        Returns:
+            Suggestions, best first
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._build_index()
+                index = self._index
+        return index.search(query, limit)
+
+    @db_session_handler(read_only=True)
+    def rebuild(self) -> None:
+        """Rebuild the suggestion index from the database, in its own session."""
+        self._index = self._build_index()
+
+    def handle_property_change(self, _payload: str | None) -> None:
+        """
+        Schedule an index rebuild after a property change notification.
+
+        Changes arriving while a rebuild is scheduled are picked up by it. The
+        first notification (sent when the listener connects) builds the index
+        right away.
+
+        Args:
+            _payload: PropertyChangeNotification JSON, or None when notifications
+                may have been missed (the whole index is rebuilt either way)
+        """
+        with self._lock:
+            if self._rebuild_timer is not None:
+                return
+            delay = (
+                self.settings.SUGGEST_REBUILD_DELAY if self._index is not None else 0
+            )
+            self._rebuild_timer = threading.Timer(delay, self._run_scheduled_rebuild)
+            self._rebuild_timer.daemon = True
+            self._rebuild_timer.start()
+
+    def close(self) -> None:
+        """Cancel a scheduled rebuild."""
+        with self._lock:
+            if self._rebuild_timer is not None:
+                self._rebuild_timer.cancel()
+                self._rebuild_timer = None
+
+    def _run_scheduled_rebuild(self) -> None:
+        with self._lock:
+            # Later changes schedule another rebuild
+            self._rebuild_timer = None
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception("Failed to rebuild suggestion index")
+
+    def _build_index(self) -> PrefixIndex[Suggestion]:
+        started_at = time.perf_counter()
+
+        cities = self.repository.count_by_value("city")
+        city_keys = {normalize_text(city) for city, _ in cities}
+        # Locations named like a city would only duplicate it
+        locations = [
+            (location, count)
+            for location, count in self.repository.count_by_value("location")
+            if normalize_text(location) not in city_keys
+        ]
+        phrases = _frequent_phrases(
+            self.repository.get_titles(),
+            min_count=self.settings.SUGGEST_MIN_TITLE_COUNT,
+            max_phrases=self.settings.SUGGEST_MAX_TITLE_PHRASES,
+        )
+
+        index = PrefixIndex(
+            IndexEntry(
+                text=text,
+                value=Suggestion(text=text, kind=kind, count=count),
+                weight=count,
+            )
+            for kind, values in (
+                (SuggestionKind.CITY, cities),
+                (SuggestionKind.LOCATION, locations),
+                (SuggestionKind.TITLE, phrases),
+            )
+            for text, count in values
+        )
+
+        logger.info(
+            f"Built suggestion index with {len(index)} entries "
+            f"in {time.perf_counter() - started_at:.2f}s"
+        )
+        return index
+
+
+def _frequent_phrases(
+    titles: Iterable[str], min_count: int, max_phrases: int
+) -> list[tuple[str, int]]:
+    """
+    Get the most common phrases (1 to MAX_PHRASE_WORDS consecutive words) of titles.
+
+    Args:
+        titles: Listing titles
+        min_count: Minimum number of titles a phrase must appear in
+        max_phrases: Maximum number of phrases
+
+    Returns:
+        List of (lowercase phrase, number of titles containing it)
+    """
+    counts: Counter[str] = Counter()
+    for title in titles:
+        words = _TITLE_WORD.findall(title.lower())
+        counts.update(
+            {
+                " ".join(words[start : start + size])
+                for size in range(1, MAX_PHRASE_WORDS + 1)
+                for start in range(len(words) - size + 1)
+            }
+        )
+    return [
+        (phrase, count)
+        for phrase, count in counts.most_common(max_phrases)
+        if count >= min_count
+    ]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from celery.schedules import crontab
+
+from app.celery.celery_app import celery_app
+from app.celery.decorators import beat_schedule
+from app.database.session_handler import db_session_handler
+from app.properties.services.property_archive_service import IPropertyArchiveService
+from app.utils.di import get_from_di_container
+
+logger = logging.getLogger(__name__)
+
+
+@db_session_handler
+def _archive_batch(deleted_before: datetime) -> int:
+    """Archive one batch in its own transaction to keep locks short."""
+    archive_service = get_from_di_container(IPropertyArchiveService)
+    return archive_service.archive_batch(deleted_before)
+
+
+@beat_schedule(
+    name="daily-property-archive",
+    schedule=crontab(hour=4, minute=0),  # Run daily at 4:00 AM UTC, after scrapers
+)
+@celery_app.task()
+def archive_deleted_properties() -> dict[str, Any]:
+    """
+    Move properties deleted more than ARCHIVE_DELETED_AFTER_DAYS ago to cold storage.
+
+    Rows are moved in batches of ARCHIVE_BATCH_SIZE, each batch committed
+    separately, until no eligible rows are left.
+
+    Returns:
+        Dictionary with archived count and status
+    """
+    archived_count = 0
+    try:
+        archive_service = get_from_di_container(IPropertyArchiveService)
+        deleted_before = archive_service.get_archive_cutoff()
+        logger.info(f"Archiving properties deleted before {deleted_before}")
+
+        while True:
+            moved = _archive_batch(deleted_before)
+            archived_count += moved
+            # Rows locked by another run are skipped, so a short batch
+            # doesn't mean nothing is left
+            if not moved:
+                break
+
+        logger.info(f"Archived {archived_count} properties")
+
+        return {
+            "archived_count": archived_count,
+            "status": "success",
+        }
+
+    except Exception as e:
+        logger.exception("Failed to archive deleted properties")
+        return {
+            "archived_count": archived_count,
+            "status": "failed",
+            "error": str(e),
+        }
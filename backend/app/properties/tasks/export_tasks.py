@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery.schedules import crontab
+
+from app.celery.celery_app import celery_app
+from app.celery.decorators import beat_schedule
+from app.properties.services.export_job_service import IExportJobService
+from app.utils.di import get_from_di_container
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task()
+def run_property_export(job_id: str) -> dict[str, Any]:
+    """
+    Write the file of a background export job (POST /properties/exports).
+
+    Rows are streamed from the database in their own session, so no request
+    session is needed.
+
+    Args:
+        job_id: Export job ID
+
+    Returns:
+        Dictionary with job ID, exported count and status
+    """
+    try:
+        export_job_service = get_from_di_container(IExportJobService)
+        job = export_job_service.run_job(job_id)
+        if job is None:
+            return {"job_id": job_id, "status": "skipped"}
+
+        return {
+            "job_id": job_id,
+            "exported_count": job.processed_rows,
+            "status": "success",
+        }
+
+    except Exception as e:
+        logger.exception(f"Export {job_id} failed")
+        return {"job_id": job_id, "status": "failed", "error": str(e)}
+
+
+@beat_schedule(
+    name="hourly-export-cleanup",
+    schedule=crontab(minute=30),  # Run hourly at :30
+)
+@celery_app.task()
+def cleanup_export_files() -> dict[str, Any]:
+    """
+    Delete export files older than EXPORT_JOB_TTL (their jobs have expired too).
+
+    Returns:
+        Dictionary with deleted count and status
+    """
+    try:
+        export_job_service = get_from_di_container(IExportJobService)
+        deleted_count = export_job_service.cleanup_expired_files()
+        return {"deleted_count": deleted_count, "status": "success"}
+
+    except Exception as e:
+        logger.exception("Failed to clean up export files")
+        return {"deleted_count": 0, "status": "failed", "error": str(e)}
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery.schedules import crontab
+
+from app.celery.celery_app import celery_app
+from app.celery.decorators import beat_schedule
+from app.database.session_handler import db_session_handler
+from app.properties.services.saved_search_service import (
+    DELIVERY_RUN_SIZE,
+    AlertClaim,
+    ISavedSearchService,
+)
+from app.utils.di import get_from_di_container
+
+logger = logging.getLogger(__name__)
+
+
+@db_session_handler
+def _claim_batch() -> AlertClaim:
+    """Claim one batch in its own transaction, committed before sending."""
+    saved_search_service = get_from_di_container(ISavedSearchService)
+    return saved_search_service.claim_alerts()
+
+
+@db_session_handler
+def _record_batch(claim: AlertClaim, delivered: list[int], failed: list[int]) -> None:
+    """Record the results of a sent batch in its own transaction."""
+    saved_search_service = get_from_di_container(ISavedSearchService)
+    saved_search_service.record_deliveries(claim, delivered, failed)
+
+
+@beat_schedule(
+    name="saved-search-alerts",
+    schedule=crontab(),  # Run every minute
+)
+@celery_app.task()
+def deliver_saved_search_alerts() -> dict[str, Any]:
+    """
+    POST listings matched by saved searches to their webhooks.
+
+    Queued matches are delivered in batches of DELIVERY_RUN_SIZE until the
+    queue is drained. Each batch is claimed and committed, POSTed without a
+    transaction (no locks or connection held while webhooks respond) and its
+    results recorded in a second transaction. Failed matches are retried by a
+    later run, they don't stop this one.
+
+    Returns:
+        Dictionary with delivered and failed counts and status
+    """
+    delivered_count = 0
+    failed_count = 0
+    try:
+        saved_search_service = get_from_di_container(ISavedSearchService)
+        while True:
+            claim = _claim_batch()
+            if not claim.match_count:
+                break
+
+            delivered, failed = saved_search_service.send_alerts(claim)
+            _record_batch(claim, delivered, failed)
+            delivered_count += len(delivered)
+            failed_count += len(failed)
+            if claim.match_count < DELIVERY_RUN_SIZE:
+                break
+
+        if delivered_count or failed_count:
+            logger.info(
+                f"Delivered {delivered_count} saved search matches, "
+                f"{failed_count} failed"
+            )
+
+        return {
+            "delivered_count": delivered_count,
+            "failed_count": failed_count,
+            "status": "success",
+        }
+
+    except Exception as e:
+        logger.exception("Failed to deliver saved search alerts")
+        return {
+            "delivered_count": delivered_count,
+            "failed_count": failed_count,
+            "status": "failed",
+            "error": str(e),
+        }
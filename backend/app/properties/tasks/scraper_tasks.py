@@ -7,16 +7,58 @@ from celery.schedules import crontab
 
 from app.celery.celery_app import celery_app
 from app.celery.decorators import beat_schedule
+from app.database.session_factory import ISessionFactory
 from app.database.session_handler import db_session_handler
+from app.database.transaction_hooks import on_commit
+from app.properties.metrics import SCRAPE_CITY_DURATION, city_label
 from app.properties.models.property import PropertySource
 from app.properties.services.estitor_scraper import IEstitorScraper
 from app.properties.services.property_service import IPropertyService
 from app.properties.services.realitica_scraper import IRealiticaScraper
 from app.utils.di import get_from_di_container
+from app.utils.shared_cache import ISharedCache
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# CACHE WARMING
+# ============================================================================
+
+
+@celery_app.task()
+@db_session_handler
+def warm_property_cache(cities: list[str]) -> dict[str, Any]:
+    """
+    Precompute cached property responses after a scrape saved new data.
+
+    Args:
+        cities: Cities whose listings changed
+
+    Returns:
+        Dictionary with warmed cities and status
+    """
+    try:
+        property_service = get_from_di_container(IPropertyService)
+        property_service.warm_cache(cities)
+        logger.info(f"Warmed property cache for {', '.join(cities)}")
+        return {"cities": cities, "status": "success"}
+
+    except Exception as e:
+        logger.exception("Failed to warm property cache")
+        return {"cities": cities, "status": "failed", "error": str(e)}
+
+
+def _warm_cache_on_commit(city: str) -> None:
+    """Queue cache warming once the scraped data is committed (and visible)."""
+    # Without the shared cache, warming would only fill this worker's own
+    # cache, which no API process reads
+    if not get_from_di_container(ISharedCache).enabled:
+        return
+    session = get_from_di_container(ISessionFactory)()
+    on_commit(session, lambda: warm_property_cache.delay([city]))
+
+
 # ============================================================================
 # ESTITOR TASKS
 # ============================================================================
@@ -40,7 +82,11 @@ def scrape_estitor_city(city: str, city_slug: str) -> dict[str, Any]:
         property_service = get_from_di_container(IPropertyService)
         logger.info(f"Starting Estitor scraper for {city}")
 
-        listings = scraper.scrape_city(city, city_slug)
+        with SCRAPE_CITY_DURATION.labels(
+            source=PropertySource.ESTITOR.value,
+            city=city_label(city, scraper.get_cities()),
+        ).time():
+            listings = scraper.scrape_city(city, city_slug)
 
         logger.info(f"Successfully scraped {len(listings)} listings from {city}")
 
@@ -51,6 +97,9 @@ def scrape_estitor_city(city: str, city_slug: str) -> dict[str, Any]:
 
         logger.info(f"Saved {saved_count} properties from {city} to database")
 
+        if saved_count:
+            _warm_cache_on_commit(city)
+
         return {
             "scraper": "estitor",
             "city": city,
@@ -133,7 +182,11 @@ def scrape_realitica_city(city: str, city_slug: str) -> dict[str, Any]:
         property_service = get_from_di_container(IPropertyService)
         logger.info(f"Starting Realitica scraper for {city}")
 
-        listings = scraper.scrape_city(city, city_slug)
+        with SCRAPE_CITY_DURATION.labels(
+            source=PropertySource.REALITICA.value,
+            city=city_label(city, scraper.get_cities()),
+        ).time():
+            listings = scraper.scrape_city(city, city_slug)
 
         logger.info(f"Successfully scraped {len(listings)} listings from {city}")
 
@@ -144,6 +197,9 @@ def scrape_realitica_city(city: str, city_slug: str) -> dict[str, Any]:
 
         logger.info(f"Saved {saved_count} properties from {city} to database")
 
+        if saved_count:
+            _warm_cache_on_commit(city)
+
         return {
             "scraper": "realitica",
             "city": city,
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+from app.database.session_factory import SessionFactory
+from app.utils.di import reset_di_singletons
+from app.utils.metrics import MULTIPROC_DIR_ENV, mark_process_dead
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = "app.main:app"
+
+# Seconds of gunicorn's graceful timeout left for the lifespan shutdown after
+# uvicorn stopped waiting for open connections
+LIFESPAN_SHUTDOWN_MARGIN = 2
+
+
+def default_workers() -> int:
+    """
+    Get the number of workers: WEB_CONCURRENCY if set, else 2 * CPUs + 1.
+
+    Routes block a threadpool thread on the database, so a worker per CPU
+    would leave cores idle while queries run.
+    """
+    if web_concurrency := os.environ.get("WEB_CONCURRENCY"):
+        return int(web_concurrency)
+    return 2 * (os.process_cpu_count() or 1) + 1
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Uvicorn worker running the app's lifespan, on uvloop and httptools
+    (installed with uvicorn[standard], "auto" falls back to asyncio and h11
+    where they aren't available, e.g. uvloop on Windows).
+    """
+
+    # Declared without ClassVar by uvicorn, overriding it with one fails mypy
+    CONFIG_KWARGS: dict[str, Any] = {  # noqa: RUF012
+        "loop": "auto",
+        "http": "auto",
+        "lifespan": "on",
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # On SIGTERM stop waiting for open connections in time to shut the
+        # lifespan down before gunicorn kills the worker
+        self.config.timeout_graceful_shutdown = max(
+            self.cfg.graceful_timeout - LIFESPAN_SHUTDOWN_MARGIN, 1
+        )
+
+
+def on_starting(server: Arbiter) -> None:
+    multiproc_dir = os.environ.get(MULTIPROC_DIR_ENV)
+    if not multiproc_dir:
+        if server.cfg.workers > 1:
+            logger.warning(
+                f"{MULTIPROC_DIR_ENV} is not set, /metrics only reports the "
+                "worker answering the scrape"
+            )
+        return
+
+    # Samples of a previous run's processes would be reported forever
+    for path in Path(multiproc_dir).glob("*.db"):
+        path.unlink()
+
+
+def post_fork(_server: Arbiter, worker: Worker) -> None:
+    # With preload_app the master loaded the app, workers must not share the
+    # connections, clients and threads of singletons it created
+    for instance in reset_di_singletons():
+        if isinstance(instance, SessionFactory):
+            # Leaves the parent's connections open for the parent
+            instance.engine.dispose(close=False)
+    logger.info(f"Worker {worker.pid} forked, singletons reset")
+
+
+def child_exit(_server: Arbiter, worker: Worker) -> None:
+    mark_process_dead(worker.pid)
+
+
+class GunicornApplication(BaseApplication):
+    """Gunicorn serving the app with UvicornWorker, configured in code."""
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+        self.cfg.set("worker_class", f"{__name__}.{UvicornWorker.__name__}")
+        self.cfg.set("on_starting", on_starting)
+        self.cfg.set("post_fork", post_fork)
+        self.cfg.set("child_exit", child_exit)
+
+    def load(self) -> Any:
+        from gunicorn.util import import_app
+
+        return import_app(APP_PATH)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
+
+from app.config.settings import Settings
+from app.utils.di import get_from_di_container, inject
+from app.utils.exceptions import ServiceUnavailableException
+from app.utils.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_WAIT,
+    ADMISSION_QUEUED,
+    ADMISSION_REJECTED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RouteClass(str, enum.Enum):
+    """Capacity a route is admitted from, cheap routes have their own."""
+
+    # Lookups of a handful of rows or answered from memory (cities, property by ID)
+    LIGHT = "light"
+    # Searches, aggregations and exports that can scan many rows
+    HEAVY = "heavy"
+
+
+class ConcurrencyLimiter:
+    """
+    Limit the requests running at once, with a bounded FIFO wait queue.
+
+    Runs on the event loop, so waiting requests don't hold a threadpool thread
+    or a database connection. A request is rejected right away when the queue
+    is full, or once it waited `max_wait` seconds.
+    """
+
+    def __init__(
+        self, name: str, max_concurrent: int, max_queued: int, max_wait: float
+    ) -> None:
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.max_wait = max_wait
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot, call `release` when done.
+
+        Raises:
+            ServiceUnavailableException: If the queue is full or the wait timed out
+        """
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            ADMISSION_IN_FLIGHT.labels(route_class=self.name).inc()
+            ADMISSION_QUEUE_WAIT.labels(route_class=self.name).observe(0)
+            return
+        if len(self._waiters) >= self.max_queued:
+            self._reject("queue_full")
+
+        started_at = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        ADMISSION_QUEUED.labels(route_class=self.name).inc()
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await waiter
+        except BaseException as error:  # timeout or client gone (cancelled)
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as the wait ended, pass the slot on
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(error, TimeoutError):
+                self._reject("timeout")
+            raise
+        finally:
+            ADMISSION_QUEUED.labels(route_class=self.name).dec()
+
+        ADMISSION_QUEUE_WAIT.labels(route_class=self.name).observe(
+            time.perf_counter() - started_at
+        )
+
+    def release(self) -> None:
+        """Free a slot, handing it over to the longest waiting request."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot moves to the waiter, the in-flight count stays
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+        ADMISSION_IN_FLIGHT.labels(route_class=self.name).dec()
+
+    def _reject(self, reason: str) -> None:
+        ADMISSION_REJECTED.labels(route_class=self.name, reason=reason).inc()
+        logger.warning(f"Rejected {self.name} request ({reason})")
+        raise ServiceUnavailableException(
+            message="The server is busy. Please try again shortly.",
+            code="server_busy",
+            retry_after=max(1, math.ceil(self.max_wait)),
+        )
+
+
+class AdmissionSlot:
+    """Slot a request was admitted with, released once."""
+
+    def __init__(self, limiter: ConcurrencyLimiter) -> None:
+        self._limiter = limiter
+        self._loop = asyncio.get_running_loop()
+        self._released = False
+        # Released by a streaming response instead of when the endpoint returns
+        self.deferred = False
+
+    def release(self) -> None:
+        """Free the slot, can be called from any thread and more than once."""
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._release()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._limiter.release()
+
+
+# Slot of the request being handled, visible to its (threadpool) endpoint
+_current_slot: ContextVar[AdmissionSlot | None] = ContextVar(
+    "admission_slot", default=None
+)
+
+
+def defer_admission_release() -> Callable[[], None] | None:
+    """
+    Keep the current request's slot after the endpoint returns.
+
+    FastAPI ends route dependencies before sending the response body, so a
+    response streaming from the database would run outside admission control.
+    The response calls the returned function once it's done instead.
+
+    Returns:
+        Function releasing the slot, None if the request wasn't admitted
+        from a limited capacity
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        return None
+    slot.deferred = True
+    return slot.release
+
+
+@inject(singleton=True)
+class AdmissionController:
+    """Concurrency limiters of the API process, one per route class."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.enabled = settings.ADMISSION_ENABLED
+        self.limiters = {
+            RouteClass.LIGHT: ConcurrencyLimiter(
+                RouteClass.LIGHT.value,
+                max_concurrent=settings.ADMISSION_LIGHT_CONCURRENCY,
+                max_queued=settings.ADMISSION_LIGHT_QUEUE,
+                max_wait=settings.ADMISSION_MAX_WAIT,
+            ),
+            RouteClass.HEAVY: ConcurrencyLimiter(
+                RouteClass.HEAVY.value,
+                max_concurrent=settings.ADMISSION_HEAVY_CONCURRENCY,
+                max_queued=settings.ADMISSION_HEAVY_QUEUE,
+                max_wait=settings.ADMISSION_MAX_WAIT,
+            ),
+        }
+
+
+def admission_dependency(
+    route_class: RouteClass,
+) -> Callable[[], AsyncIterator[None]]:
+    """
+    Create a route dependency admitting requests from a route class's capacity.
+
+    The dependency is async, so FastAPI awaits it on the event loop before
+    running a sync endpoint in the threadpool, the slot is released when the
+    endpoint is done (or when its response is, see `defer_admission_release`).
+
+    Args:
+        route_class: Capacity to admit from
+    """
+
+    async def admit() -> AsyncIterator[None]:
+        controller = get_from_di_container(AdmissionController)
+        if not controller.enabled:
+            yield
+            return
+
+        limiter = controller.limiters[route_class]
+        await limiter.acquire()
+        slot = AdmissionSlot(limiter)
+        token = _current_slot.set(slot)
+        try:
+            yield
+        finally:
+            _current_slot.reset(token)
+            if not slot.deferred:
+                slot.release()
+
+    return admit
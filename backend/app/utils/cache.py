@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache metrics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    # Lookups that joined an identical in-flight computation (SingleFlight)
+    coalesced: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class VersionStamp:
+    """Data version token with the time of the change that produced it."""
+
+    token: str
+    updated_at: datetime
+
+
+@dataclass
+class _CacheEntry[V]:
+    value: V
+    size: int
+    expires_at: float
+    tags: frozenset[str]
+
+
+class LRUCache[V]:
+    """
+    Thread-safe in-process LRU cache with TTL and entry/byte limits.
+
+    Entries are evicted least-recently-used first whenever either limit is
+    exceeded. Sizes are provided by the caller since only the caller knows how
+    to measure its values cheaply.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        """
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of entries in bytes
+            ttl: Time to live of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: OrderedDict[str, _CacheEntry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> V | None:
+        """Get value by key, returns None on miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: V,
+        size: int,
+        ttl: float | None = None,
+        tags: frozenset[str] = frozenset(),
+    ) -> None:
+        """
+        Store value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate size of the value in bytes
+            ttl: Time to live in seconds (defaults to the cache TTL)
+            tags: Tags used for selective invalidation
+        """
+        if size > self.max_bytes:
+            logger.debug(f"Value for {key} too large to cache ({size} bytes)")
+            return
+
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                value=value, size=size, expires_at=expires_at, tags=tags
+            )
+            self._stats.size_bytes += size
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._stats.size_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._stats.evictions += 1
+
+    def invalidate(self, predicate: Callable[[str, frozenset[str]], bool]) -> int:
+        """
+        Remove all entries matching a predicate.
+
+        Args:
+            predicate: Called with (key, tags), entries returning True are removed
+
+        Returns:
+            Count of removed entries
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if predicate(key, entry.tags)
+            ]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._stats.size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of cache metrics."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                size_bytes=self._stats.size_bytes,
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._stats.size_bytes -= entry.size
+
+
+@dataclass
+class _Call[V]:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: V | None = None
+    error: BaseException | None = None
+
+
+class SingleFlight[V]:
+    """
+    Coalesce concurrent calls with the same key into a single execution.
+
+    The first caller runs the function, callers arriving while it runs wait for
+    it and share its result (or exception). Results aren't kept, once the call
+    finishes the next caller runs the function again, so this complements a
+    cache rather than replacing it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call[V]] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that shared another call's execution."""
+        return self._coalesced
+
+    def do(self, key: str, func: Callable[[], V]) -> V:
+        """
+        Run `func`, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identifies identical calls
+            func: Computes the value
+
+        Returns:
+            Value computed by this call or the in-flight one
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value  # type: ignore[return-value]
+
+        try:
+            call.value = func()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+@inject(singleton=True)
+class DataVersion:
+    """
+    Process-wide version of the property data.
+
+    Bumped whenever committed writes change what readers can see, so cache keys
+    built from it stop matching stale entries.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version = 0
+        self._updated_at = datetime.now(timezone.utc)
+
+    @property
+    def current(self) -> int:
+        return self._version
+
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
+
+    def bump(self) -> int:
+        """Increment the version, returns the new version."""
+        with self._lock:
+            self._version += 1
+            self._updated_at = datetime.now(timezone.utc)
+            logger.debug(f"Data version bumped to {self._version}")
+            return self._version
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import zlib
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:  # optional, gzip is always available
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
+# Content types worth compressing (prefix match), everything else passes through
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+# Flush compressed output after this many uncompressed bytes, so streamed
+# bodies reach the client incrementally without flushing every tiny chunk
+# (e.g. one CSV line), which would ruin the compression ratio
+FLUSH_THRESHOLD = 16 * 1024
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, returns whatever output is ready."""
+        ...
+
+    def flush(self) -> bytes:
+        """Flush pending output, so the client can decode everything sent so far."""
+        ...
+
+    def finish(self) -> bytes:
+        """End the stream."""
+        ...
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int):
+        # wbits=31 writes the gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ZstdCompressor(Compressor):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def negotiate_encoding(accept_encoding: str, available: list[str]) -> str | None:
+    """
+    Pick the content coding to use from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        available: Supported codings in order of preference
+
+    Returns:
+        Coding with the highest q-value (ties broken by our preference), or
+        None if the client accepts none of them
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = [
+        (accepted.get(coding, wildcard), -index, coding)
+        for index, coding in enumerate(available)
+    ]
+    quality, _, coding = max(candidates, default=(0.0, 0, ""))
+    return coding if quality > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd or gzip, negotiated from Accept-Encoding.
+
+    Unlike buffering middleware, body chunks are compressed as they arrive and
+    flushed every FLUSH_THRESHOLD bytes, so streaming responses (CSV exports,
+    NDJSON) keep streaming.
+    Single-chunk bodies below `minimum_size` aren't worth the CPU and are sent
+    as is. Responses that are already encoded, aren't text-like or serve byte
+    ranges pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self.available = (["zstd"] if ZSTD_AVAILABLE else []) + ["gzip"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.available
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def create_compressor(self, encoding: str) -> Compressor:
+        if encoding == "zstd":
+            return ZstdCompressor(self.zstd_level)
+        return GzipCompressor(self.gzip_level)
+
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+        self._unflushed = 0
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Headers can still change until we've seen the first body chunk
+            self._start_message = message
+            self._passthrough = not self._is_compressible(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._start_message is not None:
+            start_message, self._start_message = self._start_message, None
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not self._passthrough:
+                headers = MutableHeaders(raw=list(start_message["headers"]))
+                headers.add_vary_header("Accept-Encoding")
+                if more_body or len(body) >= self.middleware.minimum_size:
+                    self._compressor = self.middleware.create_compressor(self.encoding)
+                    headers["Content-Encoding"] = self.encoding
+                    del headers["Content-Length"]
+                start_message["headers"] = headers.raw
+            await self._send(start_message)
+
+        if self._compressor is None:
+            await self._send(message)
+            return
+
+        chunk = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        body = self._compressor.compress(chunk)
+        self._unflushed += len(chunk)
+        if not more_body:
+            body += self._compressor.finish()
+        elif self._unflushed >= FLUSH_THRESHOLD:
+            body += self._compressor.flush()
+            self._unflushed = 0
+
+        # Nothing ready yet, wait for more input instead of sending empty chunks
+        if body or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+    def _is_compressible(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        if message["status"] in (204, 206, 304) or message["status"] < 200:
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        # Compressing would break byte ranges advertised by FileResponse
+        if "accept-ranges" in headers:
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_CONTENT_TYPES)
@@ -22,6 +22,22 @@ def remove_from_di_container(key: type[Any]) -> None:
     del di._services[key]  # noqa: SLF001
 
 
+def reset_di_singletons() -> list[Any]:
+    """
+    Forget the singletons created so far, the next lookups create new ones.
+
+    Needed in processes forked after the app was loaded, which must not share
+    their parent's connections, clients and threads. Registered values (e.g.
+    Settings) are kept.
+
+    Returns:
+        The forgotten instances
+    """
+    instances = list(di._memoized_services.values())  # noqa: SLF001
+    di._memoized_services.clear()  # noqa: SLF001
+    return instances
+
+
 class LazyInjector[T]:
     def __init__(self, service_ref: type[T]):
         self._service_ref = service_ref
@@ -32,10 +32,26 @@ class ConflictException(AppBaseException):
     pass
 
 
+class UnprocessableException(AppBaseException):
+    pass
+
+
+class TooManyRequestsException(AppBaseException):
+    def __init__(self, message: str, code: str, retry_after: int | None = None) -> None:
+        super().__init__(message, code)
+        self.retry_after = retry_after
+
+
 class ServerException(AppBaseException):
     pass
 
 
+class ServiceUnavailableException(AppBaseException):
+    def __init__(self, message: str, code: str, retry_after: int | None = None) -> None:
+        super().__init__(message, code)
+        self.retry_after = retry_after
+
+
 class HTTPExceptionWithCode(HTTPException):
     # override the default HTTPException to include a custom error code
     def __init__(
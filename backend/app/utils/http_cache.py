@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(version: str, *parts: str) -> str:
+    """
+    Build a weak ETag from a data version and the normalized request.
+
+    Weak, because equal ETags promise equal data, not byte-identical bodies
+    (e.g. compression may differ).
+
+    Args:
+        version: Data version token
+        parts: Route and normalized query identifying the representation
+
+    Returns:
+        ETag header value
+    """
+    digest = hashlib.sha256("\x00".join(parts).encode()).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+def format_http_date(value: datetime) -> str:
+    """Format datetime for Last-Modified headers (RFC 9110 IMF-fixdate)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _strip_weak(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Check conditional request headers against the current representation.
+
+    If-None-Match takes precedence over If-Modified-Since and is compared
+    weakly, as required for GET.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+        last_modified: Current modification time (optional)
+
+    Returns:
+        True if the client's copy is still fresh (respond with 304)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        client_etags = {_strip_weak(tag.strip()) for tag in if_none_match.split(",")}
+        return _strip_weak(etag) in client_etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    """
+    Build a 304 response repeating the validators and caching headers.
+
+    Args:
+        headers: ETag, Last-Modified and Cache-Control headers of the 200 response
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import bisect
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Interval[V]:
+    """Closed interval [low, high] with its value, use ±inf for an open end."""
+
+    low: float
+    high: float
+    value: V
+
+
+@dataclass
+class _Node[V]:
+    center: float
+    # Intervals containing the center, by ascending low and by descending high
+    lows: list[float]
+    by_low: list[V]
+    negated_highs: list[float]
+    by_high: list[V]
+    left: _Node[V] | None
+    right: _Node[V] | None
+
+
+class IntervalTree[V]:
+    """
+    Immutable centered interval tree answering stabbing queries.
+
+    Each node keeps the intervals containing its center, sorted by both ends,
+    intervals entirely left or right of it go to the subtrees. A query walks a
+    single root-to-leaf path and only reads the intervals that contain the
+    point, so it takes O(log n + matches) instead of checking every interval.
+    """
+
+    def __init__(self, intervals: Iterable[Interval[V]]):
+        # Empty intervals (low > high) contain no point
+        valid = [interval for interval in intervals if interval.low <= interval.high]
+        self._size = len(valid)
+        self._root = self._build(valid)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stab(self, point: float) -> list[V]:
+        """
+        Get values of the intervals containing a point (bounds included).
+
+        Args:
+            point: Point to look up
+
+        Returns:
+            Values of the matching intervals, in no particular order
+        """
+        values: list[V] = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                # Every interval here ends at or after the center, > point
+                values.extend(node.by_low[: bisect.bisect_right(node.lows, point)])
+                node = node.left
+            elif point > node.center:
+                count = bisect.bisect_right(node.negated_highs, -point)
+                values.extend(node.by_high[:count])
+                node = node.right
+            else:
+                values.extend(node.by_low)
+                break
+        return values
+
+    def _build(self, intervals: list[Interval[V]]) -> _Node[V] | None:
+        if not intervals:
+            return None
+
+        # Median endpoint (ignoring open ends) splits the rest roughly in half,
+        # its interval contains it, so every level takes at least one
+        endpoints = [
+            bound
+            for interval in intervals
+            for bound in (interval.low, interval.high)
+            if abs(bound) != float("inf")
+        ]
+        center = statistics.median_low(endpoints) if endpoints else 0.0
+
+        left = [interval for interval in intervals if interval.high < center]
+        right = [interval for interval in intervals if interval.low > center]
+        here = [
+            interval
+            for interval in intervals
+            if interval.low <= center <= interval.high
+        ]
+
+        by_low = sorted(here, key=lambda interval: interval.low)
+        by_high = sorted(here, key=lambda interval: -interval.high)
+        return _Node(
+            center=center,
+            lows=[interval.low for interval in by_low],
+            by_low=[interval.value for interval in by_low],
+            negated_highs=[-interval.high for interval in by_high],
+            by_high=[interval.value for interval in by_high],
+            left=self._build(left),
+            right=self._build(right),
+        )
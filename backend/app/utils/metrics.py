@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Set (to an empty directory) when several processes serve metrics together,
+# e.g. gunicorn workers or a prefork Celery pool
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Labels are limited to known values, anything else is reported as "other".
+# Paths that didn't match a route aren't labeled by path (scanners would create
+# a series per URL)
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+OTHER_LABEL = "other"
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time until the response was fully sent, by route template",
+    ["method", "route", "status"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of repository queries",
+    ["query"],
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Duration of Celery tasks, by task name and final state",
+    ["task", "state"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+
+# Admission control (see app.utils.admission), gauges are summed over the
+# live processes in multiprocess mode
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds",
+    "Time admitted requests waited for a slot of their route class",
+    ["route_class"],
+    buckets=(0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_requests",
+    "Requests rejected with 503, because the queue was full or the wait timed out",
+    ["route_class", "reason"],
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight_requests",
+    "Admitted requests currently running",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUED = Gauge(
+    "admission_queued_requests",
+    "Requests currently waiting for a slot",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+
+
+def is_multiprocess() -> bool:
+    """Check whether metrics are collected across processes (PROMETHEUS_MULTIPROC_DIR)."""
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Get the registry to expose.
+
+    In multiprocess mode samples of all processes are read from
+    PROMETHEUS_MULTIPROC_DIR, otherwise this process's registry is used.
+    """
+    if not is_multiprocess():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return registry
+
+
+def metrics_endpoint(_request: Request) -> Response:
+    """Expose metrics in the Prometheus text format."""
+    return Response(
+        content=generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST
+    )
+
+
+def start_metrics_server(port: int) -> None:
+    """
+    Expose metrics on a separate HTTP server (for processes without an API).
+
+    Args:
+        port: Port to listen on
+    """
+    start_http_server(port, registry=metrics_registry())
+    logger.info(f"Serving metrics on port {port}")
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop live gauges of an exited process (multiprocess mode only)."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
+
+
+class MetricsMiddleware:
+    """
+    Record request latency by method, route template and status code.
+
+    Latency is measured until the last body chunk is sent, so streamed
+    responses (exports, NDJSON) count their full duration.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started_at = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                method=_method_label(scope["method"]),
+                route=_route_label(scope),
+                status=str(status),
+            ).observe(time.perf_counter() - started_at)
+
+
+def _method_label(method: str) -> str:
+    return method if method in HTTP_METHODS else OTHER_LABEL
+
+
+def _route_label(scope: Scope) -> str:
+    # The router stores the matched route in the (shared) scope
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
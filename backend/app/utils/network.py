@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import ipaddress
+import socket
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Hostnames that always resolve to this machine
+LOCAL_HOSTNAMES = frozenset({"localhost", "localhost.localdomain"})
+
+
+class NonPublicHostError(ValueError):
+    """Host is (or resolves to) a loopback, private, link-local or reserved address."""
+
+    def __init__(self, host: str, address: str | None = None) -> None:
+        super().__init__(
+            f"{host} resolves to non-public {address}"
+            if address is not None
+            else f"{host} is not a public host"
+        )
+        self.host = host
+        self.address = address
+
+
+def is_public_address(address: str) -> bool:
+    """
+    Check whether an IP address is routable on the public internet.
+
+    Loopback, private (RFC 1918, unique local), link-local (e.g. cloud metadata
+    at 169.254.169.254), shared, reserved and multicast addresses aren't.
+
+    Args:
+        address: IPv4 or IPv6 address
+
+    Returns:
+        True if the address is public
+    """
+    ip = ipaddress.ip_address(address.split("%", 1)[0])  # drop IPv6 zone ID
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def check_host_literal(host: str) -> None:
+    """
+    Reject hosts that are local by their name alone, without resolving them.
+
+    Args:
+        host: Hostname or IP address (IPv6 with or without brackets)
+
+    Raises:
+        NonPublicHostError: If the host is a local name or a non-public IP
+    """
+    host = host.strip("[]").rstrip(".").lower()
+    if host in LOCAL_HOSTNAMES or host.endswith(".localhost"):
+        raise NonPublicHostError(host)
+    try:
+        public = is_public_address(host)
+    except ValueError:
+        return  # a hostname, checked when it's resolved
+    if not public:
+        raise NonPublicHostError(host)
+
+
+def resolve_public_address(host: str, port: int) -> str:
+    """
+    Resolve a host and check that every address it resolves to is public.
+
+    Connect to the returned address (see `post_to_public_host`), resolving the
+    host again could get a different, internal answer (DNS rebinding).
+
+    Args:
+        host: Hostname or IP address
+        port: Port to connect to
+
+    Returns:
+        First address the host resolves to
+
+    Raises:
+        NonPublicHostError: If the host is local or resolves to a non-public address
+        OSError: If the host can't be resolved
+    """
+    check_host_literal(host)
+    addresses = [
+        str(sockaddr[0])
+        for *_, sockaddr in socket.getaddrinfo(
+            host.strip("[]"), port, type=socket.SOCK_STREAM
+        )
+    ]
+    for address in addresses:
+        if not is_public_address(address):
+            raise NonPublicHostError(host, address)
+    return addresses[0]
+
+
+class PinnedAddressAdapter(HTTPAdapter):
+    """
+    Transport adapter for requests sent to an IP address instead of a hostname.
+
+    TLS connections send the hostname as server name (SNI) and verify the
+    certificate against it, like a request to the hostname would.
+    """
+
+    def __init__(self, hostname: str) -> None:
+        self.hostname = hostname
+        super().__init__()
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        super().init_poolmanager(
+            connections,
+            maxsize,
+            block,
+            server_hostname=self.hostname,
+            assert_hostname=self.hostname,
+            **pool_kwargs,
+        )
+
+
+def post_to_public_host(url: str, **kwargs: Any) -> requests.Response:
+    """
+    POST to a URL whose host must be public, e.g. one set by an API caller.
+
+    The host is resolved once and checked, then the request connects to the
+    checked address with the original Host header, so the host can't resolve
+    to an internal address by the time it's connected to. Proxies from the
+    environment aren't used and redirects aren't followed.
+
+    Args:
+        url: HTTP(S) URL
+        **kwargs: Arguments of `requests.post` (allow_redirects is ignored)
+
+    Returns:
+        Response
+
+    Raises:
+        NonPublicHostError: If the host is local or resolves to a non-public address
+        OSError: If the host can't be resolved
+        requests.RequestException: If the request fails
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    address = resolve_public_address(
+        host, parts.port or (443 if parts.scheme == "https" else 80)
+    )
+
+    userinfo, _, host_header = parts.netloc.rpartition("@")
+    netloc = f"[{address}]" if ":" in address else address
+    if parts.port is not None:
+        netloc = f"{netloc}:{parts.port}"
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+
+    headers = {**(kwargs.pop("headers", None) or {}), "Host": host_header}
+    kwargs["allow_redirects"] = False
+    with requests.Session() as session:
+        session.trust_env = False
+        session.mount(f"{parts.scheme}://", PinnedAddressAdapter(host))
+        return session.post(
+            urlunsplit(parts._replace(netloc=netloc)), headers=headers, **kwargs
+        )
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Letters that don't decompose into a base letter and a combining mark
+_TRANSLITERATIONS = str.maketrans({"đ": "dj", "Đ": "dj", "ß": "ss", "ø": "o"})
+
+_WORD_START = re.compile(r"(?<!\w)\w")
+
+# Prefixes this short match a large part of the index, their results are
+# computed once per index (up to a number of distinct queries)
+_MEMOIZED_PREFIX_LENGTH = 2
+_MAX_MEMOIZED = 4096
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for prefix matching: case-folded, without diacritics.
+
+    E.g. "Kuća, Đenovići" -> "kuca, djenovici", so typing without diacritics
+    (or in any case) still matches.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.translate(_TRANSLITERATIONS))
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+@dataclass(frozen=True)
+class IndexEntry[V]:
+    """Indexed text with its value and weight (higher ranks first)."""
+
+    text: str
+    value: V
+    weight: float
+
+
+class PrefixIndex[V]:
+    """
+    Immutable in-memory index matching the start of any word of a text.
+
+    Every word start of a normalized text is stored as a key in one sorted
+    list, a query is a binary search for its first key followed by a scan
+    while keys start with the query. Matches at the start of a text rank
+    before matches at a later word, then by weight.
+    """
+
+    def __init__(self, entries: Iterable[IndexEntry[V]]):
+        self._entries = list(entries)
+        keys = sorted(
+            (normalized[match.start() :], entry_id, match.start() == 0)
+            for entry_id, normalized in enumerate(
+                normalize_text(entry.text) for entry in self._entries
+            )
+            for match in _WORD_START.finditer(normalized)
+        )
+        self._keys = [key for key, _, _ in keys]
+        self._key_entries = [(entry_id, at_start) for _, entry_id, at_start in keys]
+        self._memoized: dict[tuple[str, int], list[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, prefix: str, limit: int) -> list[V]:
+        """
+        Get values of the best entries with a word starting with prefix.
+
+        Args:
+            prefix: Typed text, normalized like indexed texts
+            limit: Maximum number of values
+
+        Returns:
+            Values, best first
+        """
+        query = normalize_text(prefix).strip()
+        if not query:
+            return []
+
+        memoize = len(query) <= _MEMOIZED_PREFIX_LENGTH
+        if memoize and (query, limit) in self._memoized:
+            return self._memoized[(query, limit)]
+
+        # Best (at start, weight) per matching entry
+        matches: dict[int, bool] = {}
+        position = bisect.bisect_left(self._keys, query)
+        while position < len(self._keys) and self._keys[position].startswith(query):
+            entry_id, at_start = self._key_entries[position]
+            matches[entry_id] = matches.get(entry_id, False) or at_start
+            position += 1
+
+        best = heapq.nsmallest(
+            limit,
+            matches.items(),
+            key=lambda match: (
+                not match[1],
+                -self._entries[match[0]].weight,
+                self._entries[match[0]].text,
+            ),
+        )
+        values = [self._entries[entry_id].value for entry_id, _ in best]
+
+        if memoize and len(self._memoized) < _MAX_MEMOIZED:
+            self._memoized[(query, limit)] = values
+        return values
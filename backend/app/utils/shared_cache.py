@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, Protocol
+
+import redis
+
+from app.celery.serializers import dumps, loads
+from app.config.settings import Settings
+from app.utils.cache import VersionStamp
+from app.utils.di import inject
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cache:properties"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+VERSION_UPDATED_AT_KEY = f"{KEY_PREFIX}:version_updated_at"
+# Random value set once per Redis dataset: the counter restarts from 0 after
+# Redis is flushed or restarted, the epoch keeps old versions from matching
+VERSION_EPOCH_KEY = f"{KEY_PREFIX}:version_epoch"
+
+# How often requests waiting for another worker's result poll Redis (seconds)
+LOCK_POLL_INTERVAL = 0.05
+
+# After a Redis error, skip the cache for this long instead of timing out on
+# every request (seconds)
+ERROR_BACKOFF = 30.0
+
+# Delete the lock only if we still own it (it may have expired and been retaken)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class ISharedCache(Protocol):
+    @property
+    def enabled(self) -> bool:
+        """Whether values are shared between processes (CACHE_REDIS_URL is set)."""
+        ...
+
+    def get_or_compute[V](
+        self,
+        route: str,
+        key: str,
+        compute: Callable[[], V],
+        ttl: int,
+        encode: Callable[[V], Any],
+        decode: Callable[[Any], V],
+    ) -> V:
+        """Get value shared between processes or compute and store it."""
+        ...
+
+    def bump_version(self) -> None:
+        """Make all values cached for the current data version unreachable."""
+        ...
+
+    def get_version(self) -> VersionStamp | None:
+        """Get the shared data version, None if the cache is unavailable."""
+        ...
+
+
+@inject(alias=ISharedCache, singleton=True)
+class RedisCache(ISharedCache):
+    """
+    Response cache shared by all API workers and Celery workers.
+
+    Keys are built from route, request key and a data version stored in Redis,
+    which writers bump on commit. A per-key lock (SET NX PX) lets a single
+    process compute a missing value while the others wait for it, so a popular
+    page expiring doesn't send every worker to the database at once.
+
+    The cache is best-effort: when CACHE_REDIS_URL isn't set or Redis is
+    unavailable, values are computed directly.
+    """
+
+    def __init__(self, settings: Settings):
+        self.lock_timeout = settings.CACHE_LOCK_TIMEOUT
+        self._client = (
+            redis.Redis.from_url(
+                settings.CACHE_REDIS_URL,
+                socket_timeout=settings.CACHE_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.CACHE_SOCKET_TIMEOUT,
+                decode_responses=True,
+            )
+            if settings.CACHE_REDIS_URL
+            else None
+        )
+        self._release_lock = (
+            self._client.register_script(_RELEASE_LOCK_SCRIPT)
+            if self._client is not None
+            else None
+        )
+        self._unavailable_until = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are shared between processes (CACHE_REDIS_URL is set)."""
+        return self._client is not None
+
+    def get_or_compute[V](
+        self,
+        route: str,
+        key: str,
+        compute: Callable[[], V],
+        ttl: int,
+        encode: Callable[[V], Any],
+        decode: Callable[[Any], V],
+    ) -> V:
+        """
+        Get value shared between processes or compute and store it.
+
+        Args:
+            route: Route the value belongs to (part of the key)
+            key: Normalized request key (e.g. PropertyFilters.cache_key())
+            compute: Computes the value on a miss
+            ttl: Time to live in seconds
+            encode: Converts the value to JSON-serializable data
+            decode: Restores the value from data produced by encode
+
+        Returns:
+            Cached or computed value
+        """
+        if self._client is None or time.monotonic() < self._unavailable_until:
+            return compute()
+
+        try:
+            cache_key = self._build_key(route, key)
+            cached = self._client.get(cache_key)
+            if cached is not None:
+                return decode(loads(cached))
+
+            lock_key = f"{cache_key}:lock"
+            token = uuid.uuid4().hex
+            if not self._client.set(
+                lock_key, token, nx=True, px=self.lock_timeout * 1000
+            ):
+                cached = self._wait_for(cache_key)
+                if cached is not None:
+                    return decode(loads(cached))
+                # Holder is too slow or died, compute without the lock
+                return compute()
+        except redis.RedisError:
+            self._mark_unavailable()
+            return compute()
+
+        try:
+            value = compute()
+            self._store(cache_key, dumps(encode(value)), ttl)
+            return value
+        finally:
+            self._release(lock_key, token)
+
+    def bump_version(self) -> None:
+        """Make all values cached for the current data version unreachable."""
+        if self._client is None:
+            return
+
+        try:
+            pipeline = self._client.pipeline()
+            pipeline.incr(VERSION_KEY)
+            pipeline.set(VERSION_UPDATED_AT_KEY, datetime.now(timezone.utc).isoformat())
+            pipeline.execute()
+        except redis.RedisError:
+            # Entries for the old version live until their TTL expires
+            logger.exception("Failed to bump shared cache version")
+
+    def get_version(self) -> VersionStamp | None:
+        """
+        Get the shared data version.
+
+        The version is the same in every process, so it can back validators
+        (e.g. ETags) that must not depend on which worker serves a request.
+
+        Returns:
+            VersionStamp, or None if the cache is disabled or unavailable
+        """
+        if self._client is None or time.monotonic() < self._unavailable_until:
+            return None
+
+        try:
+            version, updated_at, epoch = self._client.mget(
+                VERSION_KEY, VERSION_UPDATED_AT_KEY, VERSION_EPOCH_KEY
+            )
+            if epoch is None:
+                epoch = uuid.uuid4().hex[:8]
+                if not self._client.set(VERSION_EPOCH_KEY, epoch, nx=True):
+                    epoch = self._client.get(VERSION_EPOCH_KEY)
+            if updated_at is None:
+                # Nothing was written since Redis was (re)started, data may be
+                # older but we can't know, so start counting from now
+                updated_at = datetime.now(timezone.utc).isoformat()
+                if not self._client.set(VERSION_UPDATED_AT_KEY, updated_at, nx=True):
+                    updated_at = self._client.get(VERSION_UPDATED_AT_KEY)
+        except redis.RedisError:
+            self._mark_unavailable()
+            return None
+
+        return VersionStamp(
+            token=f"s{epoch}.{int(version or 0)}",
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+    def _build_key(self, route: str, key: str) -> str:
+        assert self._client is not None
+        version = int(self._client.get(VERSION_KEY) or 0)
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return f"{KEY_PREFIX}:v{version}:{route}:{digest}"
+
+    def _wait_for(self, cache_key: str) -> str | None:
+        assert self._client is not None
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            cached: str | None = self._client.get(cache_key)
+            if cached is not None:
+                return cached
+        return None
+
+    def _store(self, cache_key: str, data: str, ttl: int) -> None:
+        assert self._client is not None
+        try:
+            self._client.set(cache_key, data, ex=ttl)
+        except redis.RedisError:
+            self._mark_unavailable()
+
+    def _release(self, lock_key: str, token: str) -> None:
+        assert self._release_lock is not None
+        try:
+            self._release_lock(keys=[lock_key], args=[token])
+        except redis.RedisError:
+            # The lock expires on its own
+            logger.debug(f"Failed to release {lock_key}")
+
+    def _mark_unavailable(self) -> None:
+        logger.warning(
+            f"Shared cache unavailable, bypassing it for {ERROR_BACKOFF:.0f}s",
+            exc_info=True,
+        )
+        self._unavailable_until = time.monotonic() + ERROR_BACKOFF
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import weakref
+from collections.abc import Generator, Mapping
+from typing import IO
+
+import anyio
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.utils.admission import defer_admission_release
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def iter_file(file: IO[bytes], chunk_size: int = FILE_CHUNK_SIZE) -> Generator[bytes]:
+    """Read a binary file in chunks, closing it when done."""
+    with file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse for blocking generators holding resources (e.g. a DB cursor).
+
+    Starlette only stops iterating when the client disconnects, the generator
+    is left suspended until garbage collection. This closes it as soon as the
+    response ends, so its `finally`/`with` blocks release the resources right
+    away, also when the client goes away mid-stream.
+
+    With `hold_admission`, the request's admission slot (see
+    app.utils.admission) is held until the response ends, so streams doing
+    the expensive work (e.g. reading a whole-table cursor) stay limited.
+    """
+
+    def __init__(
+        self,
+        content: Generator[bytes],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        hold_admission: bool = False,
+    ) -> None:
+        super().__init__(
+            iterate_in_threadpool(content),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
+        self._generator = content
+        self._release_admission = defer_admission_release() if hold_admission else None
+        if self._release_admission is not None:
+            # Also released if the response is discarded without being sent
+            weakref.finalize(self, self._release_admission)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Shielded, cleanup must run even though the response was cancelled
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()  # type: ignore[attr-defined]
+                await run_in_threadpool(self._generator.close)
+                if self._release_admission is not None:
+                    self._release_admission()
@@ -0,0 +1,235 @@
+"""
+Benchmark BRIN vs B-tree indexes for time-window filters.
+
+Builds a temporary, insertion-ordered copy of the `created_at` workload, then
+compares index size, range-scan latency and heap blocks read of a B-tree and a
+BRIN index.
+
+With `--column updated_at`, daily re-scrapes are simulated first: every
+listing still online gets its `updated_at` rewritten (like `bulk_upsert`
+does), so the column no longer follows the physical row order. Queries are
+then `updatedAfter` filters (`updated_at >= now - window`).
+
+Usage:
+    python -m benchmarks.brin_vs_btree --rows 1000000 --window-hours 24
+    python -m benchmarks.brin_vs_btree --rows 200000 --column updated_at
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+from argparse import ArgumentParser
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from dotenv import load_dotenv
+from sqlalchemy import Connection, create_engine, text
+
+from app.config.settings import DBSettings
+from app.database.session_factory import construct_db_url
+
+TABLE = "bench_properties"
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+ROW_INTERVAL_SECONDS = 30  # one listing every 30s ~ 1M rows per year
+SCRAPE_INTERVAL = timedelta(days=1)
+
+
+def _create_table(connection: Connection, rows: int, listing_days: float) -> None:
+    connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    connection.execute(
+        text(
+            f"CREATE TEMP TABLE {TABLE} ("
+            "id bigserial PRIMARY KEY, created_at timestamptz NOT NULL, "
+            "updated_at timestamptz NOT NULL, offline_at timestamptz NOT NULL, "
+            "title text NOT NULL)"
+        )
+    )
+    # rows arrive roughly in time order (small jitter), like scraped listings,
+    # and stay online for 0 to 2 * listing_days
+    connection.execute(
+        text(
+            f"INSERT INTO {TABLE} (created_at, updated_at, offline_at, title) "
+            "SELECT t, t, t + make_interval(secs => random() * :lifetime), "
+            "repeat('x', 80) FROM ("
+            "  SELECT :start + make_interval(secs => i * :step + random() * :step) AS t"
+            "  FROM generate_series(1, :rows) AS i"
+            ") AS listings"
+        ),
+        {
+            "start": START,
+            "step": ROW_INTERVAL_SECONDS,
+            "rows": rows,
+            "lifetime": 2 * listing_days * 86400,
+        },
+    )
+    connection.execute(text(f"ANALYZE {TABLE}"))
+
+
+def _simulate_rescrapes(connection: Connection, rows: int) -> datetime:
+    """
+    Rewrite updated_at of online listings once per scrape, vacuuming in between
+    like autovacuum would, so updated rows move to wherever there's free space.
+
+    Returns:
+        Time of the last scrape
+    """
+    end = START + timedelta(seconds=rows * ROW_INTERVAL_SECONDS)
+    scraped_at = START + SCRAPE_INTERVAL
+    while scraped_at <= end:
+        # a scrape run takes a while, rows are seen in no particular order
+        connection.execute(
+            text(
+                f"UPDATE {TABLE} SET updated_at = "
+                ":scraped_at + make_interval(secs => random() * 3600) "
+                "WHERE created_at <= :scraped_at AND offline_at > :scraped_at"
+            ),
+            {"scraped_at": scraped_at},
+        )
+        connection.execute(text(f"VACUUM {TABLE}"))
+        scraped_at += SCRAPE_INTERVAL
+    connection.execute(text(f"ANALYZE {TABLE}"))
+    return scraped_at - SCRAPE_INTERVAL
+
+
+def _index_size(connection: Connection, index_name: str) -> int:
+    return int(
+        connection.execute(
+            text("SELECT pg_relation_size(CAST(:name AS regclass))"),
+            {"name": index_name},
+        ).scalar_one()
+    )
+
+
+def _table_pages(connection: Connection) -> int:
+    return int(
+        connection.execute(
+            text(
+                f"SELECT pg_relation_size('{TABLE}') / current_setting('block_size')::int"
+            )
+        ).scalar_one()
+    )
+
+
+def _heap_blocks(plan: dict[str, Any]) -> int:
+    """Sum the heap blocks visited by the bitmap heap scans of a plan."""
+    blocks = int(plan.get("Exact Heap Blocks", 0)) + int(
+        plan.get("Lossy Heap Blocks", 0)
+    )
+    return blocks + sum(_heap_blocks(child) for child in plan.get("Plans", []))
+
+
+def _measure(
+    connection: Connection, query: str, params: list[dict[str, Any]]
+) -> tuple[list[float], list[int]]:
+    """
+    Run EXPLAIN ANALYZE of a query once per parameter set.
+
+    Returns:
+        Execution time (ms) and heap blocks visited of each run
+    """
+    timings: list[float] = []
+    blocks: list[int] = []
+    for values in params:
+        result: Any = connection.execute(
+            text(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}"), values
+        ).scalar_one()
+        timings.append(float(result[0]["Execution Time"]))
+        blocks.append(_heap_blocks(result[0]["Plan"]))
+    return timings, blocks
+
+
+def _report(
+    name: str, size: int, timings: list[float], blocks: list[int], pages: int
+) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+    print(  # noqa: T201
+        f"{name:<8} size={size / 1024:>10.1f} KiB  "
+        f"median={statistics.median(timings):>8.3f} ms  p95={p95:>8.3f} ms  "
+        f"heap blocks={statistics.median(blocks):>8.0f} of {pages}"
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--window-hours", type=float, default=24)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--pages-per-range", type=int, default=32)
+    parser.add_argument(
+        "--column", choices=["created_at", "updated_at"], default="created_at"
+    )
+    parser.add_argument(
+        "--listing-days",
+        type=float,
+        default=45,
+        help="Average days a listing stays online (re-scraped daily meanwhile)",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    settings = DBSettings()
+    engine = create_engine(
+        construct_db_url(
+            username=settings.POSTGRES_USER,
+            password=settings.POSTGRES_PASSWORD,
+            host=settings.POSTGRES_HOST,
+            database=settings.POSTGRES_DB,
+            port=settings.POSTGRES_PORT,
+        )
+    )
+    window = timedelta(hours=args.window_hours)
+    column = args.column
+
+    # Autocommit, VACUUM can't run in a transaction (the temp table is dropped
+    # when the connection closes)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        _create_table(connection, args.rows, args.listing_days)
+        if column == "updated_at":
+            last_scrape = _simulate_rescrapes(connection, args.rows)
+            query = f"SELECT id FROM {TABLE} WHERE updated_at >= :start"
+            params = [
+                {"start": last_scrape - window * random.random()}
+                for _ in range(args.runs)
+            ]
+        else:
+            span = timedelta(seconds=args.rows * ROW_INTERVAL_SECONDS) - window
+            query = (
+                f"SELECT id FROM {TABLE} "
+                "WHERE created_at >= :start AND created_at < :end"
+            )
+            starts = [START + span * random.random() for _ in range(args.runs)]
+            params = [{"start": start, "end": start + window} for start in starts]
+        pages = _table_pages(connection)
+        # B-tree can use index scans too, bitmap scans keep the comparison fair
+        connection.execute(text("SET enable_indexscan = off"))
+        connection.execute(text("SET enable_seqscan = off"))
+
+        connection.execute(
+            text(f"CREATE INDEX bench_btree ON {TABLE} USING btree ({column})")
+        )
+        _report(
+            "btree",
+            _index_size(connection, "bench_btree"),
+            *_measure(connection, query, params),
+            pages,
+        )
+        connection.execute(text("DROP INDEX bench_btree"))
+
+        connection.execute(
+            text(
+                f"CREATE INDEX bench_brin ON {TABLE} USING brin ({column}) "
+                f"WITH (pages_per_range = {int(args.pages_per_range)})"
+            )
+        )
+        _report(
+            "brin",
+            _index_size(connection, "bench_brin"),
+            *_measure(connection, query, params),
+            pages,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark response compression: bandwidth saved vs CPU spent.
+
+Compresses a JSON list page and a CSV export (built in memory, no database
+needed) with every codec/level, the same way CompressionMiddleware does:
+chunk by chunk with a flush every FLUSH_THRESHOLD bytes. Reports ratio,
+compression time and the total time to deliver the body over a link of the
+given bandwidth.
+
+Usage:
+    python -m benchmarks.compression --rows 500 --export-rows 20000 --mbps 20
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from argparse import ArgumentParser
+from collections.abc import Callable
+from functools import partial
+
+from app.properties.schemas import PropertyListResponse
+from app.properties.services.csv_export_service import CSVExportService
+from app.utils.compression import (
+    FLUSH_THRESHOLD,
+    ZSTD_AVAILABLE,
+    Compressor,
+    GzipCompressor,
+    ZstdCompressor,
+)
+from benchmarks.serialization import build_properties
+
+CHUNK_SIZE = 4096
+
+
+def _codecs() -> list[tuple[str, Callable[[], Compressor]]]:
+    codecs: list[tuple[str, Callable[[], Compressor]]] = [
+        (f"gzip-{level}", partial(GzipCompressor, level)) for level in (1, 6, 9)
+    ]
+    if ZSTD_AVAILABLE:
+        codecs += [
+            (f"zstd-{level}", partial(ZstdCompressor, level)) for level in (1, 3, 9)
+        ]
+    return codecs
+
+
+def _compress_streaming(create: Callable[[], Compressor], body: bytes) -> int:
+    compressor = create()
+    size = 0
+    unflushed = 0
+    for offset in range(0, len(body), CHUNK_SIZE):
+        chunk = body[offset : offset + CHUNK_SIZE]
+        size += len(compressor.compress(chunk))
+        unflushed += len(chunk)
+        if unflushed >= FLUSH_THRESHOLD:
+            size += len(compressor.flush())
+            unflushed = 0
+    return size + len(compressor.finish())
+
+
+def _report(name: str, body: bytes, mbps: float, runs: int) -> None:
+    bytes_per_ms = mbps * 1_000_000 / 8 / 1000
+    print(  # noqa: T201
+        f"\n{name}: {len(body) / 1024:.1f} KiB, "
+        f"identity transfer {len(body) / bytes_per_ms:.1f} ms at {mbps:g} Mbit/s"
+    )
+    for codec, create in _codecs():
+        timings: list[float] = []
+        size = 0
+        for _ in range(runs):
+            start = time.perf_counter()
+            size = _compress_streaming(create, body)
+            timings.append((time.perf_counter() - start) * 1000)
+        cpu = statistics.median(timings)
+        print(  # noqa: T201
+            f"  {codec:<8} ratio={len(body) / size:>6.1f}x  "
+            f"size={size / 1024:>8.1f} KiB  cpu={cpu:>7.2f} ms  "
+            f"cpu+transfer={cpu + size / bytes_per_ms:>8.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--export-rows", type=int, default=20_000)
+    parser.add_argument("--mbps", type=float, default=20)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    properties = build_properties(args.rows)
+    page = PropertyListResponse.from_properties(
+        properties=properties, total=len(properties), page=1, size=len(properties)
+    ).to_json_bytes()
+    export = (
+        CSVExportService()
+        .export_properties_to_csv(build_properties(args.export_rows))
+        .getvalue()
+    )
+
+    _report(f"JSON list page ({args.rows} rows)", page, args.mbps, args.runs)
+    _report(f"CSV export ({args.export_rows} rows)", export, args.mbps, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark serialization of property list pages.
+
+Compares the previous path (validated PropertyResponse models, encoded by
+FastAPI's `jsonable_encoder` and `json.dumps`) with the fast path
+(`PropertyListResponse.from_properties` + `to_json_bytes`). No database is
+needed, rows are built in memory.
+
+Usage:
+    python -m benchmarks.serialization --rows 500 --runs 200
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from argparse import ArgumentParser
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from app.properties.models.property import Property, PropertySource, PropertyType
+from app.properties.schemas import PropertyListResponse, PropertyResponse
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def build_properties(rows: int) -> list[Property]:
+    return [
+        Property(
+            id=i,
+            source=PropertySource.ESTITOR if i % 2 else PropertySource.REALITICA,
+            link=f"https://www.estitor.com/me/nekretnine/stan-budva-{i}",
+            image_url=f"https://cdn.estitor.com/images/{i}.jpg",
+            city="Budva",
+            location="Rozino, Budva, Crna Gora",
+            title=f"Dvosoban stan sa pogledom na more {i}",
+            property_type=PropertyType.STAN,
+            price_raw=f"{150_000 + i} €",
+            price_eur=Decimal(150_000 + i),
+            area_raw=f"{50 + i % 70} m2",
+            area_sqm=Decimal(50 + i % 70),
+            rooms_raw="2",
+            rooms=2,
+            price_display=f"€{150_000 + i:,}".replace(",", "."),
+            area_display=f"{50 + i % 70} m2",
+            created_at=START + timedelta(minutes=i),
+            updated_at=START + timedelta(minutes=i),
+        )
+        for i in range(rows)
+    ]
+
+
+def _previous_path(properties: list[Property]) -> bytes:
+    items = [
+        PropertyResponse.model_validate(PropertyResponse.from_model(prop).__dict__)
+        for prop in properties
+    ]
+    response = PropertyListResponse(
+        items=items, total=len(items), page=1, size=len(items), pages=1
+    )
+    # What FastAPI does for endpoints without response_model (JSONResponse.render)
+    return json.dumps(
+        jsonable_encoder(response),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _fast_path(properties: list[Property]) -> bytes:
+    return PropertyListResponse.from_properties(
+        properties=properties, total=len(properties), page=1, size=len(properties)
+    ).to_json_bytes()
+
+
+def _measure(
+    func: Callable[[list[Property]], bytes], properties: list[Property], runs: int
+) -> list[float]:
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(properties)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(name: str, timings: list[float], body: bytes) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+    print(  # noqa: T201
+        f"{name:<10} median={statistics.median(timings):>8.3f} ms  "
+        f"p95={p95:>8.3f} ms  body={len(body) / 1024:>8.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    properties = build_properties(args.rows)
+
+    previous_body = _previous_path(properties)
+    fast_body = _fast_path(properties)
+    if json.loads(previous_body) != json.loads(fast_body):
+        print("Fast path produced a different document")  # noqa: T201
+        raise SystemExit(1)
+
+    print(f"Serializing {args.rows} rows, {args.runs} runs")  # noqa: T201
+    _report("previous", _measure(_previous_path, properties, args.runs), previous_body)
+    _report("fast", _measure(_fast_path, properties, args.runs), fast_body)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,9 @@
 
 set -eou pipefail
 
-exec gunicorn \
-    --timeout 300 \
-    --worker-class=uvicorn.workers.UvicornWorker \
-    --access-logfile '-' \
-    --bind=0.0.0.0:8000 \
-    --reuse-port \
-    app.main:app
+# gunicorn runs several workers, their metrics are collected through this
+# directory (must be set before Python starts, cleared by the server on start)
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-metrics}"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+exec python manage.py serve
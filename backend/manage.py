@@ -88,6 +88,107 @@ class RunServer(BaseCommand):
         uvicorn.run("app.main:app", reload=True, port=port, host=host)
 
 
+class Serve(BaseCommand):
+    name = "serve"
+    description = "run production server (gunicorn with uvicorn workers)"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "-p", "--port", dest="port", type=int, default=8000, help="listening port"
+        )
+        parser.add_argument(
+            "-H",
+            "--host",
+            dest="host",
+            type=str,
+            default="0.0.0.0",
+            help="host address",
+        )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            dest="workers",
+            type=int,
+            default=None,
+            help="worker processes (default: WEB_CONCURRENCY, else 2 * CPUs + 1)",
+        )
+        parser.add_argument(
+            "--preload",
+            action="store_true",
+            help="load the app before forking workers (faster start, shared memory),"
+            " the app must not start threads at import, e.g. Polars' thread pool",
+        )
+        parser.add_argument(
+            "--max-requests",
+            dest="max_requests",
+            type=int,
+            default=10_000,
+            help="restart a worker after this many requests (0 to disable)",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            dest="max_requests_jitter",
+            type=int,
+            default=None,
+            help="random extra requests per worker, so they don't restart "
+            "together (default: 10%% of --max-requests)",
+        )
+        parser.add_argument(
+            "--timeout",
+            dest="timeout",
+            type=int,
+            default=300,
+            help="seconds a worker may stay unresponsive before it is restarted",
+        )
+        parser.add_argument(
+            "--graceful-timeout",
+            dest="graceful_timeout",
+            type=int,
+            default=30,
+            help="seconds workers get to finish requests on shutdown and restarts",
+        )
+        parser.add_argument(
+            "--keep-alive",
+            dest="keepalive",
+            type=int,
+            default=5,
+            help="seconds to keep idle client connections open",
+        )
+
+    def handle(
+        self,
+        port: int,
+        host: str,
+        workers: int | None,
+        preload: bool,
+        max_requests: int,
+        max_requests_jitter: int | None,
+        timeout: int,
+        graceful_timeout: int,
+        keepalive: int,
+    ) -> None:
+        from app.server import GunicornApplication, default_workers
+
+        GunicornApplication(
+            {
+                "bind": f"{host}:{port}",
+                "workers": workers or default_workers(),
+                "preload_app": preload,
+                "max_requests": max_requests,
+                "max_requests_jitter": (
+                    max_requests_jitter
+                    if max_requests_jitter is not None
+                    else max_requests // 10
+                ),
+                "timeout": timeout,
+                "graceful_timeout": graceful_timeout,
+                "keepalive": keepalive,
+                "reuse_port": True,
+                "accesslog": "-",
+            }
+        ).run()
+
+
 class Typecheck(BaseCommand):
     name = "typecheck"
     description = "typecheck project"
@@ -208,6 +309,55 @@ class Scrape(BaseCommand):
         logger.info(f"Scraping result: {result}")
 
 
+class RestoreProperties(BaseCommand):
+    name = "restoreproperties"
+    description = "restore archived properties by ID or link"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--id",
+            dest="ids",
+            type=int,
+            action="append",
+            default=[],
+            help="property ID to restore (can be repeated)",
+        )
+        parser.add_argument(
+            "--link",
+            dest="links",
+            type=str,
+            action="append",
+            default=[],
+            help="property link to restore (can be repeated)",
+        )
+        parser.add_argument(
+            "--undelete",
+            action="store_true",
+            help="also clear deleted_at so restored properties are listed again",
+        )
+
+    def handle(self, ids: list[int], links: list[str], undelete: bool = False) -> None:
+        if not ids and not links:
+            logger.error("Provide at least one --id or --link")
+            sys.exit(1)
+
+        configure_settings()
+
+        from app.database.session_handler import db_session_handler
+        from app.properties.services.property_archive_service import (
+            IPropertyArchiveService,
+        )
+        from app.utils.di import get_from_di_container
+
+        @db_session_handler
+        def restore() -> int:
+            archive_service = get_from_di_container(IPropertyArchiveService)
+            return archive_service.restore_properties(ids, links, undelete=undelete)
+
+        restored = restore()
+        logger.info(f"Restored {restored} properties")
+
+
 def configure_settings() -> None:
     # Configure logging
     basicConfig(level=INFO)
@@ -228,6 +378,7 @@ def main(args: list[str]) -> None:
     CommandRunner(
         commands=[
             RunServer,
+            Serve,
             Typecheck,
             MakeMigrations,
             Migrate,
@@ -235,6 +386,7 @@ def main(args: list[str]) -> None:
             CeleryWorker,
             CeleryFlower,
             Scrape,
+            RestoreProperties,
         ],
         description="Project management commands",
     ).execute(args)
@@ -245,6 +397,11 @@ def poetry_start() -> None:
     main(["runserver", *sys.argv[1:]])
 
 
+def poetry_serve() -> None:
+    """Launched with `poetry run serve` at root level"""
+    main(["serve", *sys.argv[1:]])
+
+
 def poetry_test() -> None:
     """Launched with `poetry run test` at root level"""
     main(["test", *sys.argv[1:]])